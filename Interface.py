@@ -29,7 +29,13 @@ else:
     raise OSError(f"Unsupported OS: {system_name}")
 
 lib_path = os.path.abspath(os.path.join(SRC_DIR, lib_name))
-REQUIRED_SYMBOLS = ["find_best_move_from_fen", "set_hash_size"]
+REQUIRED_SYMBOLS = ["find_best_move_from_fen", "set_hash_size", "set_thread_count", "set_parallel_mode",
+                    "set_game_history", "get_last_search_info", "set_multi_pv", "get_search_line",
+                    "start_search", "stop_search", "is_searching", "wait_search", "ponderhit",
+                    "find_best_move_nodes", "get_last_search_nodes", "get_last_search_time",
+                    "get_search_stats", "get_search_stats_size", "see_fen",
+                    "get_mate_score", "get_mate_bound", "get_history_score", "get_history_max",
+                    "search_window_fen", "get_move_order_fen", "get_max_depth"]
 
 # -------------------------
 # Check if the library exists, if not compile it
@@ -40,14 +46,15 @@ def compile_engine():
     c_files = [
         "Engine.c", "Board.c", "MoveGen.c", "Evaluate.c",
         "Minimax.c", "Move.c", "Rules.c", "Zobrist.c",
-        "TT.c", "Ordering.c", "KillerMoves.c", "ParallelSearch.c"
+        "TT.c", "Ordering.c", "KillerMoves.c", "ParallelSearch.c",
+        "ThreadPool.c", "SplitPoint.c", "See.c", "RootMoves.c"
     ]
     c_files = [os.path.join(SRC_DIR, f) for f in c_files]
 
     if system_name == "Windows":
         cmd = ["gcc", "-O3", "-shared", "-o", lib_path] + c_files + ["-Wno-stringop-overflow"]
     else:
-        cmd = ["gcc", "-O3", "-shared", "-fPIC", "-o", lib_path] + c_files + ["-Wno-stringop-overflow"]
+        cmd = ["gcc", "-O3", "-shared", "-fPIC", "-o", lib_path] + c_files + ["-Wno-stringop-overflow", "-lm"]
 
     result = subprocess.run(cmd)
     if result.returncode != 0:
@@ -100,6 +107,75 @@ def set_hash_size(mb: int):
     """
     lib.set_hash_size(int(mb))
 
+# set_thread_count
+lib.set_thread_count.argtypes = [ctypes.c_int]
+lib.set_thread_count.restype = None
+
+def set_thread_count(num_threads: int):
+    """
+    Size the C engine's persistent search thread pool.
+    
+    Workers are created once and parked between searches, so this should be
+    called when the thread count changes rather than before every search.
+    
+    Args:
+        num_threads: Desired number of search threads (clamped in engine)
+    """
+    lib.set_thread_count(int(num_threads))
+
+# set_parallel_mode
+lib.set_parallel_mode.argtypes = [ctypes.c_int]
+lib.set_parallel_mode.restype = None
+
+PARALLEL_MODES = {"lazysmp": 0, "ybw": 1}
+
+def set_parallel_mode(mode: str):
+    """
+    Select the algorithm used by the parallel search functions.
+    
+    Args:
+        mode: "LazySMP" (threads search independently and share the TT) or
+              "YBW" (Young Brothers Wait split points with work stealing)
+    """
+    key = mode.lower()
+    if key not in PARALLEL_MODES:
+        raise ValueError(f"Unknown parallel mode: {mode}")
+    lib.set_parallel_mode(PARALLEL_MODES[key])
+
+# set_game_history
+lib.set_game_history.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+lib.set_game_history.restype = None
+
+def set_game_history(start_fen: str, moves: list):
+    """
+    Pass the game's move history to the C engine for repetition detection.
+    
+    Searches from the position reached by these moves treat any repeated
+    position as a draw. Searches from other positions ignore the history.
+    
+    Args:
+        start_fen: FEN of the position the game started from
+        moves: Moves played since then, in UCI notation
+    """
+    lib.set_game_history(start_fen.encode(), " ".join(moves).encode())
+
+# set_multi_pv
+lib.set_multi_pv.argtypes = [ctypes.c_int]
+lib.set_multi_pv.restype = None
+
+def set_multi_pv(lines: int):
+    """
+    Set how many principal variations every search reports (MultiPV).
+    
+    The best `lines` root moves are each searched for their own line; the
+    lines share the transposition table, so each extra line costs far less
+    than a separate search. Read them with get_search_lines_from_c().
+    
+    Args:
+        lines: Number of lines, 1 for a normal search (clamped in engine)
+    """
+    lib.set_multi_pv(int(lines))
+
 # get_eval_from_c
 lib.evaluate_fen.argtypes = [ctypes.c_char_p]
 lib.evaluate_fen.restype = ctypes.c_float
@@ -107,6 +183,31 @@ lib.evaluate_fen.restype = ctypes.c_float
 def get_eval_from_c(fen: str) -> float:
     return lib.evaluate_fen(fen.encode())
 
+# get_see_from_c
+lib.see_fen.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+lib.see_fen.restype = ctypes.c_float
+
+def get_see_from_c(fen: str, move: str) -> float:
+    """
+    Static exchange evaluation of the capture `move` (UCI) for the side to move.
+    Returns the material won in pawns once every recapture on the square is played out.
+    """
+    return lib.see_fen(fen.encode(), move.encode())
+
+# search_window_from_c
+lib.search_window_fen.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_float, ctypes.c_float, ctypes.c_int,
+                                  ctypes.c_int]
+lib.search_window_fen.restype = ctypes.c_float
+
+def search_window_from_c(fen: str, depth: int, alpha: float, beta: float, pv_node: bool = True,
+                         cut_node: bool = False) -> float:
+    """
+    Search one node with the white-relative window (alpha, beta) without iterative
+    deepening: a PV node, else a cut node or an all node. Returns the white-relative
+    score; the statistics are available from get_search_stats_from_c() as after any search.
+    """
+    return lib.search_window_fen(fen.encode(), depth, alpha, beta, int(pv_node), int(cut_node))
+
 # get_search_info_from_c
 lib.get_search_info.argtypes = [ctypes.c_char_p, ctypes.c_int]
 lib.get_search_info.restype = ctypes.c_char_p
@@ -114,11 +215,154 @@ lib.get_search_info.restype = ctypes.c_char_p
 def get_search_info_from_c(fen: str, depth: int = 4) -> str:
     """
     Get detailed search information including depth, evaluation, and principal variation.
-    Returns string in format: "depth score pv_move"
+    Returns string in format: "depth score pv_move1 pv_move2 ..."
     """
     info = lib.get_search_info(fen.encode(), depth)
     return info.decode()
 
+# get_last_search_info_from_c
+lib.get_last_search_info.argtypes = []
+lib.get_last_search_info.restype = ctypes.c_char_p
+
+# Mate scores, read from Minimax.h: MATE_SCORE - n is a mate n plies from the root,
+# anything beyond MATE_BOUND is a mate
+lib.get_mate_score.argtypes = []
+lib.get_mate_score.restype = ctypes.c_float
+lib.get_mate_bound.argtypes = []
+lib.get_mate_bound.restype = ctypes.c_float
+
+MATE_SCORE = lib.get_mate_score()
+MATE_BOUND = lib.get_mate_bound()
+
+# get_history_from_c: quiet-move history saturates at +-HISTORY_MAX
+lib.get_history_score.argtypes = [ctypes.c_char_p]
+lib.get_history_score.restype = ctypes.c_int
+lib.get_history_max.argtypes = []
+lib.get_history_max.restype = ctypes.c_int
+
+HISTORY_MAX = lib.get_history_max()
+
+def get_history_from_c(move: str) -> int:
+    """
+    History score of the quiet move `move` (UCI, from-to) in the main thread's table.
+    Positive after cutoffs, negative after the move was tried and failed.
+    """
+    return lib.get_history_score(move.encode())
+
+# get_move_order_from_c
+lib.get_move_order_fen.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+lib.get_move_order_fen.restype = ctypes.c_char_p
+
+def get_move_order_from_c(fen: str, killer: str = None) -> list:
+    """
+    Legal moves of `fen` in the order the search would try them at its first ply.
+    `killer`, if given, is treated as a killer move with saturated history.
+    """
+    order = lib.get_move_order_fen(fen.encode(), killer.encode() if killer else None)
+    return order.decode().split()
+
+def get_last_search_info_from_c() -> tuple:
+    """
+    Get the result of the most recent search, whichever function ran it.
+    
+    Returns:
+        Tuple of (depth_completed, score, pv): the score is white-relative in
+        pawns and pv is the principal variation as a list of UCI moves
+    """
+    parts = lib.get_last_search_info().decode().split()
+    pv = [move for move in parts[2:] if move != "none"]
+    return (int(parts[0]), float(parts[1]), pv)
+
+# get_search_lines_from_c
+lib.get_search_line.argtypes = [ctypes.c_int]
+lib.get_search_line.restype = ctypes.c_char_p
+
+def get_search_lines_from_c() -> list:
+    """
+    Get every principal variation of the most recent search (see set_multi_pv).
+    
+    Returns:
+        List of (depth_completed, score, pv) tuples, best line first, in the
+        format of get_last_search_info_from_c()
+    """
+    lines = []
+    while True:
+        parts = lib.get_search_line(len(lines)).decode().split()
+        if not parts:
+            return lines
+        lines.append((int(parts[0]), float(parts[1]), parts[2:]))
+
+# start_search_from_c / stop_search_from_c / ponderhit_from_c / is_searching_from_c / wait_search_from_c
+lib.start_search.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_float, ctypes.c_ulonglong, ctypes.c_int]
+lib.start_search.restype = None
+lib.stop_search.argtypes = []
+lib.stop_search.restype = None
+lib.ponderhit.argtypes = [ctypes.c_float]
+lib.ponderhit.restype = None
+lib.is_searching.argtypes = []
+lib.is_searching.restype = ctypes.c_int
+lib.wait_search.argtypes = []
+lib.wait_search.restype = ctypes.c_char_p
+
+def start_search_from_c(fen: str, depth: int = 0, max_time_ms: float = 0.0, num_threads: int = 1,
+                        max_nodes: int = 0):
+    """
+    Start a search on a background thread and return immediately.
+    
+    The search runs until its depth, time or node limit is reached or until
+    stop_search_from_c() is called; with no limit it runs until stopped.
+    Any search still running is stopped first.
+    
+    Args:
+        fen: Position in FEN format
+        depth: Maximum depth, 0 for no depth limit
+        max_time_ms: Maximum time in milliseconds, 0 for no time limit
+        num_threads: Number of threads to use
+        max_nodes: Maximum nodes over all threads, 0 for no node limit
+    """
+    lib.start_search(fen.encode(), int(depth), float(max_time_ms), int(max_nodes), int(num_threads))
+
+def stop_search_from_c():
+    """
+    Ask the running search to stop. Every search thread checks the shared abort
+    flag at each node, so it finishes within milliseconds; collect the result
+    with wait_search_from_c(). Safe to call from any thread.
+    """
+    lib.stop_search()
+
+def ponderhit_from_c(max_time_ms: float):
+    """
+    Turn the running ponder search into a normal timed search.
+    
+    A ponder search is started with start_search_from_c() on the position after
+    the expected opponent move, without a time limit. When that move is played,
+    this gives it max_time_ms from now; it continues its current iteration with
+    the transposition table and root move order it has built so far.
+    
+    Args:
+        max_time_ms: Time left for the search, in milliseconds
+    """
+    lib.ponderhit(float(max_time_ms))
+
+def is_searching_from_c() -> bool:
+    """
+    Poll whether the search started by start_search_from_c() is still running.
+    """
+    return bool(lib.is_searching())
+
+def wait_search_from_c() -> str:
+    """
+    Wait for the background search to finish (stopped or not).
+    
+    The GIL is released while waiting, so other Python threads keep running.
+    The lines of the search are then available from get_search_lines_from_c().
+    
+    Returns:
+        Best move of the last completed iteration in UCI format, "0000" if
+        there are no legal moves
+    """
+    return lib.wait_search().decode()
+
 # find_best_move_timed_from_c
 lib.find_best_move_timed.argtypes = [ctypes.c_char_p, ctypes.c_float]
 lib.find_best_move_timed.restype = ctypes.c_char_p
@@ -142,6 +386,122 @@ def find_best_move_timed_from_c(fen: str, max_time_ms: float) -> tuple:
         return (parts[0], int(parts[1]), float(parts[2]))
     return (parts[0], 0, 0.0)
 
+# find_best_move_nodes_from_c
+lib.find_best_move_nodes.argtypes = [ctypes.c_char_p, ctypes.c_ulonglong, ctypes.c_int]
+lib.find_best_move_nodes.restype = ctypes.c_char_p
+
+def find_best_move_nodes_from_c(fen: str, max_nodes: int, num_threads: int = 1) -> tuple:
+    """
+    Find best move with a node limit instead of a clock.
+    
+    Single-threaded the limit is exact, so the same engine state gives the same
+    result on any hardware: use it for reproducible tests and benchmarks.
+    
+    Args:
+        fen: Position in FEN format
+        max_nodes: Nodes to search, over all threads
+        num_threads: Number of threads to use
+        
+    Returns:
+        Tuple of (move_uci, depth_reached, nodes_searched)
+    """
+    parts = lib.find_best_move_nodes(fen.encode(), int(max_nodes), int(num_threads)).decode().split()
+    return (parts[0], int(parts[1]), int(parts[2]))
+
+# get_last_search_nodes_from_c
+lib.get_last_search_nodes.argtypes = []
+lib.get_last_search_nodes.restype = ctypes.c_ulonglong
+lib.get_last_search_time.argtypes = []
+lib.get_last_search_time.restype = ctypes.c_double
+
+def get_last_search_nodes_from_c() -> tuple:
+    """
+    Get the size and speed of the most recent search.
+    
+    Returns:
+        Tuple of (nodes, time_ms, nps): nodes over all threads, the search's
+        duration in milliseconds and the nodes per second
+    """
+    nodes = lib.get_last_search_nodes()
+    time_ms = lib.get_last_search_time()
+    nps = int(nodes * 1000 / time_ms) if time_ms > 0 else 0
+    return (nodes, time_ms, nps)
+
+# get_search_stats_from_c
+# Mirrors of SearchCounters (ThreadPool.h) and SearchStats (ParallelSearch.h); the
+# per-iteration arrays are MAX_DEPTH long (ThreadPool.h)
+lib.get_max_depth.argtypes = []
+lib.get_max_depth.restype = ctypes.c_int
+
+MAX_DEPTH = lib.get_max_depth()
+
+class SearchCounters(ctypes.Structure):
+    _fields_ = [
+        ("qnodes", ctypes.c_uint64),
+        ("tt_probes", ctypes.c_uint64),
+        ("tt_hits", ctypes.c_uint64),
+        ("tt_cutoffs", ctypes.c_uint64),
+        ("qs_tt_cutoffs", ctypes.c_uint64),
+        ("null_move_tries", ctypes.c_uint64),
+        ("null_move_cutoffs", ctypes.c_uint64),
+        ("probcut_tries", ctypes.c_uint64),
+        ("probcut_cutoffs", ctypes.c_uint64),
+        ("lmr_reductions", ctypes.c_uint64),
+        ("lmr_researches", ctypes.c_uint64),
+        ("iir_reductions", ctypes.c_uint64),
+        ("futility_prunes", ctypes.c_uint64),
+        ("lmp_prunes", ctypes.c_uint64),
+        ("beta_cutoffs", ctypes.c_uint64),
+        ("first_move_cutoffs", ctypes.c_uint64),
+        ("deferred_moves", ctypes.c_uint64),
+        ("root_researches", ctypes.c_uint64),
+        ("aspiration_researches", ctypes.c_uint64),
+    ]
+
+class SearchStats(ctypes.Structure):
+    """
+    Statistics of one search, all threads together.
+    
+    The counters (qnodes, tt_hits, null_move_cutoffs, ...) are fields of this
+    structure too. Per-iteration arrays are indexed by depth, 1..iterations.
+    """
+    _anonymous_ = ("counters",)
+    _fields_ = [
+        ("counters", SearchCounters),
+        ("nodes", ctypes.c_uint64),
+        ("first_move_cutoff_rate", ctypes.c_double),
+        ("time_ms", ctypes.c_double),
+        ("threads", ctypes.c_int),
+        ("iterations", ctypes.c_int),
+        ("iteration_nodes", ctypes.c_uint64 * MAX_DEPTH),
+        ("iteration_time_ms", ctypes.c_double * MAX_DEPTH),
+        ("branching_factor", ctypes.c_double * MAX_DEPTH),
+    ]
+
+lib.get_search_stats.argtypes = [ctypes.POINTER(SearchStats)]
+lib.get_search_stats.restype = None
+lib.get_search_stats_size.argtypes = []
+lib.get_search_stats_size.restype = ctypes.c_int
+
+def get_search_stats_from_c() -> SearchStats:
+    """
+    Get the statistics of the most recent search: nodes and quiescence nodes,
+    TT probes/hits/cutoffs and the quiescence share of the cutoffs, null-move
+    and ProbCut tries and cutoffs, LMR reductions and re-searches, internal
+    iterative reductions, futility and late-move prunes, the first-move cutoff
+    rate, moves deferred to other threads (ABDADA), root moves re-searched
+    after beating the zero window, aspiration windows widened, and the nodes,
+    time and effective branching factor of each iteration.
+    
+    Returns:
+        SearchStats structure (a copy; later searches do not change it)
+    """
+    if ctypes.sizeof(SearchStats) != lib.get_search_stats_size():
+        raise RuntimeError(f"SearchStats layout does not match {lib_name}; delete it to rebuild")
+    stats = SearchStats()
+    lib.get_search_stats(ctypes.byref(stats))
+    return stats
+
 # get_cpu_cores
 lib.get_cpu_cores.argtypes = []
 lib.get_cpu_cores.restype = ctypes.c_int
@@ -7,6 +7,7 @@
 */
 
 #include <stdio.h>
+#include <stdlib.h>
 #include <ctype.h>
 #include <string.h>
 #include "Board.h"
@@ -60,6 +61,14 @@ void parse_fen(const char* fen, Position* pos) {
             pos->ep_file = -1;
             pos->ep_rank = -1;
         }
+
+        // Halfmove clock
+        if (ep) {
+            const char* clock = strchr(ep + 1, ' ');
+            if (clock) {
+                pos->halfmove_clock = atoi(clock + 1);
+            }
+        }
     }
 }
 
@@ -23,6 +23,7 @@ typedef struct {
     int white_queen_side_castle;
     int black_king_side_castle;
     int black_queen_side_castle;
+    int halfmove_clock;   // plies since the last capture or pawn move (fifty-move rule)
     // Additional fields can be added here for more game state information
 } Position;
 
@@ -6,7 +6,7 @@
 ###############################
 */
 
-// gcc -O3 -shared -o Engine.dll Engine.c Board.c MoveGen.c Evaluate.c Minimax.c Move.c Rules.c Zobrist.c TT.c Ordering.c KillerMoves.c ParallelSearch.c -Wno-stringop-overflow
+// gcc -O3 -shared -o Engine.dll Engine.c Board.c MoveGen.c Evaluate.c Minimax.c Move.c Rules.c Zobrist.c TT.c Ordering.c KillerMoves.c ParallelSearch.c ThreadPool.c SplitPoint.c See.c RootMoves.c -Wno-stringop-overflow
 
 #include <string.h>
 #include <stdio.h>
@@ -22,7 +22,9 @@
 #include "Zobrist.h"
 #include "TT.h"
 #include "Ordering.h"
+#include "KillerMoves.h"
 #include "ParallelSearch.h"
+#include "See.h"
 
 // Allow external callers (e.g., UCI setoption) to adjust transposition table size in MB.
 // Caps are enforced in TT.c to avoid runaway allocations.
@@ -30,6 +32,61 @@ void set_hash_size(int megabytes) {
     tt_resize(megabytes);
 }
 
+// Allow external callers (e.g., UCI setoption Threads) to size the persistent search thread pool.
+// Workers are created here once and reused by every parallel search.
+void set_thread_count(int num_threads) {
+    parallel_search_init(num_threads);
+}
+
+// Allow external callers (e.g., UCI setoption ParallelMode) to pick the parallel algorithm.
+// 0 = Lazy SMP (default), 1 = Young Brothers Wait split points.
+void set_parallel_mode(int mode) {
+    parallel_search_set_mode(mode);
+}
+
+// Allow external callers (e.g., UCI setoption MultiPV) to set how many principal variations
+// (best root moves, each with its own line) every search reports.
+void set_multi_pv(int lines) {
+    search_set_multi_pv(lines);
+}
+
+// Tell the engine how the game reached the position it will be asked to search.
+// `moves` is a space-separated list of UCI moves played from `start_fen`; the
+// resulting positions are used for repetition detection. A later search from a
+// position that is not the end of this list simply ignores it.
+void set_game_history(const char* start_fen, const char* moves) {
+    static uint64_t keys[MAX_GAME_PLIES + 1];
+    int count = 0;
+
+    init_zobrist();
+    Position pos = {0};
+    parse_fen(start_fen, &pos);
+    keys[count++] = compute_zobrist_hash(&pos);
+
+    const char* ptr = moves ? moves : "";
+    while (*ptr) {
+        while (*ptr == ' ') ptr++;
+        if (!*ptr) break;
+
+        char move[6] = {0};
+        int len = 0;
+        while (ptr[len] && ptr[len] != ' ') len++;
+        if (len >= 4 && len <= 5) {
+            memcpy(move, ptr, len);
+            make_move(&pos, move);
+            // Keep the most recent window if the game is very long
+            if (count == MAX_GAME_PLIES + 1) {
+                memmove(keys, keys + 1, sizeof(uint64_t) * MAX_GAME_PLIES);
+                count--;
+            }
+            keys[count++] = compute_zobrist_hash(&pos);
+        }
+        ptr += len;
+    }
+
+    minimax_set_game_history(keys, count);
+}
+
 // Simple cross-platform monotonic timer in milliseconds
 static double now_ms(void) {
 #ifdef _WIN32
@@ -47,187 +104,158 @@ static double now_ms(void) {
 // FIND BEST MOVE WITH ITERATIVE DEEPENING
 // This function finds the best move for the given position in FEN format using iterative deepening.
 // Iterative deepening progressively searches deeper, improving move ordering and enabling time management.
+// Each iteration uses an aspiration window around the previous score and principal-variation
+// search at the root (see iterative_search in ParallelSearch.c).
 // It returns the best move in standard algebraic notation.
 const char* find_best_move_from_fen(const char* fen, int depth) {
     static char best_move[6];
-    static char pv[6];  // Principal Variation (best move from previous iteration)
-    static int initialized = 0;
-
-    if (!initialized) {
-        init_zobrist();
-        tt_init();
-        initialized = 1;
-    }
 
     Position pos = {0};
     parse_fen(fen, &pos);
+    const ThreadData* result = search_position(&pos, depth, 0.0f, 0, 1);
 
-    int is_white = pos.white_to_move;
-
-    char moves[256][6];
-    int num_moves = generate_legal_moves(&pos, is_white, moves);
+    // No legal moves - checkmate or stalemate
+    strcpy(best_move, result->best_move[0] ? result->best_move : "0000");
+    return best_move;
+}
 
-    // Check if there are any legal moves
-    if (num_moves == 0) {
-        // No legal moves - checkmate or stalemate
-        strcpy(best_move, "0000");
-        return best_move;
-    }
+// EVALUATE BOARD
+// This function evaluates the board position given in FEN format and returns a score.
+float evaluate_fen(const char* fen) {
+    Position pos;
+    parse_fen(fen, &pos);
+    return evaluate_board(&pos);
+}
 
-    // Initialize best move
-    strcpy(best_move, moves[0]);
-
-    // ITERATIVE DEEPENING with ASPIRATION WINDOWS
-    // Benefits:
-    // 1. Better move ordering (PV from previous iteration tried first)
-    // 2. Enables time management (can stop early if time runs out)
-    // 3. Aspiration windows: narrow alpha-beta bounds for faster search
-    float prev_score = 0.0f;
-    
-    for (int current_depth = 1; current_depth <= depth; current_depth++) {
-        float best_score = is_white ? -10000.0f : 10000.0f;
-        char current_best[6];
-        strcpy(current_best, best_move);
-
-        // ASPIRATION WINDOWS: Use narrow window for depth >= 3
-        float alpha = -10000.0f;
-        float beta = 10000.0f;
-        float window = 50.0f; // Initial window size
-        
-        if (current_depth >= 3) {
-            alpha = prev_score - window;
-            beta = prev_score + window;
-        }
+// MATE SCORES
+// MATE_SCORE - n is a mate n plies from the root; any score beyond the bound is a mate.
+// Exported so callers never copy the constants (the bound depends on MAX_PLY).
+float get_mate_score(void) {
+    return MATE_SCORE;
+}
 
-        // Try PV move first if we have one from previous iteration
-        if (current_depth > 1) {
-            // Search PV move first for better alpha-beta cutoffs
-            for (int i = 0; i < num_moves; i++) {
-                if (strcmp(moves[i], pv) == 0 && i != 0) {
-                    // Move PV to front
-                    char temp[6];
-                    strcpy(temp, moves[i]);
-                    for (int j = i; j > 0; j--) {
-                        strcpy(moves[j], moves[j-1]);
-                    }
-                    strcpy(moves[0], temp);
-                    break;
-                }
-            }
-        }
+float get_mate_bound(void) {
+    return MATE_BOUND;
+}
 
-        // Search with aspiration window
-        int needs_research = 0;
-        for (int i = 0; i < num_moves; i++) {
-            Position copy = pos;
-            make_move(&copy, moves[i]);
+// HISTORY SCORE
+// Quiet-move history of `move` (UCI) in the main thread's table, within +-get_history_max().
+// The tables outlive a search, so this shows what the last one learned.
+int get_history_score(const char* move) {
+    return get_history(thread_pool_thread(0), move);
+}
 
-            float score = minimax(&copy, current_depth - 1, alpha, beta, !is_white);
+int get_history_max(void) {
+    return HISTORY_MAX;
+}
 
-            if ((is_white && score > best_score) || (!is_white && score < best_score)) {
-                best_score = score;
-                strcpy(current_best, moves[i]);
-            }
-            
-            // Check if we failed outside the aspiration window
-            if (current_depth >= 3) {
-                if ((is_white && score <= alpha) || (is_white && score >= beta)) {
-                    needs_research = 1;
-                    break;
-                }
-                if ((!is_white && score >= beta) || (!is_white && score <= alpha)) {
-                    needs_research = 1;
-                    break;
-                }
-            }
-        }
+// MOVE ORDER
+// Legal moves of the position given in FEN format, space-separated, in the order the main
+// thread would try them at the first ply of a search. For this call only, `killer` (UCI,
+// may be NULL) is made a killer with saturated history. Call it between searches.
+const char* get_move_order_fen(const char* fen, const char* killer) {
+    static char order[256 * 6];
+    Position pos = {0};
+    parse_fen(fen, &pos);
 
-        // If aspiration window failed, re-search with full window
-        if (needs_research) {
-            best_score = is_white ? -10000.0f : 10000.0f;
-            alpha = -10000.0f;
-            beta = 10000.0f;
-            
-            for (int i = 0; i < num_moves; i++) {
-                Position copy = pos;
-                make_move(&copy, moves[i]);
-
-                float score = minimax(&copy, current_depth - 1, alpha, beta, !is_white);
-
-                if ((is_white && score > best_score) || (!is_white && score < best_score)) {
-                    best_score = score;
-                    strcpy(current_best, moves[i]);
-                }
-            }
-        }
+    SearchThread* thread = thread_pool_thread(0);
+    SearchStack saved_stack = thread->stack[0];
+    int from_sq = 0, to_sq = 0, saved_history = 0;
+    if (killer && killer[0] != '\0') {
+        from_sq = ('8' - killer[1]) * 8 + (killer[0] - 'a');
+        to_sq = ('8' - killer[3]) * 8 + (killer[2] - 'a');
+        saved_history = thread->history_table[from_sq][to_sq];
+        thread->history_table[from_sq][to_sq] = HISTORY_MAX;
+        memset(thread->stack[0].killers, 0, sizeof(thread->stack[0].killers));
+        add_killer_move(thread, 0, killer);
+    }
 
-        // Update best move, PV, and previous score
-        strcpy(best_move, current_best);
-        strcpy(pv, current_best);
-        prev_score = best_score;
+    char moves[256][6];
+    int scores[256];
+    int num_moves = generate_legal_moves(&pos, pos.white_to_move, moves);
+    score_moves(thread, &pos, moves, scores, num_moves, 0, NULL, NULL);
+    order[0] = '\0';
+    for (int i = 0; i < num_moves; i++) {
+        pick_move(moves, scores, num_moves, i);
+        if (i > 0) strcat(order, " ");
+        strcat(order, moves[i]);
     }
 
-    return best_move;
+    if (killer && killer[0] != '\0') {
+        thread->history_table[from_sq][to_sq] = saved_history;
+    }
+    thread->stack[0] = saved_stack;
+    return order;
 }
 
-// EVALUATE BOARD
-// This function evaluates the board position given in FEN format and returns a score.
-float evaluate_fen(const char* fen) {
+// STATIC EXCHANGE EVALUATION
+// Material (in pawns) the side to move wins with the capture `move` in the position given in FEN format.
+float see_fen(const char* fen, const char* move) {
     Position pos;
     parse_fen(fen, &pos);
-    return evaluate_board(&pos);
+    return see(&pos, move);
 }
 
-// GET SEARCH INFO WITH PRINCIPAL VARIATION
-// Returns detailed search information including evaluation at each depth
-// Format: "depth score pv_move"
-const char* get_search_info(const char* fen, int max_depth) {
-    static char info[256];
-    static int initialized = 0;
+// SEARCH ONE NODE
+// Search the position given in FEN format as one node with the window (alpha, beta), as a PV,
+// cut or all node (see search_node); returns its white-relative score.
+float search_window_fen(const char* fen, int depth, float alpha, float beta, int pv_node, int cut_node) {
+    Position pos = {0};
+    parse_fen(fen, &pos);
+    return search_node(&pos, depth, alpha, beta, pv_node, cut_node);
+}
 
-    if (!initialized) {
-        init_zobrist();
-        tt_init();
-        initialized = 1;
+// Format line `index` of a search result as "depth score pv..." ("0 0.0 none" without legal moves)
+static void format_search_info(char* info, size_t size, int depth, const ThreadData* result, int index) {
+    if (result->best_move[0] == '\0' || index >= result->num_lines) {
+        snprintf(info, size, "0 0.0 none");
+        return;
     }
 
+    const SearchLine* line = &result->lines[index];
+    int length = snprintf(info, size, "%d %.2f", depth, line->score);
+    for (int i = 0; i < line->pv_length && length < (int)size; i++) {
+        length += snprintf(info + length, size - length, " %s", line->pv[i]);
+    }
+}
+
+// GET SEARCH INFO WITH PRINCIPAL VARIATION
+// Returns detailed search information including the evaluation and the full principal variation
+// Format: "depth score pv_move1 pv_move2 ..."
+const char* get_search_info(const char* fen, int max_depth) {
+    static char info[1024];
+
     Position pos = {0};
     parse_fen(fen, &pos);
-    int is_white = pos.white_to_move;
+    const ThreadData* result = search_position(&pos, max_depth, 0.0f, 0, 1);
 
-    char moves[256][6];
-    int num_moves = generate_legal_moves(&pos, is_white, moves);
-    
-    if (num_moves == 0) {
-        strcpy(info, "0 0.0 none");
-        return info;
-    }
+    format_search_info(info, sizeof(info), max_depth, result, 0);
+    return info;
+}
 
-    char best_move[6];
-    strcpy(best_move, moves[0]);
-    float final_score = 0.0f;
-
-    // Iterative deepening to find best move and score
-    for (int depth = 1; depth <= max_depth; depth++) {
-        float best_score = is_white ? -10000.0f : 10000.0f;
-        
-        for (int i = 0; i < num_moves; i++) {
-            Position copy = pos;
-            make_move(&copy, moves[i]);
-            
-            float score = minimax(&copy, depth - 1, -10000.0f, 10000.0f, !is_white);
-            
-            if ((is_white && score > best_score) || (!is_white && score < best_score)) {
-                best_score = score;
-                strcpy(best_move, moves[i]);
-            }
-        }
-        
-        final_score = best_score;
-    }
+// GET LAST SEARCH INFO
+// Same format as get_search_info, for the most recent search of any entry point
+// (the depth is the last completed iteration)
+const char* get_last_search_info(void) {
+    static char info[1024];
+
+    const ThreadData* result = search_last_result();
+    format_search_info(info, sizeof(info), result->completed_depth, result, 0);
+    return info;
+}
+
+// GET SEARCH LINE
+// Line `index` (0 = best) of the most recent search when MultiPV is set, in the same
+// format as get_last_search_info; an empty string past the last line
+const char* get_search_line(int index) {
+    static char info[1024];
 
-    // Format: "depth score pv_move"
-    snprintf(info, sizeof(info), "%d %.2f %s", max_depth, final_score, best_move);
+    const ThreadData* result = search_last_result();
+    if (index < 0 || index >= result->num_lines) {
+        info[0] = '\0';
+        return info;
+    }
+    format_search_info(info, sizeof(info), result->completed_depth, result, index);
     return info;
 }
 
@@ -237,106 +265,117 @@ const char* get_search_info(const char* fen, int max_depth) {
 // Returns: "move depth time_spent"
 const char* find_best_move_timed(const char* fen, float max_time_ms) {
     static char result[64];
-    static char best_move[6];
-    static char pv[6];
-    static int initialized = 0;
-
-    if (!initialized) {
-        init_zobrist();
-        tt_init();
-        initialized = 1;
-    }
 
     double start_time_ms = now_ms();
 
     Position pos = {0};
     parse_fen(fen, &pos);
-    int is_white = pos.white_to_move;
+    const ThreadData* search = search_position(&pos, SEARCH_MAX_DEPTH, max_time_ms, 0, 1);
 
-    char moves[256][6];
-    int num_moves = generate_legal_moves(&pos, is_white, moves);
+    double time_spent = now_ms() - start_time_ms;
+
+    // Format: "move depth time_spent_ms" ("0000 0" without legal moves)
+    snprintf(result, sizeof(result), "%s %d %.1f",
+             search->best_move[0] ? search->best_move : "0000", search->completed_depth, time_spent);
+    return result;
+}
+
+// START SEARCH
+// Starts a search of the given position on a background thread and returns immediately,
+// so the caller (the UCI loop) can keep reading commands. A depth of 0 means no depth
+// limit, a max_time_ms or max_nodes of 0 no time or node limit: with none of them the
+// search runs until stop_search(). Any search still running is stopped first.
+void start_search(const char* fen, int depth, float max_time_ms, unsigned long long max_nodes, int num_threads) {
+    Position pos = {0};
+    parse_fen(fen, &pos);
 
-    if (num_moves == 0) {
-        // No legal moves - checkmate or stalemate
-        snprintf(result, sizeof(result), "0000 0 0.0");
-        return result;
+    if (num_threads > 1) {
+        num_threads = parallel_search_init(num_threads);
     }
+    search_start(&pos, depth > 0 ? depth : SEARCH_MAX_DEPTH, max_time_ms, max_nodes, num_threads);
+}
 
-    // Initialize best move
-    strcpy(best_move, moves[0]);
-    int completed_depth = 0;
-    minimax_set_time_limit(start_time_ms, max_time_ms);
-
-    // Iterative deepening with time control
-    for (int current_depth = 1; current_depth <= 20; current_depth++) {
-        // Check time before starting new depth
-        double elapsed_ms = now_ms() - start_time_ms;
-        if (elapsed_ms >= max_time_ms * 0.9) {
-            // 90% of time used, don't start new depth
-            break;
-        }
+// STOP SEARCH
+// Raises the abort flag every search thread checks at each node; the search finishes
+// within milliseconds with the last completed iteration. Safe to call from any thread.
+void stop_search(void) {
+    search_stop();
+}
 
-        float best_score = is_white ? -10000.0f : 10000.0f;
-        char current_best[6];
-        strcpy(current_best, best_move);
-
-        // Try PV move first if we have one
-        if (current_depth > 1) {
-            for (int i = 0; i < num_moves; i++) {
-                if (strcmp(moves[i], pv) == 0 && i != 0) {
-                    char temp[6];
-                    strcpy(temp, moves[i]);
-                    for (int j = i; j > 0; j--) {
-                        strcpy(moves[j], moves[j-1]);
-                    }
-                    strcpy(moves[0], temp);
-                    break;
-                }
-            }
-        }
+// PONDERHIT
+// The opponent played the expected move: the running ponder search (started without a
+// time limit) becomes a normal timed search of max_time_ms from now, continuing the same
+// iteration with the same TT and root move order
+void ponderhit(float max_time_ms) {
+    search_ponderhit(max_time_ms);
+}
 
-        // Search all moves at this depth
-        int moves_searched = 0;
-        for (int i = 0; i < num_moves; i++) {
-            // Check time during search
-            elapsed_ms = now_ms() - start_time_ms;
-            if (elapsed_ms >= max_time_ms) {
-                break;  // Time's up
-            }
+// IS SEARCHING
+// 1 while a search started by start_search is still running
+int is_searching(void) {
+    return search_running();
+}
 
-            Position copy = pos;
-            make_move(&copy, moves[i]);
+// WAIT SEARCH
+// Blocks until the background search has finished and returns its best move ("0000"
+// without legal moves); the lines are then available from get_search_line
+const char* wait_search(void) {
+    static char best_move[6];
 
-            float score = minimax(&copy, current_depth - 1, -10000.0f, 10000.0f, !is_white);
+    const ThreadData* result = search_wait();
+    strcpy(best_move, result->best_move[0] ? result->best_move : "0000");
+    return best_move;
+}
 
-            if ((is_white && score > best_score) || (!is_white && score < best_score)) {
-                best_score = score;
-                strcpy(current_best, moves[i]);
-            }
+// FIND BEST MOVE WITH A NODE LIMIT
+// Iterative deepening until `max_nodes` nodes have been searched; the best move of the last
+// completed iteration. Single-threaded the limit is exact, so the result does not depend on
+// the machine's speed (only on the engine's state: TT and history tables).
+// Returns: "move depth nodes"
+const char* find_best_move_nodes(const char* fen, unsigned long long max_nodes, int num_threads) {
+    static char result[64];
 
-            moves_searched++;
-        }
+    Position pos = {0};
+    parse_fen(fen, &pos);
 
-        // Only update if we completed the depth
-        if (moves_searched == num_moves) {
-            strcpy(best_move, current_best);
-            strcpy(pv, current_best);
-            completed_depth = current_depth;
-        } else {
-            // Didn't finish this depth, use previous result
-            break;
-        }
+    if (num_threads > 1) {
+        num_threads = parallel_search_init(num_threads);
     }
+    const ThreadData* search = search_position(&pos, SEARCH_MAX_DEPTH, 0.0f, max_nodes, num_threads);
 
-    double end_time_ms = now_ms();
-    double time_spent = end_time_ms - start_time_ms;
-    minimax_clear_time_limit();
-
-    // Format: "move depth time_spent_ms"
-    snprintf(result, sizeof(result), "%s %d %.1f", best_move, completed_depth, time_spent);
+    // Format: "move depth nodes" ("0000 0 0" without legal moves)
+    snprintf(result, sizeof(result), "%s %d %llu", search->best_move[0] ? search->best_move : "0000",
+             search->completed_depth, (unsigned long long)search_last_nodes());
     return result;
 }
 
+// GET LAST SEARCH NODES / TIME
+// Nodes searched by all threads of the most recent search (each thread counts its own),
+// and how long that search took in milliseconds; together they give the NPS
+unsigned long long get_last_search_nodes(void) {
+    return search_last_nodes();
+}
+
+double get_last_search_time(void) {
+    return search_last_time_ms();
+}
+
+// GET SEARCH STATS
+// Copies the statistics of the most recent search into `out` (see SearchStats in
+// ParallelSearch.h); get_search_stats_size lets the caller check it mirrors the layout,
+// and get_max_depth gives the length of its per-iteration arrays
+void get_search_stats(SearchStats* out) {
+    *out = *search_last_stats();
+}
+
+int get_search_stats_size(void) {
+    return (int)sizeof(SearchStats);
+}
+
+int get_max_depth(void) {
+    return MAX_DEPTH;
+}
+
 // GET CPU CORE COUNT
 // Returns the number of available CPU cores
 int get_cpu_cores(void) {
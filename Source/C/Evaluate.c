@@ -10,7 +10,7 @@
 #include "MoveGen.h"
 
 // EVALUATE MATERIAL
-static float piece_value(char type) {
+float piece_value(char type) {
     switch (type) {
         case 'p': return 1.0;
         case 'n': return 3.0;
@@ -11,6 +11,9 @@
 
 #include "Board.h"
 
+// Material value of a piece type in pawns (king: 0)
+float piece_value(char type);
+
 float evaluate_material(Position* pos);
 float evaluate_pawn_structure(Position* pos);
 float evaluate_center_control(Position* pos);
@@ -9,23 +9,23 @@
 #include <string.h>
 #include "KillerMoves.h"
 
-char killer_moves[MAX_DEPTH][2][6] = {{{0}}};
-
-void add_killer_move(int depth, const char* move) {
-    if (depth < 0 || depth >= MAX_DEPTH) return;
+void add_killer_move(SearchThread* thread, int ply, const char* move) {
+    if (ply < 0 || ply >= MAX_PLY) return;
+    char (*killers)[6] = thread->stack[ply].killers;
 
     // Check if the move is already a killer move
-    if (strcmp(killer_moves[depth][0], move) == 0) return;
-    if (strcmp(killer_moves[depth][1], move) == 0) return;
+    if (strcmp(killers[0], move) == 0) return;
+    if (strcmp(killers[1], move) == 0) return;
 
     // Shift the new [1] move to [0] and the old [0] to [1]
-    strcpy(killer_moves[depth][1], killer_moves[depth][0]);
-    strcpy(killer_moves[depth][0], move);
+    strcpy(killers[1], killers[0]);
+    strcpy(killers[0], move);
 }
 
-// Check if a move is a killer move for the given depth
-int is_killer_move(int depth, const char* move) {
-    if (depth < 0 || depth >= MAX_DEPTH) return 0;
-    return (strcmp(killer_moves[depth][0], move) == 0 ||
-            strcmp(killer_moves[depth][1], move) == 0);
+// Check if a move is a killer move at the given ply
+int is_killer_move(SearchThread* thread, int ply, const char* move) {
+    if (ply < 0 || ply >= MAX_PLY) return 0;
+    char (*killers)[6] = thread->stack[ply].killers;
+    return (strcmp(killers[0], move) == 0 ||
+            strcmp(killers[1], move) == 0);
 }
@@ -9,12 +9,10 @@
 #ifndef KILLER_MOVES_H
 #define KILLER_MOVES_H
 
-#define MAX_DEPTH 64
+#include "ThreadPool.h"
 
-// Killer moves table
-extern char killer_moves[MAX_DEPTH][2][6];
-
-void add_killer_move(int depth, const char* move);
-int is_killer_move(int depth, const char* move);
+// Killer moves live in each thread's search stack (stack[ply].killers), indexed by ply
+void add_killer_move(SearchThread* thread, int ply, const char* move);
+int is_killer_move(SearchThread* thread, int ply, const char* move);
 
 #endif
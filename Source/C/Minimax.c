@@ -8,6 +8,8 @@
 
 #include <stdlib.h>
 #include <string.h>
+#include <math.h>
+#include <stdatomic.h>
 #include <time.h>
 #ifdef _WIN32
 #include <windows.h>
@@ -23,6 +25,9 @@
 #include "TT.h"
 #include "Ordering.h"
 #include "KillerMoves.h"
+#include "ThreadPool.h"
+#include "SplitPoint.h"
+#include "See.h"
 
 static double now_ms(void) {
 #ifdef _WIN32
@@ -36,13 +41,68 @@ static double now_ms(void) {
     return (double)ts.tv_sec * 1000.0 + (double)ts.tv_nsec / 1e6;
 #endif
 }
-static int g_time_limit_enabled = 0;
 
-static int g_time_limit_enabled = 0;
+// Time limit of the current search. It may be set while the search runs (ponderhit), so
+// the start and limit are written before the flag that enables them is published.
+static atomic_int g_time_limit_enabled = 0;
 static double g_time_start_ms = 0.0;
 static double g_time_limit_ms = 0.0;
 static int g_time_up = 0;
 
+// Shallow-depth pruning margins (pawns)
+#define RFP_MAX_DEPTH 3
+#define RFP_MARGIN_PER_DEPTH 0.8f
+#define RAZOR_MAX_DEPTH 2
+#define RAZOR_MARGIN_BASE 3.0f
+#define RAZOR_MARGIN_PER_DEPTH 2.0f
+
+// Late move pruning: at depth d, quiet moves past LMP_BASE + d*d are skipped
+#define LMP_MAX_DEPTH 3
+#define LMP_BASE 3
+#define LMP_HISTORY_EXEMPT 256
+
+// Late move reductions: R(d, m) = LMR_BASE + ln(d) * ln(m) / LMR_DIVISOR plies for the
+// m-th move at depth d, then adjusted per move (see lmr_reduction)
+#define LMR_MIN_DEPTH 3
+#define LMR_MIN_MOVE 3
+#define LMR_MAX_MOVES 64
+#define LMR_BASE 0.75
+#define LMR_DIVISOR 2.25
+#define LMR_HISTORY_GOOD 512
+
+// Internal iterative reduction: nodes this deep with no hash move lose a ply
+#define IIR_MIN_DEPTH 4
+
+// Delta pruning: a capture has to be able to lift the stand-pat score to within this of alpha/beta
+#define DELTA_MARGIN 2.0f
+
+// ProbCut: at non-PV nodes, a good capture that beats beta by a margin in a search
+// PROBCUT_REDUCTION plies shallower is taken as proof the full search fails high too
+#define PROBCUT_MIN_DEPTH 5
+#define PROBCUT_REDUCTION 4
+#define PROBCUT_MARGIN 1.5f
+
+static int g_lmr_table[MAX_DEPTH][LMR_MAX_MOVES];
+static int g_lmr_initialized = 0;
+
+// Shared abort flag checked by every search thread (e.g. Lazy SMP helpers)
+static atomic_int g_stop_requested = 0;
+
+// Node limit of the current search (0 = none), over the first g_node_limit_threads workers.
+// With more than one thread the main thread sums their counters every NODE_CHECK_INTERVAL
+// of its own nodes, so the search may overshoot by about that much per thread.
+#define NODE_CHECK_INTERVAL 1024
+static uint64_t g_node_limit = 0;
+static int g_node_limit_threads = 1;
+
+// Zobrist keys of the game's positions up to and including the current one
+// (set from the UCI move list), and the part of it valid for the current search
+static uint64_t g_game_keys[MAX_GAME_PLIES];
+static int g_game_key_count = 0;
+static const uint64_t* g_prior_keys = NULL;
+static int g_prior_count = 0;
+static uint64_t g_root_key = 0;
+
 static int count_pieces(Position* pos) {
     int count = 0;
     for (int r = 0; r < 8; r++) {
@@ -56,21 +116,36 @@ static int count_pieces(Position* pos) {
 }
 
 void minimax_set_time_limit(double start_ms, double limit_ms) {
-    g_time_limit_enabled = 1;
     g_time_start_ms = start_ms;
     g_time_limit_ms = limit_ms;
     g_time_up = 0;
+    atomic_store(&g_time_limit_enabled, 1);
 }
 
 void minimax_clear_time_limit(void) {
-    g_time_limit_enabled = 0;
+    atomic_store(&g_time_limit_enabled, 0);
     g_time_start_ms = 0.0;
     g_time_limit_ms = 0.0;
     g_time_up = 0;
 }
 
+void minimax_request_stop(void) {
+    atomic_store(&g_stop_requested, 1);
+}
+
+void minimax_clear_stop(void) {
+    atomic_store(&g_stop_requested, 0);
+}
+
+int minimax_stop_requested(void) {
+    return atomic_load_explicit(&g_stop_requested, memory_order_relaxed);
+}
+
 static int time_exceeded(void) {
-    if (!g_time_limit_enabled || g_time_up) {
+    if (minimax_stop_requested()) {
+        return 1;
+    }
+    if (!atomic_load_explicit(&g_time_limit_enabled, memory_order_acquire) || g_time_up) {
         return g_time_up;
     }
     double elapsed = now_ms() - g_time_start_ms;
@@ -81,74 +156,622 @@ static int time_exceeded(void) {
     return 0;
 }
 
+void minimax_set_node_limit(uint64_t max_nodes, int num_threads) {
+    g_node_limit = max_nodes;
+    g_node_limit_threads = num_threads;
+}
+
+// Checked at every node; only the main thread (worker 0) counts, and on reaching the
+// limit it raises the shared abort flag so the helpers stop too. Single-threaded the
+// check is exact, which makes node-limited searches reproducible.
+static int node_limit_reached(SearchThread* thread) {
+    if (g_node_limit == 0 || thread->id != 0) {
+        return 0;
+    }
+    uint64_t nodes = thread->nodes;
+    if (g_node_limit_threads > 1) {
+        if (nodes % NODE_CHECK_INTERVAL != 0) {
+            return 0;
+        }
+        for (int i = 1; i < g_node_limit_threads; i++) {
+            nodes += thread_pool_thread(i)->nodes;
+        }
+    }
+    if (nodes < g_node_limit) {
+        return 0;
+    }
+    minimax_request_stop();
+    return 1;
+}
+
+double minimax_time_used(void) {
+    if (!atomic_load_explicit(&g_time_limit_enabled, memory_order_acquire)) {
+        return 0.0;
+    }
+    return (now_ms() - g_time_start_ms) / g_time_limit_ms;
+}
+
+void minimax_set_game_history(const uint64_t* keys, int count) {
+    // Only the last hundred or so plies can ever repeat; keep the tail
+    if (count > MAX_GAME_PLIES) {
+        keys += count - MAX_GAME_PLIES;
+        count = MAX_GAME_PLIES;
+    }
+    memcpy(g_game_keys, keys, sizeof(uint64_t) * count);
+    g_game_key_count = count;
+}
+
+static void init_lmr_table(void) {
+    if (g_lmr_initialized) return;
+    for (int depth = 1; depth < MAX_DEPTH; depth++) {
+        for (int move = 1; move < LMR_MAX_MOVES; move++) {
+            g_lmr_table[depth][move] = (int)(LMR_BASE + log(depth) * log(move) / LMR_DIVISOR);
+        }
+    }
+    g_lmr_initialized = 1;
+}
+
+// Prepare for a search from `root`: the game history only applies if it ends in this position
+void minimax_new_search(Position* root) {
+    init_lmr_table();
+    g_root_key = compute_zobrist_hash(root);
+    if (g_game_key_count > 0 && g_game_keys[g_game_key_count - 1] == g_root_key) {
+        g_prior_keys = g_game_keys;
+        g_prior_count = g_game_key_count;
+    } else {
+        g_prior_keys = &g_root_key;
+        g_prior_count = 1;
+    }
+    for (int i = 0; i < MAX_THREADS; i++) {
+        SearchThread* thread = thread_pool_thread(i);
+        thread->nodes = 0;
+        memset(&thread->stats, 0, sizeof(thread->stats));
+        thread->ply = 0;
+        memset(thread->stack, 0, sizeof(thread->stack));
+    }
+}
+
+// Has this position occurred before, on the search path or earlier in the game?
+// Only positions since the last capture or pawn move can match, and only with the same side to move.
+static int is_repetition(SearchThread* thread, Position* pos, uint64_t hash) {
+    int ply = thread->ply;
+    for (int distance = 2; distance <= pos->halfmove_clock; distance += 2) {
+        uint64_t key;
+        if (distance <= ply) {
+            key = thread->stack[ply - distance].key;
+        } else {
+            // Parent of ply 0 is the root, the last entry of the prior keys
+            int index = g_prior_count - (distance - ply);
+            if (index < 0) break;
+            key = g_prior_keys[index];
+        }
+        if (key == hash) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
+// Set once the current search has been cut short; its scores must not reach the TT
+int minimax_search_aborted(void) {
+    return g_time_up || minimax_stop_requested();
+}
+
+// Global abort, or a split point above this thread's work was cut off
+static int search_aborted(SearchThread* thread) {
+    return minimax_search_aborted() || split_cut(thread);
+}
+
+// Classify a result against the window it was searched with
+static int tt_bound(float eval, float alpha, float beta) {
+    if (eval >= beta) return TT_LOWER;
+    if (eval <= alpha) return TT_UPPER;
+    return TT_EXACT;
+}
+
+// Mate scores count plies from the root, but a TT entry can be reached at any ply:
+// store them relative to the node and convert back on probe
+static float score_to_tt(float score, int ply) {
+    if (score >= MATE_BOUND) return score + ply;
+    if (score <= -MATE_BOUND) return score - ply;
+    return score;
+}
+
+static float score_from_tt(float score, int ply) {
+    if (score >= MATE_BOUND) return score - ply;
+    if (score <= -MATE_BOUND) return score + ply;
+    return score;
+}
+
+// Static eval of a position, cached in the TT (to the centipawn) by whoever evaluated it first
+static float static_evaluate(Position* pos, int tt_found, const TTHit* tt_hit) {
+    if (tt_found && tt_hit->has_static_eval) {
+        return tt_hit->static_eval;
+    }
+    return evaluate_board(pos);
+}
+
+// Fail-low nodes have no meaningful best move, so only cutoffs and exact scores record one.
+// The node's static eval (search stack) is cached alongside.
+static void store_result(SearchThread* thread, uint64_t hash, float eval, int depth, float alpha, float beta, const char* best_move) {
+    if (!search_aborted(thread)) {
+        int bound = tt_bound(eval, alpha, beta);
+        tt_store(hash, score_to_tt(eval, thread->ply), thread->stack[thread->ply].static_eval,
+                 depth, bound, bound == TT_UPPER ? NULL : best_move);
+    }
+}
+
+// Record the move about to be searched from the current node (continuation history)
+static void push_move(SearchThread* thread, Position* pos, const char* move) {
+    SearchStack* ss = &thread->stack[thread->ply];
+    int from_rank = '8' - move[1];
+    int from_file = move[0] - 'a';
+    strcpy(ss->move, move);
+    ss->piece = piece_slot(pos->board[from_rank][from_file]);
+    ss->to = ('8' - move[3]) * 8 + (move[2] - 'a');
+}
+
+// Most material a tactical move can win outright: the victim plus any promotion gain
+static float tactical_gain(Position* pos, const char* move) {
+    int from_file = move[0] - 'a';
+    int to_file = move[2] - 'a';
+    int to_rank = '8' - move[3];
+    char victim = pos->board[to_rank][to_file].type;
+    if (victim == 0 && from_file != to_file) {
+        victim = 'p'; // en passant
+    }
+    float gain = piece_value(victim);
+    if (move[4] != '\0') {
+        gain += piece_value(move[4]) - piece_value('p');
+    }
+    return gain;
+}
+
 // QUIESCENCE SEARCH
-static float quiescence(Position* pos, float alpha, float beta, int maximizingPlayer, int depth) {
-    if (time_exceeded()) {
+static float quiescence(SearchThread* thread, Position* pos, float alpha, float beta, int maximizingPlayer) {
+    thread->nodes++;
+    thread->stats.qnodes++;
+    if (time_exceeded() || node_limit_reached(thread) || split_cut(thread) || thread->ply >= MAX_PLY) {
         return evaluate_board(pos);
     }
-    float stand_pat = evaluate_board(pos);
+
+    // Capture sequences transpose heavily: any stored result (quiescence or deeper) may cut
+    uint64_t hash = compute_zobrist_hash(pos);
+    float alpha_orig = alpha;
+    float beta_orig = beta;
+    TTHit tt_hit;
+    int tt_found = tt_probe(hash, &tt_hit);
+    thread->stats.tt_probes++;
+    if (tt_found) {
+        thread->stats.tt_hits++;
+        tt_hit.eval = score_from_tt(tt_hit.eval, thread->ply);
+        if (tt_hit.bound == TT_EXACT ||
+            (tt_hit.bound == TT_LOWER && tt_hit.eval >= beta) ||
+            (tt_hit.bound == TT_UPPER && tt_hit.eval <= alpha)) {
+            thread->stats.tt_cutoffs++;
+            thread->stats.qs_tt_cutoffs++;
+            return tt_hit.eval;
+        }
+    }
+
+    // Generate capture moves only (optimized version)
+    char moves[256][6];
+    int num_moves = generate_capture_moves(pos, maximizingPlayer, moves);
+
+    // Captures are pseudo-legal: if the king can be taken, the previous capture was illegal.
+    // Refute it at once instead of letting the capture sequence continue without a king.
+    for (int i = 0; i < num_moves; i++) {
+        if (pos->board['8' - moves[i][3]][moves[i][2] - 'a'].type == 'k') {
+            return maximizingPlayer ? 10000.0f : -10000.0f;
+        }
+    }
+
+    // Stand pat on the static eval
+    float stand_pat = static_evaluate(pos, tt_found, &tt_hit);
+    thread->stack[thread->ply].static_eval = stand_pat;
 
     // Alpha-beta cutoffs
     if (maximizingPlayer) {
-        if (stand_pat >= beta) return beta;
+        if (stand_pat >= beta) {
+            store_result(thread, hash, beta, TT_DEPTH_QS, alpha_orig, beta_orig, NULL);
+            return beta;
+        }
         if (stand_pat > alpha) alpha = stand_pat;
     } else {
-        if (stand_pat <= alpha) return alpha;
+        if (stand_pat <= alpha) {
+            store_result(thread, hash, alpha, TT_DEPTH_QS, alpha_orig, beta_orig, NULL);
+            return alpha;
+        }
         if (stand_pat < beta) beta = stand_pat;
     }
 
-    // Generate capture moves only (optimized version)
-    char moves[256][6];
-    int num_moves = generate_capture_moves(pos, maximizingPlayer, moves);
-    sort_moves(pos, moves, num_moves, depth);
-    if (num_moves == 0) return stand_pat; // no captures → stop
+    if (num_moves == 0) { // no captures → stop
+        store_result(thread, hash, stand_pat, TT_DEPTH_QS, alpha_orig, beta_orig, NULL);
+        return stand_pat;
+    }
+
+    // DELTA PRUNING (big delta): not even the best capture or promotion here can bring
+    // the score back to the window
+    float max_gain = 0.0f;
+    for (int i = 0; i < num_moves; i++) {
+        float gain = tactical_gain(pos, moves[i]);
+        if (gain > max_gain) max_gain = gain;
+    }
+    if (maximizingPlayer && stand_pat + max_gain + DELTA_MARGIN <= alpha) {
+        store_result(thread, hash, alpha, TT_DEPTH_QS, alpha_orig, beta_orig, NULL);
+        return alpha;
+    }
+    if (!maximizingPlayer && stand_pat - max_gain - DELTA_MARGIN >= beta) {
+        store_result(thread, hash, beta, TT_DEPTH_QS, alpha_orig, beta_orig, NULL);
+        return beta;
+    }
+    // Hash move first when it is one of the captures
+    int scores[256];
+    score_moves(thread, pos, moves, scores, num_moves, thread->ply, tt_found ? tt_hit.move : NULL, NULL);
 
+    const char* best_move = NULL;
     for (int i = 0; i < num_moves; i++) {
+        pick_move(moves, scores, num_moves, i);
+
+        // DELTA PRUNING: this move cannot win enough material to matter
+        float gain = tactical_gain(pos, moves[i]);
+        if (maximizingPlayer ? stand_pat + gain + DELTA_MARGIN <= alpha
+                             : stand_pat - gain - DELTA_MARGIN >= beta) {
+            continue;
+        }
+
         Position copy = *pos;
         make_move(&copy, moves[i]);
 
-        float score = quiescence(&copy, alpha, beta, !maximizingPlayer, depth);
+        push_move(thread, pos, moves[i]);
+        thread->ply++;
+        float score = quiescence(thread, &copy, alpha, beta, !maximizingPlayer);
+        thread->ply--;
 
         if (maximizingPlayer) {
-            if (score > alpha) alpha = score;
-            if (alpha >= beta) return beta;
+            if (score > alpha) {
+                alpha = score;
+                best_move = moves[i];
+            }
+            if (alpha >= beta) {
+                store_result(thread, hash, beta, TT_DEPTH_QS, alpha_orig, beta_orig, moves[i]);
+                return beta;
+            }
+        } else {
+            if (score < beta) {
+                beta = score;
+                best_move = moves[i];
+            }
+            if (beta <= alpha) {
+                store_result(thread, hash, alpha, TT_DEPTH_QS, alpha_orig, beta_orig, moves[i]);
+                return alpha;
+            }
+        }
+    }
+
+    float eval = maximizingPlayer ? alpha : beta;
+    store_result(thread, hash, eval, TT_DEPTH_QS, alpha_orig, beta_orig, best_move);
+    return eval;
+}
+
+// Plies to reduce the i-th move of a node (a late quiet move) by.
+// Clearly bad late moves lose more depth; PV nodes, killers and moves with a good
+// history record lose less, and a side whose eval is not improving is reduced harder.
+static int lmr_reduction(SearchThread* thread, const char* move, int i, int depth,
+                         int pv_node, int improving) {
+    int reduction = g_lmr_table[depth < MAX_DEPTH ? depth : MAX_DEPTH - 1]
+                               [i + 1 < LMR_MAX_MOVES ? i + 1 : LMR_MAX_MOVES - 1];
+
+    int history = get_history(thread, move);
+    if (history >= LMR_HISTORY_GOOD) reduction--;
+    else if (history < 0) reduction++;
+
+    if (pv_node) reduction--;
+    if (!improving) reduction++;
+    if (is_killer_move(thread, thread->ply, move)) reduction--;
+
+    // Never drop straight into quiescence, and never extend
+    if (reduction > depth - 2) reduction = depth - 2;
+    if (reduction < 0) reduction = 0;
+    return reduction;
+}
+
+// Does `eval` improve on the bound the side to move is trying to raise (alpha) or lower (beta)?
+static int beats_bound(float eval, float alpha, float beta, int maximizingPlayer) {
+    return maximizingPlayer ? eval > alpha : eval < beta;
+}
+
+// Search one move of a node at `depth` with LMR and PVS.
+// Returns 0 if the move was pruned without being searched.
+static int search_child(SearchThread* thread, Position* pos, char moves[][6], int i, int depth,
+                        float alpha, float beta, int maximizingPlayer, int pv_node, int cut_node, int do_futility_pruning,
+                        int lmp_limit, int improving, float* eval_out, int* is_capture_out) {
+    Position copy = *pos; // Copy of stack
+
+    // Check if this is a capture or tactical move
+    int is_capture = is_capture_move(&copy, moves[i]);
+    int is_quiet = !is_capture && moves[i][4] == '\0';
+    *is_capture_out = is_capture;
+
+    make_move(&copy, moves[i]);
+
+    // FUTILITY PRUNING: Skip quiet moves when position is hopeless
+    // LATE MOVE PRUNING: at shallow depth, quiet moves this far down the ordering are
+    // skipped outright unless their history score vouches for them
+    // Neither applies to checks, which may mate (the static eval knows nothing of that).
+    int futile = do_futility_pruning && !is_capture;
+    int late = lmp_limit > 0 && i >= lmp_limit && is_quiet &&
+               get_history(thread, moves[i]) < LMP_HISTORY_EXEMPT;
+    if ((futile || late) && !is_in_check(&copy, !maximizingPlayer)) {
+        if (futile) {
+            thread->stats.futility_prunes++;
         } else {
-            if (score < beta) beta = score;
-            if (beta <= alpha) return alpha;
+            thread->stats.lmp_prunes++;
+        }
+        return 0;
+    }
+
+    // LATE MOVE REDUCTIONS (LMR): late quiet moves are searched shallower first
+    int reduction = 0;
+    if (i >= LMR_MIN_MOVE && depth >= LMR_MIN_DEPTH && is_quiet) {
+        reduction = lmr_reduction(thread, moves[i], i, depth, pv_node, improving);
+        if (reduction > 0) {
+            thread->stats.lmr_reductions++;
+        }
+    }
+
+    // Node type of the child searched with this node's own window: the first child of a
+    // cut node is an all node and vice versa, a PV node's is a PV node
+    int child = !maximizingPlayer;
+    int child_cut = !pv_node && !cut_node;
+    float eval;
+    push_move(thread, pos, moves[i]);
+    thread->ply++;
+    if (i == 0 || is_capture) {
+        eval = minimax_search(thread, &copy, depth - 1, alpha, beta, child, pv_node, child_cut, moves[i]);
+    } else {
+        // PVS: null window on the bound the side to move has to beat. A late move is
+        // expected to fail low here, so its child is expected to cut (a reduced one always)
+        float zw_alpha = maximizingPlayer ? alpha : beta - NULL_WINDOW;
+        float zw_beta = maximizingPlayer ? alpha + NULL_WINDOW : beta;
+        eval = minimax_search(thread, &copy, depth - 1 - reduction, zw_alpha, zw_beta, child, 0,
+                              reduction > 0 || !cut_node, moves[i]);
+
+        // The reduced search beat the bound: verify at full depth, still with the null window
+        if (reduction > 0 && beats_bound(eval, alpha, beta, maximizingPlayer)) {
+            thread->stats.lmr_researches++;
+            eval = minimax_search(thread, &copy, depth - 1, zw_alpha, zw_beta, child, 0, !cut_node, moves[i]);
+        }
+
+        if (beats_bound(eval, alpha, beta, maximizingPlayer)) {
+            if (maximizingPlayer ? eval < beta : eval > alpha) {
+                // Inside the window: the exact score needs a full-window search, a PV search at
+                // a PV node (elsewhere the window is normally the null window already)
+                eval = minimax_search(thread, &copy, depth - 1, alpha, beta, child, pv_node, child_cut, moves[i]);
+            } else {
+                // Cut immediately
+                eval = maximizingPlayer ? beta : alpha;
+            }
+        }
+    }
+    thread->ply--;
+
+    *eval_out = eval;
+    return 1;
+}
+
+// A move raised the bound of the node at the current ply: its line is the move followed
+// by the child's line
+static void update_pv(SearchThread* thread, const char* move) {
+    int ply = thread->ply;
+    int child_length = thread->pv_length[ply + 1];
+    if (child_length > MAX_PLY - ply - 1) child_length = MAX_PLY - ply - 1;
+
+    strcpy(thread->pv_table[ply][0], move);
+    memcpy(thread->pv_table[ply][1], thread->pv_table[ply + 1][0], sizeof(thread->pv_table[0][0]) * child_length);
+    thread->pv_length[ply] = child_length + 1;
+}
+
+// Moves of a node searched without causing a cutoff, penalised if a later one does
+typedef struct {
+    const char* quiets[64];
+    int num_quiets;
+    const char* captures[64];
+    int num_captures;
+} TriedMoves;
+
+static void note_tried(TriedMoves* tried, const char* move, int is_capture) {
+    if (is_capture) {
+        if (tried->num_captures < 64) tried->captures[tried->num_captures++] = move;
+    } else {
+        if (tried->num_quiets < 64) tried->quiets[tried->num_quiets++] = move;
+    }
+}
+
+// A move that caused a cutoff is rewarded in the histories and the moves tried before it
+// are penalised; a quiet one also becomes a killer and the countermove
+static void record_cutoff(SearchThread* thread, Position* pos, int depth, const char* move, const char* last_move,
+                          int is_capture, const TriedMoves* tried) {
+    // Nothing tried before it: the first move searched (split points never hand that out)
+    thread->stats.beta_cutoffs++;
+    if (tried && tried->num_quiets + tried->num_captures == 0) {
+        thread->stats.first_move_cutoffs++;
+    }
+
+    if (!is_capture) {
+        update_quiet_histories(thread, pos, thread->ply, move, tried ? tried->quiets : NULL,
+                               tried ? tried->num_quiets : 0, depth);
+        add_killer_move(thread, thread->ply, move);
+        if (last_move) {
+            update_countermove(thread, pos, last_move, move);
         }
+    } else {
+        update_capture_history(thread, pos, move, tried ? tried->captures : NULL,
+                               tried ? tried->num_captures : 0, depth);
     }
+}
 
-    return maximizingPlayer ? alpha : beta;
+static void init_split_point(SearchThread* thread, SplitPoint* sp, Position* pos, char moves[][6], int num_moves, int depth,
+                             int maximizing, int pv_node, int cut_node, int do_futility_pruning, int lmp_limit, int improving,
+                             const char* last_move,
+                             float alpha, float beta, float best_eval, int best_index) {
+    sp->pos = *pos;
+    sp->moves = moves;
+    sp->num_moves = num_moves;
+    sp->depth = depth;
+    sp->maximizing = maximizing;
+    sp->pv_node = pv_node;
+    sp->cut_node = cut_node;
+    sp->do_futility_pruning = do_futility_pruning;
+    sp->lmp_limit = lmp_limit;
+    sp->improving = improving;
+    sp->last_move = last_move;
+    sp->alpha = alpha;
+    sp->beta = beta;
+    sp->best_eval = best_eval;
+    sp->best_index = best_index;
+    sp->next_move = 1;
+    sp->ply = thread->ply;
+    memcpy(sp->stack, thread->stack, sizeof(SearchStack) * (thread->ply + 1));
 }
 
 // MINIMAX + TT + QUIESCENCE + LATE MOVE REDUCTIONS + FUTILITY PRUNING + COUNTERMOVE
-float minimax_with_last_move(Position* pos, int depth, float alpha, float beta, int maximizingPlayer, const char* last_move) {
-    if (time_exceeded()) {
+float minimax_search(SearchThread* thread, Position* pos, int depth, float alpha, float beta, int maximizingPlayer,
+                     int pv_node, int cut_node, const char* last_move) {
+    thread->nodes++;
+    thread->pv_length[thread->ply] = 0;
+    if (time_exceeded() || node_limit_reached(thread) || split_cut(thread) || thread->ply >= MAX_PLY) {
         return evaluate_board(pos);
     }
     uint64_t hash = compute_zobrist_hash(pos);
+    SearchStack* ss = &thread->stack[thread->ply];
+    ss->key = hash;
+    ss->static_eval = EVAL_NONE;
+    ss->move[0] = '\0';
+
+    // DRAW DETECTION: path-dependent, so it must come before the TT probe
+    if (is_repetition(thread, pos, hash) || is_fifty_move_draw(pos) || is_insufficient_material(pos)) {
+        return DRAW_SCORE;
+    }
 
-    float cached_eval;
-    if (tt_lookup(hash, &cached_eval, depth)) {
-        return cached_eval;
+    // MATE DISTANCE PRUNING: nothing here can beat a mate already found closer to the root
+    float mated_score = MATE_SCORE - (thread->ply + 1);   // side to move is mated at this node
+    float mating_score = MATE_SCORE - (thread->ply + 2);  // side to move mates with its next move
+    if (maximizingPlayer) {
+        if (alpha < -mated_score) alpha = -mated_score;
+        if (beta > mating_score) beta = mating_score;
+        if (alpha >= beta) return alpha;
+    } else {
+        if (beta > mated_score) beta = mated_score;
+        if (alpha < -mating_score) alpha = -mating_score;
+        if (alpha >= beta) return beta;
+    }
+
+    float alpha_orig = alpha;
+    float beta_orig = beta;
+
+    // Shared TT: bounded scores only cut when they are valid for this window
+    TTHit tt_hit;
+    int tt_found = tt_probe(hash, &tt_hit);
+    thread->stats.tt_probes++;
+    if (tt_found) {
+        thread->stats.tt_hits++;
+        tt_hit.eval = score_from_tt(tt_hit.eval, thread->ply);
+    }
+    if (tt_found && tt_hit.depth >= depth) {
+        if (tt_hit.bound == TT_EXACT ||
+            (tt_hit.bound == TT_LOWER && tt_hit.eval >= beta) ||
+            (tt_hit.bound == TT_UPPER && tt_hit.eval <= alpha)) {
+            thread->stats.tt_cutoffs++;
+            return tt_hit.eval;
+        }
     }
 
     int in_check = is_in_check(pos, maximizingPlayer);
+    ss->in_check = in_check;
 
-    if (depth == 0 || is_game_over(pos)) {
-        float eval = quiescence(pos, alpha, beta, maximizingPlayer, depth);
-        tt_store(hash, eval, depth);
+    if (depth == 0) {
+        // Checkmate needs a check, so only then is a leaf worth a legal move generation
+        if (in_check) {
+            char evasions[256][6];
+            if (generate_legal_moves(pos, maximizingPlayer, evasions) == 0) {
+                float eval = maximizingPlayer ? -mated_score : mated_score;
+                store_result(thread, hash, eval, depth, alpha_orig, beta_orig, NULL);
+                return eval;
+            }
+        }
+        float eval = quiescence(thread, pos, alpha, beta, maximizingPlayer);
+        store_result(thread, hash, eval, depth, alpha_orig, beta_orig, NULL);
         return eval;
     }
 
+    // INTERNAL ITERATIVE REDUCTION: without a hash move the ordering is little better than
+    // random, so search this node a ply shallower. The next iteration reaches it again
+    // with the move this search stores. Only at PV and cut nodes, whose first good move
+    // matters: an all node searches every move whatever the order.
+    if ((pv_node || cut_node) && depth >= IIR_MIN_DEPTH && !(tt_found && tt_hit.move[0] != '\0')) {
+        depth--;
+        thread->stats.iir_reductions++;
+    }
+
+    // Static eval (meaningless when in check), evaluated once per position and cached in the TT
+    float static_eval = EVAL_NONE;
+    if (!in_check) {
+        static_eval = static_evaluate(pos, tt_found, &tt_hit);
+    }
+    ss->static_eval = static_eval;
+
+    // Improving: better than at our previous node (two plies up, or four if that one was in check)
+    int improving = 1;  // assume so when there is nothing to compare against
+    if (!in_check) {
+        float previous = EVAL_NONE;
+        if (thread->ply >= 2 && !thread->stack[thread->ply - 2].in_check) {
+            previous = thread->stack[thread->ply - 2].static_eval;
+        } else if (thread->ply >= 4) {
+            previous = thread->stack[thread->ply - 4].static_eval;
+        }
+        if (previous != EVAL_NONE) {
+            improving = maximizingPlayer ? static_eval > previous : static_eval < previous;
+        }
+    }
+    int have_static_eval = !in_check && depth <= RFP_MAX_DEPTH;
+    // Window lies entirely in mate range: a forced mate is already known, prune nothing on eval
+    int mate_window = (alpha >= MATE_BOUND || beta <= -MATE_BOUND);
+
+    // REVERSE FUTILITY PRUNING (static null move): the side to move is so far ahead
+    // that even after giving back a depth-scaled margin it still beats the window.
+    // Decided before any move is generated. Never at PV nodes, whose score is reported,
+    // however narrow their window.
+    if (have_static_eval && !pv_node && !mate_window) {
+        float rfp_margin = RFP_MARGIN_PER_DEPTH * depth;
+        if (maximizingPlayer && static_eval - rfp_margin >= beta) {
+            return static_eval - rfp_margin;
+        }
+        if (!maximizingPlayer && static_eval + rfp_margin <= alpha) {
+            return static_eval + rfp_margin;
+        }
+    }
+
+    // RAZORING: hopelessly behind at a shallow node, so only captures can save it.
+    // Drop into quiescence and trust it if it confirms the fail-low.
+    if (have_static_eval && !pv_node && !mate_window && depth <= RAZOR_MAX_DEPTH) {
+        float razor_margin = RAZOR_MARGIN_BASE + RAZOR_MARGIN_PER_DEPTH * depth;
+        if (maximizingPlayer && static_eval + razor_margin <= alpha) {
+            float eval = quiescence(thread, pos, alpha, beta, maximizingPlayer);
+            if (eval <= alpha) return eval;
+        }
+        if (!maximizingPlayer && static_eval - razor_margin >= beta) {
+            float eval = quiescence(thread, pos, alpha, beta, maximizingPlayer);
+            if (eval >= beta) return eval;
+        }
+    }
+
     // FUTILITY PRUNING: Check if static eval is hopeless
     // Only apply at low depths (1-2) with sufficient margin
-    float static_eval = -1.0f; // Invalid value
     int do_futility_pruning = 0;
     float futility_margin = 0.0f;
     
     if (!in_check && depth <= 2) {
-        static_eval = evaluate_board(pos);
         futility_margin = (depth == 1) ? 2.0f : 4.0f; // 2 pawns at depth 1, 4 at depth 2
         
         if (maximizingPlayer) {
@@ -162,6 +785,12 @@ float minimax_with_last_move(Position* pos, int depth, float alpha, float beta,
         }
     }
 
+    // Move-count limit for late move pruning (0 = off; never at PV nodes)
+    int lmp_limit = 0;
+    if (!in_check && !pv_node && !mate_window && depth <= LMP_MAX_DEPTH) {
+        lmp_limit = LMP_BASE + depth * depth;
+    }
+
     // NULL MOVE PRUNING
     if (!in_check && depth >= 4 && count_pieces(pos) > 10) {
         int reduction = (depth >= 6) ? 3 : 2;
@@ -169,177 +798,241 @@ float minimax_with_last_move(Position* pos, int depth, float alpha, float beta,
         null_pos.white_to_move = !pos->white_to_move;
         null_pos.ep_rank = -1;
         null_pos.ep_file = -1;
+        null_pos.halfmove_clock = 0;  // no repetition can span a null move
 
-        float null_eval = minimax_with_last_move(&null_pos, depth - 1 - reduction, alpha, beta, !maximizingPlayer, NULL);
+        ss->move[0] = '\0';  // null move
+        ss->piece = -1;
+        thread->stats.null_move_tries++;
+        thread->ply++;
+        float null_eval = minimax_search(thread, &null_pos, depth - 1 - reduction, alpha, beta, !maximizingPlayer, 0, !cut_node, NULL);
+        thread->ply--;
         if (maximizingPlayer && null_eval >= beta) {
-            tt_store(hash, beta, depth);
+            thread->stats.null_move_cutoffs++;
+            store_result(thread, hash, beta, depth, alpha_orig, beta_orig, NULL);
             return beta;
         } else if (!maximizingPlayer && null_eval <= alpha) {
-            tt_store(hash, alpha, depth);
+            thread->stats.null_move_cutoffs++;
+            store_result(thread, hash, alpha, depth, alpha_orig, beta_orig, NULL);
             return alpha;
         }
     }
 
-    char moves[256][6];
-    int num_moves = generate_legal_moves(pos, maximizingPlayer, moves);
-    
-    // Countermove heuristic: Try countermove first if available
-    if (last_move) {
-        const char* counter = get_countermove(last_move);
-        if (counter) {
-            for (int i = 0; i < num_moves; i++) {
-                if (strcmp(moves[i], counter) == 0 && i != 0) {
-                    // Move countermove to position 1 (after PV/TT move at position 0)
-                    char temp[6];
-                    strcpy(temp, moves[i]);
-                    for (int j = i; j > 1; j--) {
-                        strcpy(moves[j], moves[j-1]);
-                    }
-                    if (num_moves > 1) strcpy(moves[1], temp);
-                    break;
+    // PROBCUT
+    if (!in_check && !pv_node && !mate_window && depth >= PROBCUT_MIN_DEPTH &&
+        (maximizingPlayer ? beta < MATE_BOUND : alpha > -MATE_BOUND)) {
+        float probcut_bound = maximizingPlayer ? beta + PROBCUT_MARGIN : alpha - PROBCUT_MARGIN;
+
+        // Skip it when the TT already has a deep enough score that falls short of the bound
+        int tt_says_no = tt_found && tt_hit.depth >= depth - PROBCUT_REDUCTION + 1 &&
+            (maximizingPlayer ? tt_hit.eval < probcut_bound : tt_hit.eval > probcut_bound);
+
+        if (!tt_says_no) {
+            char captures[256][6];
+            int num_captures = generate_capture_moves(pos, maximizingPlayer, captures);
+            // Material a capture must win to lift the static eval to the bound
+            float see_threshold = maximizingPlayer ? probcut_bound - static_eval : static_eval - probcut_bound;
+
+            for (int i = 0; i < num_captures; i++) {
+                if (see(pos, captures[i]) < see_threshold) continue;
+
+                Position copy = *pos;
+                make_move(&copy, captures[i]);
+                if (is_in_check(&copy, maximizingPlayer)) continue;  // captures are pseudo-legal
+
+                thread->stats.probcut_tries++;
+                push_move(thread, pos, captures[i]);
+                thread->ply++;
+                float eval = maximizingPlayer
+                    ? minimax_search(thread, &copy, depth - PROBCUT_REDUCTION, probcut_bound - NULL_WINDOW, probcut_bound, 0, 0, !cut_node, captures[i])
+                    : minimax_search(thread, &copy, depth - PROBCUT_REDUCTION, probcut_bound, probcut_bound + NULL_WINDOW, 1, 0, !cut_node, captures[i]);
+                thread->ply--;
+
+                if (maximizingPlayer ? eval >= probcut_bound : eval <= probcut_bound) {
+                    thread->stats.probcut_cutoffs++;
+                    store_result(thread, hash, eval, depth - PROBCUT_REDUCTION + 1, alpha_orig, beta_orig, captures[i]);
+                    return eval;
                 }
             }
         }
     }
+
+    char moves[256][6];
+    int num_moves = generate_legal_moves(pos, maximizingPlayer, moves);
     
-    sort_moves(pos, moves, num_moves, depth);
+    // Score every move once; each is picked in order only when the loop reaches it.
+    // The hash move (best move found by any thread here) comes first, the countermove
+    // right after the killers.
+    int scores[256];
+    score_moves(thread, pos, moves, scores, num_moves, thread->ply,
+                tt_found ? tt_hit.move : NULL, get_countermove(thread, pos, last_move));
 
-    if (num_moves == 0) { // No moves → game might be over
-        float eval = evaluate_board(pos);
-        tt_store(hash, eval, depth);
+    if (num_moves == 0) { // No moves: checkmate (scored by distance from the root) or stalemate
+        float eval = in_check ? (maximizingPlayer ? -mated_score : mated_score) : DRAW_SCORE;
+        store_result(thread, hash, eval, depth, alpha_orig, beta_orig, NULL);
         return eval;
     }
 
+    // Search order: move indices, with deferred (ABDADA) moves appended for a second pass
+    int order[512];
+    int order_len = num_moves;
+    for (int i = 0; i < num_moves; i++) {
+        order[i] = i;
+    }
+
+    TriedMoves tried = { .num_quiets = 0, .num_captures = 0 };
+
     if (maximizingPlayer) {
         float max_eval = -10000.0f;
-        for (int i = 0; i < num_moves; i++) {
-            Position copy = *pos; // Copy of stack
-            
-            // Check if this is a capture or tactical move
-            int to_file = moves[i][2] - 'a';
-            int to_rank = '8' - moves[i][3];
-            Piece victim = copy.board[to_rank][to_file];
-            int is_capture = (victim.type != 0);
-            
-            // FUTILITY PRUNING: Skip quiet moves when position is hopeless
-            if (do_futility_pruning && !is_capture) {
-                continue; // Skip this quiet move
+        int best_index = -1;
+        for (int k = 0; k < order_len; k++) {
+            int i = order[k];
+            if (k < num_moves) {
+                pick_move(moves, scores, num_moves, k);
             }
-            
-            make_move(&copy, moves[i]);
-
-            // LATE MOVE REDUCTIONS (LMR):
-            // After first 4 moves at depth>=3, reduce depth for quiet moves
-            int search_depth = depth - 1;
-            int needs_full_search = 0;
-            
-            if (i >= 4 && depth >= 3 && !is_capture) {
-                // Reduce depth by 1 for late quiet moves
-                search_depth = depth - 2;
-                needs_full_search = 1;
-            }
-            
-            float eval;
-            if (i == 0) {
-                eval = minimax_with_last_move(&copy, search_depth, alpha, beta, 0, moves[i]);
-            } else if (!is_capture) {
-                // PVS: try zero-width window first
-                eval = minimax_with_last_move(&copy, search_depth, alpha, alpha + 1, 0, moves[i]);
-                if (eval > alpha && eval < beta) {
-                    eval = minimax_with_last_move(&copy, search_depth, alpha, beta, 0, moves[i]);
-                } else if (eval >= beta) {
-                    // Cut immediately
-                    eval = beta;
+
+            // YOUNG BROTHERS WAIT: the eldest move is searched, share the rest
+            if (k == 1 && split_can_split(thread, depth)) {
+                // Helpers take moves by index, so the rest must be in order up front
+                for (int j = 2; j < num_moves; j++) {
+                    pick_move(moves, scores, num_moves, j);
                 }
-            } else {
-                eval = minimax_with_last_move(&copy, search_depth, alpha, beta, 0, moves[i]);
+                SplitPoint* sp = split_point_alloc(thread);
+                init_split_point(thread, sp, pos, moves, num_moves, depth, 1, pv_node, cut_node, do_futility_pruning, lmp_limit, improving, last_move,
+                                 alpha, beta, max_eval, best_index);
+                split_run(thread, sp);
+                max_eval = sp->best_eval;
+                if (sp->best_index >= 0 && sp->best_index != best_index) {
+                    // Found by whichever thread searched it; only the move itself is known here
+                    thread->pv_length[thread->ply + 1] = 0;
+                    update_pv(thread, moves[sp->best_index]);
+                }
+                best_index = sp->best_index;
+                break;
             }
-            
-            // If LMR search raised alpha, re-search at full depth
-            if (needs_full_search && eval > alpha) {
-                eval = minimax_with_last_move(&copy, depth - 1, alpha, beta, 0, moves[i]);
+
+            // ABDADA: another thread is already searching this child, come back to it later
+            if (k > 0 && k < num_moves && tt_defer_move(hash, moves[i], depth)) {
+                order[order_len++] = i;
+                thread->stats.deferred_moves++;
+                continue;
             }
 
-            if (eval > max_eval) max_eval = eval;
-            if (eval > alpha) alpha = eval;
+            float eval;
+            int is_capture;
+            tt_searching_start(hash, moves[i], depth);
+            int searched = search_child(thread, pos, moves, i, depth, alpha, beta, 1, pv_node, cut_node, do_futility_pruning, lmp_limit, improving, &eval, &is_capture);
+            tt_searching_finish(hash, moves[i], depth);
+            if (!searched) {
+                continue; // Pruned quiet move
+            }
+
+            if (eval > max_eval) {
+                max_eval = eval;
+                best_index = i;
+            }
+            if (eval > alpha) {
+                alpha = eval;
+                update_pv(thread, moves[i]);
+            }
             if (beta <= alpha) { // Beta cut-off
-                if (!is_capture) { // Quiet move caused cutoff
-                    update_history(moves[i], depth);
-                    add_killer_move(depth, moves[i]);
-                    if (last_move) {
-                        update_countermove(last_move, moves[i]);
-                    }
-                }
+                record_cutoff(thread, pos, depth, moves[i], last_move, is_capture, &tried);
                 break;
             }
+            note_tried(&tried, moves[i], is_capture);
         }
-        tt_store(hash, max_eval, depth);
+        store_result(thread, hash, max_eval, depth, alpha_orig, beta_orig, best_index >= 0 ? moves[best_index] : NULL);
         return max_eval;
     } else {
         float min_eval = 10000.0f;
-        for (int i = 0; i < num_moves; i++) {
-            Position copy = *pos;
-            
-            // Check if this is a capture or tactical move
-            int to_file = moves[i][2] - 'a';
-            int to_rank = '8' - moves[i][3];
-            Piece victim = copy.board[to_rank][to_file];
-            int is_capture = (victim.type != 0);
-            
-            // FUTILITY PRUNING: Skip quiet moves when position is hopeless
-            if (do_futility_pruning && !is_capture) {
-                continue; // Skip this quiet move
-            }
-            
-            make_move(&copy, moves[i]);
-
-            // LATE MOVE REDUCTIONS (LMR) for minimizing player
-            int search_depth = depth - 1;
-            int needs_full_search = 0;
-            
-            if (i >= 4 && depth >= 3 && !is_capture) {
-                search_depth = depth - 2;
-                needs_full_search = 1;
+        int best_index = -1;
+        for (int k = 0; k < order_len; k++) {
+            int i = order[k];
+            if (k < num_moves) {
+                pick_move(moves, scores, num_moves, k);
             }
-            
-            float eval;
-            if (i == 0) {
-                eval = minimax_with_last_move(&copy, search_depth, alpha, beta, 1, moves[i]);
-            } else if (!is_capture) {
-                // PVS window
-                eval = minimax_with_last_move(&copy, search_depth, beta - 1, beta, 1, moves[i]);
-                if (eval < beta && eval > alpha) {
-                    eval = minimax_with_last_move(&copy, search_depth, alpha, beta, 1, moves[i]);
-                } else if (eval <= alpha) {
-                    eval = alpha;
+
+            // YOUNG BROTHERS WAIT: the eldest move is searched, share the rest
+            if (k == 1 && split_can_split(thread, depth)) {
+                // Helpers take moves by index, so the rest must be in order up front
+                for (int j = 2; j < num_moves; j++) {
+                    pick_move(moves, scores, num_moves, j);
                 }
-            } else {
-                eval = minimax_with_last_move(&copy, search_depth, alpha, beta, 1, moves[i]);
+                SplitPoint* sp = split_point_alloc(thread);
+                init_split_point(thread, sp, pos, moves, num_moves, depth, 0, pv_node, cut_node, do_futility_pruning, lmp_limit, improving, last_move,
+                                 alpha, beta, min_eval, best_index);
+                split_run(thread, sp);
+                min_eval = sp->best_eval;
+                if (sp->best_index >= 0 && sp->best_index != best_index) {
+                    // Found by whichever thread searched it; only the move itself is known here
+                    thread->pv_length[thread->ply + 1] = 0;
+                    update_pv(thread, moves[sp->best_index]);
+                }
+                best_index = sp->best_index;
+                break;
+            }
+
+            // ABDADA: another thread is already searching this child, come back to it later
+            if (k > 0 && k < num_moves && tt_defer_move(hash, moves[i], depth)) {
+                order[order_len++] = i;
+                thread->stats.deferred_moves++;
+                continue;
             }
-            
-            // If LMR search lowered beta, re-search at full depth
-            if (needs_full_search && eval < beta) {
-                eval = minimax_with_last_move(&copy, depth - 1, alpha, beta, 1, moves[i]);
+
+            float eval;
+            int is_capture;
+            tt_searching_start(hash, moves[i], depth);
+            int searched = search_child(thread, pos, moves, i, depth, alpha, beta, 0, pv_node, cut_node, do_futility_pruning, lmp_limit, improving, &eval, &is_capture);
+            tt_searching_finish(hash, moves[i], depth);
+            if (!searched) {
+                continue; // Pruned quiet move
             }
 
-            if (eval < min_eval) min_eval = eval;
-            if (eval < beta) beta = eval;
+            if (eval < min_eval) {
+                min_eval = eval;
+                best_index = i;
+            }
+            if (eval < beta) {
+                beta = eval;
+                update_pv(thread, moves[i]);
+            }
             if (beta <= alpha) { // Alpha cut-off
-                if (!is_capture) { // Quiet move caused cutoff
-                    update_history(moves[i], depth);
-                    add_killer_move(depth, moves[i]);
-                    if (last_move) {
-                        update_countermove(last_move, moves[i]);
-                    }
-                }
+                record_cutoff(thread, pos, depth, moves[i], last_move, is_capture, &tried);
                 break;
             }
+            note_tried(&tried, moves[i], is_capture);
         }
-        tt_store(hash, min_eval, depth);
+        store_result(thread, hash, min_eval, depth, alpha_orig, beta_orig, best_index >= 0 ? moves[best_index] : NULL);
         return min_eval;
     }
 }
 
+// Search the siblings of a split point until none are left or one fails high.
+// Called by the owner and by every helper that joined it.
+void minimax_split_point_work(SearchThread* thread, SplitPoint* sp) {
+    int i;
+    float alpha, beta;
+    while (split_next_move(sp, &i, &alpha, &beta)) {
+        float eval;
+        int is_capture;
+        if (!search_child(thread, &sp->pos, sp->moves, i, sp->depth, alpha, beta, sp->maximizing, sp->pv_node, sp->cut_node,
+                          sp->do_futility_pruning, sp->lmp_limit, sp->improving, &eval, &is_capture)) {
+            continue;
+        }
+        // Scores from an aborted subtree are meaningless
+        if (search_aborted(thread)) {
+            break;
+        }
+        if (split_report(sp, i, eval)) {
+            record_cutoff(thread, &sp->pos, sp->depth, sp->moves[i], sp->last_move, is_capture, NULL);
+        }
+    }
+}
+
+// Single-threaded entry point - searches with the main thread's state (pool slot 0), as a PV node
+float minimax_with_last_move(Position* pos, int depth, float alpha, float beta, int maximizingPlayer, const char* last_move) {
+    return minimax_search(thread_pool_thread(0), pos, depth, alpha, beta, maximizingPlayer, 1, 0, last_move);
+}
+
 // Backward compatibility wrapper - calls minimax_with_last_move with NULL
 float minimax(Position* pos, int depth, float alpha, float beta, int maximizingPlayer) {
     return minimax_with_last_move(pos, depth, alpha, beta, maximizingPlayer, NULL);
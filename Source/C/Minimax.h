@@ -10,10 +10,56 @@
 #define MINIMAX_H
 
 #include "Board.h"
+#include "ThreadPool.h"
+#include "SplitPoint.h"
+
+// Score of a drawn position (repetition, fifty-move rule, insufficient material)
+#define DRAW_SCORE 0.0f
+
+// Mate scores: MATE_SCORE - n means the side it favours mates n plies from the root.
+// Anything beyond MATE_BOUND is a mate; INFINITE_SCORE is only used as a window bound.
+#define INFINITE_SCORE 10000.0f
+#define MATE_SCORE 9000.0f
+#define MATE_BOUND (MATE_SCORE - 2 * MAX_PLY)
+
+// Width of the PVS null window. Scores are float pawns, so it is a small fraction of a
+// pawn: a one-pawn "zero" window would still have room for real scores inside it.
+#define NULL_WINDOW 0.01f
+
+// Placeholder for a node without a static eval (in check)
+#define EVAL_NONE (-2.0f * INFINITE_SCORE)
+
+// Game positions kept for repetition detection
+#define MAX_GAME_PLIES 1024
 
 float minimax(Position* pos, int depth, float alpha, float beta, int maximizingPlayer);
+// `pv_node`: the node lies on the principal variation (searched with the full window, its
+// score is reported). Null-window searches are never PV nodes, whatever their width.
+// `cut_node`: a non-PV node expected to fail high; the other non-PV nodes are all nodes.
+float minimax_search(SearchThread* thread, Position* pos, int depth, float alpha, float beta, int maximizingPlayer,
+                     int pv_node, int cut_node, const char* last_move);
 float minimax_with_last_move(Position* pos, int depth, float alpha, float beta, int maximizingPlayer, const char* last_move);
 void minimax_set_time_limit(double start_ms, double limit_ms);
 void minimax_clear_time_limit(void);
 
+// Fraction of the current time limit used so far, 0 without a limit
+double minimax_time_used(void);
+
+// Stop the current search after `max_nodes` nodes over its first `num_threads` workers
+// (0 = no limit)
+void minimax_set_node_limit(uint64_t max_nodes, int num_threads);
+
+// Game history (Zobrist keys up to and including the current position) and per-search setup
+void minimax_set_game_history(const uint64_t* keys, int count);
+void minimax_new_search(Position* root);
+
+// Abort flag shared by all search threads
+void minimax_request_stop(void);
+void minimax_clear_stop(void);
+int minimax_stop_requested(void);
+int minimax_search_aborted(void);
+
+// Young Brothers Wait: search siblings of a shared node (owner and helpers)
+void minimax_split_point_work(SearchThread* thread, SplitPoint* sp);
+
 #endif
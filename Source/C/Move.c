@@ -9,6 +9,17 @@
 #include <stdlib.h>
 #include "Move.h"
 
+int is_capture_move(const Position* pos, const char* move) {
+    int from_file = move[0] - 'a';
+    int from_rank = '8' - move[1];
+    int to_file   = move[2] - 'a';
+    int to_rank   = '8' - move[3];
+
+    if (pos->board[to_rank][to_file].type != 0) return 1;
+    return pos->board[from_rank][from_file].type == 'p' && to_file != from_file &&
+           to_rank == pos->ep_rank && to_file == pos->ep_file;
+}
+
 void make_move(Position* pos, const char* move) {
     int from_file = move[0] - 'a';
     int from_rank = '8' - move[1];
@@ -102,6 +113,13 @@ void make_move(Position* pos, const char* move) {
         }
     }
 
+    // Fifty-move rule: captures and pawn moves reset the clock
+    if (moving.type == 'p' || captured.type != 0) {
+        pos->halfmove_clock = 0;
+    } else {
+        pos->halfmove_clock++;
+    }
+
     // En passant handling
     if (moving.type == 'p' && abs(to_rank - from_rank) == 2) {
         pos->ep_rank = (from_rank + to_rank) / 2;
@@ -27,6 +27,9 @@ typedef struct {
 } MoveInfo;
 
 void make_move(Position* pos, const char* move);
+
+// Does `move` capture? En passant also does, landing on the empty en passant square.
+int is_capture_move(const Position* pos, const char* move);
 void undo_move(Position* pos, const MoveInfo* info);
 
 #endif
@@ -391,17 +391,32 @@ static int generate_pawn_capture_moves(Position* pos, int rank, int file, char m
     int dir = is_white ? -1 : 1;
     int next_rank = rank + dir;
 
-    // Normal diagonal captures
+    int promotion_rank = is_white ? 0 : 7;
+
+    // Normal diagonal captures (promoting to a queen on the last rank)
     for (int df = -1; df <= 1; df += 2) {
         int new_file = file + df;
         if (new_file >= 0 && new_file < 8 && next_rank >= 0 && next_rank < 8) {
             Piece target = board[next_rank][new_file];
             if (target.type != 0 && target.is_white != is_white) {
-                square_to_uci(rank, file, next_rank, new_file, moves[move_index++]);
+                square_to_uci(rank, file, next_rank, new_file, moves[move_index]);
+                if (next_rank == promotion_rank) {
+                    moves[move_index][4] = 'q';
+                    moves[move_index][5] = '\0';
+                }
+                move_index++;
             }
         }
     }
 
+    // Quiet queen promotion: as tactical as a capture
+    if (next_rank == promotion_rank && board[next_rank][file].type == 0) {
+        square_to_uci(rank, file, next_rank, file, moves[move_index]);
+        moves[move_index][4] = 'q';
+        moves[move_index][5] = '\0';
+        move_index++;
+    }
+
     // En passant
     if (pos->ep_rank != -1 && pos->ep_file != -1) {
         if (rank == (is_white ? 3 : 4) &&
@@ -10,24 +10,37 @@
 #include <string.h>
 #include "Ordering.h"
 #include "KillerMoves.h"
+#include "Move.h"
 
-// History table for move ordering (quiet moves)
-int history_table[64][64] = {0};
+// History tables for move ordering (all per thread, in SearchThread):
+//   history_table[from_sq][to_sq]                     quiet moves (butterfly)
+//   capture_history[piece][to_sq][captured]           captures, on top of MVV-LVA
+//   continuation_history[prev piece][prev to][piece][to_sq]
+//                                                     quiet moves following the moves made
+//                                                     one and two plies earlier
+// Countermove table: SearchThread.countermove_table[prev piece][prev to] -> response_move
 
-// Countermove table: stores best response to each move [from_sq][to_sq] -> response_move
-char countermove_table[64][64][6] = {{{0}}};
+// Largest single history update (reached at depth 8)
+#define HISTORY_BONUS_MAX 2048
 
-// Global pointer (for qsort)
-static Position* current_pos = NULL;
+// Ordering bands: the hash move, then captures (MVV-LVA), killers, the countermove and
+// finally the remaining quiet moves by history score. A quiet move's history (butterfly +
+// two continuation entries) stays within +-3 * HISTORY_MAX, so the bands are spaced more
+// than twice that apart and history only orders moves inside their own band
+#define HASH_MOVE_SCORE   1000000
+#define CAPTURE_SCORE     500000
+#define KILLER_SCORE      300000
+#define COUNTERMOVE_SCORE 150000
 
 // Piece values for MVV-LVA (Most Valuable Victim - Least Valuable Attacker) (p, n, b, r, q, k)
+// Indexed [victim][attacker]: 100 per victim class, the attacker only breaks ties
 static const int mvv_lva[6][6] = {
-    {105, 205, 305, 405, 505, 605}, // victim = pawn
-    {104, 204, 304, 404, 504, 604}, // victim = knight
-    {103, 203, 303, 403, 503, 603}, // victim = bishop
-    {102, 202, 302, 402, 502, 602}, // victim = rook
-    {101, 201, 301, 401, 501, 601}, // victim = queen
-    {100, 200, 300, 400, 500, 600}  // victim = king
+    {105, 104, 103, 102, 101, 100}, // victim = pawn
+    {205, 204, 203, 202, 201, 200}, // victim = knight
+    {305, 304, 303, 302, 301, 300}, // victim = bishop
+    {405, 404, 403, 402, 401, 400}, // victim = rook
+    {505, 504, 503, 502, 501, 500}, // victim = queen
+    {605, 604, 603, 602, 601, 600}  // victim = king
 };
 
 // Piece index mapping for mvv_lva
@@ -44,96 +57,190 @@ static int piece_index(char type) {
     }
 }
 
+int piece_slot(Piece piece) {
+    return piece_index(piece.type) + (piece.is_white ? 6 : 0);
+}
+
+// Continuation history of a quiet move (piece, to_sq) after the move made `back` plies
+// above `ply`; 0 when there is no such move (root, null move)
+static int continuation_score(SearchThread* thread, int ply, int back, int piece, int to_sq) {
+    if (ply - back < 0) return 0;
+    SearchStack* previous = &thread->stack[ply - back];
+    if (previous->piece < 0) return 0;
+    return thread->continuation_history[previous->piece][previous->to][piece][to_sq];
+}
+
 // Calculate the score of a move based on MVV-LVA
-static int move_score(const char* move, int depth) {
+static int move_score(SearchThread* thread, Position* pos, int ply, const char* move, const char* countermove) {
     int from_file = move[0] - 'a';
     int from_rank = '8' - move[1];
     int to_file   = move[2] - 'a';
     int to_rank   = '8' - move[3];
+    int from_sq = from_rank * 8 + from_file;
+    int to_sq   = to_rank * 8 + to_file;
 
-    Piece attacker = current_pos->board[from_rank][from_file];
-    Piece victim   = current_pos->board[to_rank][to_file];
+    Piece attacker = pos->board[from_rank][from_file];
+    Piece victim   = pos->board[to_rank][to_file];
 
-    if (victim.type != 0) {
-        // Capture → MVV-LVA
-        return mvv_lva[piece_index(victim.type)][piece_index(attacker.type)] + 100000;
+    if (is_capture_move(pos, move)) {
+        // Capture → MVV-LVA, refined by how such captures have fared. Capture history is
+        // bounded by +-32 so that, with the attacker term, it never crosses a victim class
+        // (en passant takes a pawn and has no capture history, see update_capture)
+        if (victim.type == 0) return mvv_lva[0][0] + CAPTURE_SCORE;
+        return mvv_lva[piece_index(victim.type)][piece_index(attacker.type)] + CAPTURE_SCORE
+             + thread->capture_history[piece_slot(attacker)][to_sq][piece_index(victim.type)] / 512;
     } else {
-        // Quiet move → history + killer bonus + countermove bonus
-        int from_sq = from_rank * 8 + from_file;
-        int to_sq   = to_rank * 8 + to_file;
-        int score   = history_table[from_sq][to_sq];
-
-        for (int i = 0; i < 2; i++) { // iki killer move tutuluyor
-            if (strcmp(killer_moves[depth][i], move) == 0) {
-                score += 90000; // killer move bonus
-                break;
-            }
+        // Quiet move → history (butterfly + continuation) + killer or countermove bonus
+        int piece = piece_slot(attacker);
+        int score = thread->history_table[from_sq][to_sq]
+                  + continuation_score(thread, ply, 1, piece, to_sq)
+                  + continuation_score(thread, ply, 2, piece, to_sq);
+
+        if (is_killer_move(thread, ply, move)) {
+            score += KILLER_SCORE; // killer move bonus
+        } else if (countermove && strcmp(move, countermove) == 0) {
+            // After the killers, however good its history
+            score += COUNTERMOVE_SCORE;
+            if (score >= KILLER_SCORE) score = KILLER_SCORE - 1;
         }
         return score;
     }
 }
 
-#ifdef _WIN32
+void score_moves(SearchThread* thread, Position* pos, char moves[][6], int scores[], int num_moves, int ply,
+                 const char* hash_move, const char* countermove) {
+    for (int i = 0; i < num_moves; i++) {
+        if (hash_move && strcmp(moves[i], hash_move) == 0) {
+            scores[i] = HASH_MOVE_SCORE;
+            continue;
+        }
+        scores[i] = move_score(thread, pos, ply, moves[i], countermove);
+    }
+}
 
-// Compare function for qsort to order moves based on their score
-// Higher scores come first, so we sort in descending order.
-static int compare_moves_win(void *depth_ptr, const void *a, const void *b) {
-    int depth = *(int*)depth_ptr;
-    const char* move_a = (const char*)a;
-    const char* move_b = (const char*)b;
+void pick_move(char moves[][6], int scores[], int num_moves, int index) {
+    int best = index;
+    for (int i = index + 1; i < num_moves; i++) {
+        if (scores[i] > scores[best]) {
+            best = i;
+        }
+    }
+    if (best != index) {
+        char temp_move[6];
+        memcpy(temp_move, moves[index], 6);
+        memcpy(moves[index], moves[best], 6);
+        memcpy(moves[best], temp_move, 6);
+
+        int temp_score = scores[index];
+        scores[index] = scores[best];
+        scores[best] = temp_score;
+    }
+}
 
-    int score_a = move_score(move_a, depth);
-    int score_b = move_score(move_b, depth);
+// Sort moves using MVV-LVA heuristic (stable insertion sort on precomputed scores)
+void sort_moves(SearchThread* thread, Position *pos, char moves[][6], int num_moves, int ply) {
+    int scores[256];
+    score_moves(thread, pos, moves, scores, num_moves, ply, NULL, NULL);
+
+    for (int i = 1; i < num_moves; i++) {
+        char move[6];
+        memcpy(move, moves[i], 6);
+        int score = scores[i];
+        int j = i - 1;
+        while (j >= 0 && scores[j] < score) {
+            memcpy(moves[j + 1], moves[j], 6);
+            scores[j + 1] = scores[j];
+            j--;
+        }
+        memcpy(moves[j + 1], move, 6);
+        scores[j + 1] = score;
+    }
+}
 
-    return score_b - score_a; // Higher score first
+static int square_of(const char* square) {
+    return ('8' - square[1]) * 8 + (square[0] - 'a');
 }
 
-// Sort moves using MVV-LVA heuristic
-void sort_moves(Position *pos, char moves[][6], int num_moves, int depth) {
-    current_pos = pos;
-    qsort_s(moves, num_moves, sizeof(moves[0]), compare_moves_win, &depth);
+static int history_bonus(int depth) {
+    int bonus = 32 * depth * depth;
+    return bonus < HISTORY_BONUS_MAX ? bonus : HISTORY_BONUS_MAX;
 }
 
-#else
+// Gravity: move the entry by `bonus`, scaled down the closer it already is to the bound
+static int history_gravity(int entry, int bonus) {
+    return entry + bonus - entry * abs(bonus) / HISTORY_MAX;
+}
 
-// Compare function for qsort to order moves based on their score
-// Higher scores come first, so we sort in descending order.
-static int compare_moves_unix(const void* a, const void* b, void* depth_ptr) {
-    int depth = *(int*)depth_ptr;
-    const char* move_a = (const char*)a;
-    const char* move_b = (const char*)b;
+static void update_quiet_move(SearchThread* thread, Position* pos, int ply, const char* move, int bonus) {
+    int from_sq = square_of(move);
+    int to_sq = square_of(move + 2);
+    int piece = piece_slot(pos->board[from_sq / 8][from_sq % 8]);
 
-    int score_a = move_score(move_a, depth);
-    int score_b = move_score(move_b, depth);
+    int* entry = &thread->history_table[from_sq][to_sq];
+    *entry = history_gravity(*entry, bonus);
 
-    return score_b - score_a; // Higher score first
+    for (int back = 1; back <= 2 && ply - back >= 0; back++) {
+        SearchStack* previous = &thread->stack[ply - back];
+        if (previous->piece < 0) break;
+        int16_t* cont = &thread->continuation_history[previous->piece][previous->to][piece][to_sq];
+        *cont = (int16_t)history_gravity(*cont, bonus);
+    }
 }
 
-// Sort moves using MVV-LVA heuristic
-void sort_moves(Position *pos, char moves[][6], int num_moves, int depth) {
-    current_pos = pos;
-    qsort_r(moves, num_moves, sizeof(moves[0]), compare_moves_unix, &depth);
+void update_quiet_histories(SearchThread* thread, Position* pos, int ply, const char* best_move,
+                            const char* const tried[], int num_tried, int depth) {
+    int bonus = history_bonus(depth);
+    update_quiet_move(thread, pos, ply, best_move, bonus);
+    for (int i = 0; i < num_tried; i++) {
+        update_quiet_move(thread, pos, ply, tried[i], -bonus);
+    }
 }
 
-#endif
+static void update_capture(SearchThread* thread, Position* pos, const char* move, int bonus) {
+    int from_sq = square_of(move);
+    int to_sq = square_of(move + 2);
+    Piece victim = pos->board[to_sq / 8][to_sq % 8];
+    if (victim.type == 0) return; // en passant: too rare to track
 
-// Update the history table for the given move
-// The depth is used to scale the history score.
-void update_history(const char* move, int depth) {
-    int from_file = move[0] - 'a';
-    int from_rank = '8' - move[1];
-    int to_file   = move[2] - 'a';
-    int to_rank   = '8' - move[3];
+    int16_t* entry = &thread->capture_history[piece_slot(pos->board[from_sq / 8][from_sq % 8])][to_sq][piece_index(victim.type)];
+    *entry = (int16_t)history_gravity(*entry, bonus);
+}
 
-    int from_sq = from_rank * 8 + from_file;
-    int to_sq = to_rank * 8 + to_file;
+void update_capture_history(SearchThread* thread, Position* pos, const char* best_move,
+                            const char* const tried[], int num_tried, int depth) {
+    int bonus = history_bonus(depth);
+    update_capture(thread, pos, best_move, bonus);
+    for (int i = 0; i < num_tried; i++) {
+        update_capture(thread, pos, tried[i], -bonus);
+    }
+}
+
+// History score of a quiet move for this thread
+int get_history(SearchThread* thread, const char* move) {
+    int from_sq = ('8' - move[1]) * 8 + (move[0] - 'a');
+    int to_sq = ('8' - move[3]) * 8 + (move[2] - 'a');
+    return thread->history_table[from_sq][to_sq];
+}
 
-    history_table[from_sq][to_sq] += depth * depth; // depth squared for better scaling
+// Merge the quiet-move history tables of the first `count` workers.
+// Called once per search, after every worker has finished: each thread sorts with its own
+// table throughout the search and starts the next search from the shared average.
+// Capture and continuation histories stay per-thread. Continuation history alone is
+// about 1.2MB per thread, so averaging it would cost more than a short search.
+// Capture history only shifts the MVV-LVA score by up to +-32, so sharing it would
+// change little.
+void merge_history_tables(int count) {
+    if (count < 2) return;
 
-    if (history_table[from_sq][to_sq] > 1000000) {
-        for (int i = 0; i < 64; i++) {
-            for (int j = 0; j < 64; j++) {
-                history_table[i][j] /= 2;
+    for (int from_sq = 0; from_sq < 64; from_sq++) {
+        for (int to_sq = 0; to_sq < 64; to_sq++) {
+            long sum = 0;
+            for (int t = 0; t < count; t++) {
+                sum += thread_pool_thread(t)->history_table[from_sq][to_sq];
+            }
+            int avg = (int)(sum / count);
+            for (int t = 0; t < count; t++) {
+                thread_pool_thread(t)->history_table[from_sq][to_sq] = avg;
             }
         }
     }
@@ -141,36 +248,28 @@ void update_history(const char* move, int depth) {
 
 // Update the countermove table
 // Records which move works well as a response to the previous move
-void update_countermove(const char* previous_move, const char* response_move) {
+void update_countermove(SearchThread* thread, Position* pos, const char* previous_move, const char* response_move) {
     if (!previous_move || !response_move) return;
-    
-    int prev_from_file = previous_move[0] - 'a';
-    int prev_from_rank = '8' - previous_move[1];
-    int prev_to_file   = previous_move[2] - 'a';
-    int prev_to_rank   = '8' - previous_move[3];
-    
-    int prev_from_sq = prev_from_rank * 8 + prev_from_file;
-    int prev_to_sq   = prev_to_rank * 8 + prev_to_file;
-    
+
+    // The piece that made the previous move now stands on its destination
+    int prev_to_sq = square_of(previous_move + 2);
+    Piece mover = pos->board[prev_to_sq / 8][prev_to_sq % 8];
+    if (mover.type == 0) return;
+
     // Store the response move as the countermove
-    strncpy(countermove_table[prev_from_sq][prev_to_sq], response_move, 5);
-    countermove_table[prev_from_sq][prev_to_sq][5] = '\0';
+    char* slot = thread->countermove_table[piece_slot(mover)][prev_to_sq];
+    strncpy(slot, response_move, 5);
+    slot[5] = '\0';
 }
 
 // Get the countermove for a given move
-const char* get_countermove(const char* previous_move) {
+const char* get_countermove(SearchThread* thread, Position* pos, const char* previous_move) {
     if (!previous_move) return NULL;
-    
-    int prev_from_file = previous_move[0] - 'a';
-    int prev_from_rank = '8' - previous_move[1];
-    int prev_to_file   = previous_move[2] - 'a';
-    int prev_to_rank   = '8' - previous_move[3];
-    
-    int prev_from_sq = prev_from_rank * 8 + prev_from_file;
-    int prev_to_sq   = prev_to_rank * 8 + prev_to_file;
-    
-    if (countermove_table[prev_from_sq][prev_to_sq][0] != '\0') {
-        return countermove_table[prev_from_sq][prev_to_sq];
-    }
-    return NULL;
+
+    int prev_to_sq = square_of(previous_move + 2);
+    Piece mover = pos->board[prev_to_sq / 8][prev_to_sq % 8];
+    if (mover.type == 0) return NULL;
+
+    const char* countermove = thread->countermove_table[piece_slot(mover)][prev_to_sq];
+    return countermove[0] != '\0' ? countermove : NULL;
 }
@@ -10,17 +10,45 @@
 #define ORDERING_H
 
 #include "Board.h"
+#include "ThreadPool.h"
 
-// Sort moves using MVV-LVA (Most Valuable Victim - Least Valuable Attacker) heuristic
-void sort_moves(Position* pos, char moves[][6], int num_moves, int depth);
+// All tables below are per-thread (SearchThread), so parallel searches never share them
 
-// History Heuristic
-extern int history_table[64][64];
-void update_history(const char* move, int depth);
+// Score every move once: hash move first, captures by MVV-LVA (Most Valuable Victim -
+// Least Valuable Attacker), then quiet moves by killers at `ply` (none if negative),
+// countermove and history. hash_move / countermove may be NULL.
+void score_moves(SearchThread* thread, Position* pos, char moves[][6], int scores[], int num_moves, int ply,
+                 const char* hash_move, const char* countermove);
 
-// Countermove Heuristic
-extern char countermove_table[64][64][6];
-void update_countermove(const char* previous_move, const char* response_move);
-const char* get_countermove(const char* previous_move);
+// Incremental selection: swap the best-scored of moves[index..num_moves) into `index`,
+// so only the moves actually searched before a cutoff get ordered
+void pick_move(char moves[][6], int scores[], int num_moves, int index);
+
+// Fully order a move list by the same scores (no hash move or countermove)
+void sort_moves(SearchThread* thread, Position* pos, char moves[][6], int num_moves, int ply);
+
+// History scores saturate at +-HISTORY_MAX: every update is pulled towards the bound
+// it approaches (gravity), so old results fade instead of growing without limit
+#define HISTORY_MAX 16384
+
+// Index of a piece (type and colour) in the history tables
+int piece_slot(Piece piece);
+
+// History Heuristic: after a cutoff at `ply`, reward the move that caused it and
+// penalise the moves of the same kind (quiet / capture) searched before it
+void update_quiet_histories(SearchThread* thread, Position* pos, int ply, const char* best_move,
+                            const char* const tried[], int num_tried, int depth);
+void update_capture_history(SearchThread* thread, Position* pos, const char* best_move,
+                            const char* const tried[], int num_tried, int depth);
+int get_history(SearchThread* thread, const char* move);
+
+// Average the quiet-move history tables of workers [0, count) after a search, so the next
+// search starts from what every helper learned
+void merge_history_tables(int count);
+
+// Countermove Heuristic (keyed by the piece that made the previous move and its destination,
+// read from `pos`, the position after that move)
+void update_countermove(SearchThread* thread, Position* pos, const char* previous_move, const char* response_move);
+const char* get_countermove(SearchThread* thread, Position* pos, const char* previous_move);
 
 #endif
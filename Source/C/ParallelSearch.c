@@ -14,29 +14,39 @@
 // - Dailey, D. P., & Joerg, C. F. (1995). "A Parallel Algorithm for Chess"
 //
 // Lazy SMP is a simple and effective parallel search algorithm:
-// - Each thread searches independently from the root
-// - Threads share transposition table
-// - No explicit work distribution or synchronization
-// - Works well with 2-8 cores (diminishing returns beyond)
+// - Every thread searches the whole tree from the root with iterative deepening
+// - Helpers skip depths in staggered blocks and start from rotated root orderings,
+//   so they run ahead of the main thread instead of duplicating it
+// - Threads communicate only through the shared transposition table
+//   (scores, bounds and best moves), which orders the main thread's search
+// - A "currently searching" table (ABDADA) lets a thread postpone a child that
+//   another thread is already inside, so they spread over siblings instead
+// - The main thread (pool worker 0) owns the final result and stops the
+//   helpers as soon as it finishes
 //
 // Benefits:
-// - Nearly linear speedup with 2-4 threads
-// - Simple implementation (no complex synchronization)
+// - Full alpha-beta pruning in every thread (no static root split)
+// - Simple implementation (no split points or explicit synchronization)
 // - Natural load balancing through shared TT
 // - Compatible with existing search code
+//
+// Alternatively (PARALLEL_YBW, UCI ParallelMode) all threads work on the main
+// thread's single tree: nodes are split after their eldest move and idle
+// helpers steal the younger siblings (see SplitPoint.c).
 
 #ifdef _WIN32
 #include <windows.h>
 #include <process.h>
 #else
-#include <pthread.h>
 #include <unistd.h>
+#include <pthread.h>
 #endif
 
 #include <stdio.h>
 #include <string.h>
 #include <time.h>
 #include <stdlib.h>
+#include <stdatomic.h>
 #include "ParallelSearch.h"
 #include "Minimax.h"
 #include "MoveGen.h"
@@ -44,12 +54,21 @@
 #include "Zobrist.h"
 #include "TT.h"
 #include "Ordering.h"
+#include "SplitPoint.h"
+#include "RootMoves.h"
 
 // Global state
 static int g_num_threads = 1;
+static int g_parallel_mode = PARALLEL_LAZY_SMP;
+static int g_multi_pv = 1;
 static int g_initialized = 0;
-static double g_start_time_ms = 0.0;
-static double g_max_time_ms = 0.0;
+
+// Statistics of the most recent search; while it runs, the main thread records the nodes
+// (all threads) and time used up to the end of each completed iteration
+static SearchStats g_search_stats;
+static double g_search_start_ms = 0.0;
+static uint64_t g_iteration_end_nodes[MAX_DEPTH];
+static double g_iteration_end_ms[MAX_DEPTH];
 
 static double now_ms(void) {
 #ifdef _WIN32
@@ -64,73 +83,351 @@ static double now_ms(void) {
 #endif
 }
 
-// Thread function that searches a subset of moves with alpha-beta pruning
-#ifdef _WIN32
-unsigned __stdcall search_thread(void* arg)
-#else
-void* search_thread(void* arg)
-#endif
-{
-    ThreadData* data = (ThreadData*)arg;
-    
-    float best_score = data->is_white ? -10000.0f : 10000.0f;
-    float alpha = data->alpha;
-    float beta = data->beta;
-    char thread_best[6] = "";
-    data->nodes = 0;
-    
-    // Each thread searches its assigned moves WITH alpha-beta pruning
-    for (int i = data->start_index; i < data->end_index && i < data->num_moves; i++) {
-        // Time guard for timed searches
-        if (g_max_time_ms > 0.0) {
-            double elapsed_ms = now_ms() - g_start_time_ms;
-            if (elapsed_ms >= g_max_time_ms) {
-                break;
-            }
+// Per-thread search job and result; kept alive across searches
+static ThreadData g_thread_data[MAX_THREADS];
+
+// Depth staggering for helper threads: helper i skips depths in blocks of
+// skip_size[i], offset by skip_phase[i], so helpers spread over depths d..d+3
+#define SKIP_TABLE_SIZE 20
+static const int skip_size[SKIP_TABLE_SIZE]  = {1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4};
+static const int skip_phase[SKIP_TABLE_SIZE] = {0, 1, 0, 1, 2, 3, 0, 1, 2, 3, 4, 5, 0, 1, 2, 3, 4, 5, 6, 7};
+
+static int helper_skips_depth(int thread_id, int depth) {
+    int i = (thread_id - 1) % SKIP_TABLE_SIZE;
+    return ((depth + skip_phase[i]) / skip_size[i]) % 2 != 0;
+}
+
+// Aspiration windows: from ASPIRATION_MIN_DEPTH on, an iteration starts with a window of
+// +-ASPIRATION_WINDOW pawns around the previous score. On a failure the window is moved
+// past the returned bound and doubled, and beyond ASPIRATION_MAX_WINDOW it is dropped.
+#define ASPIRATION_MIN_DEPTH 4
+#define ASPIRATION_WINDOW 1.0f
+#define ASPIRATION_MAX_WINDOW 16.0f
+
+// Complete a principal variation cut short by TT cutoffs or pruning: follow the hash moves
+// from its last position while they are legal and repeat no position of the line
+static int extend_pv_from_tt(Position* root, char pv[][6], int length, int target) {
+    Position pos = *root;
+    uint64_t keys[MAX_PLY + 1];
+    keys[0] = compute_zobrist_hash(&pos);
+    for (int i = 0; i < length; i++) {
+        make_move(&pos, pv[i]);
+        keys[i + 1] = compute_zobrist_hash(&pos);
+    }
+
+    while (length < target && length < MAX_PLY) {
+        TTHit hit;
+        if (!tt_probe(keys[length], &hit) || hit.move[0] == '\0') {
+            break;
         }
 
-        Position copy = data->position;
-        make_move(&copy, data->moves[i]);
-        
-        float score = minimax(&copy, data->depth - 1, alpha, beta, !data->is_white);
-        data->nodes += 1;
-        
-        if (data->is_white) {
-            if (score > best_score) {
-                best_score = score;
-                strcpy(thread_best, data->moves[i]);
-            }
-            if (score > alpha) {
-                alpha = score;
-            }
-            // Early exit on beta cutoff
-            if (beta <= alpha) {
-                break;
-            }
+        char moves[256][6];
+        int num_moves = generate_legal_moves(&pos, pos.white_to_move, moves);
+        int legal = 0;
+        for (int i = 0; i < num_moves && !legal; i++) {
+            legal = strcmp(moves[i], hit.move) == 0;
+        }
+        if (!legal) {
+            break;
+        }
+
+        make_move(&pos, hit.move);
+        uint64_t key = compute_zobrist_hash(&pos);
+        int repeated = 0;
+        for (int i = 0; i <= length && !repeated; i++) {
+            repeated = keys[i] == key;
+        }
+        if (repeated) {
+            break;
+        }
+        strcpy(pv[length], hit.move);
+        keys[++length] = key;
+    }
+    return length;
+}
+
+// One pass over the root moves from `first` on (the ones before it already lead other
+// MultiPV lines) with window (alpha, beta), principal-variation style: the first of them
+// gets the whole window as a PV node, the others a null window on the bound the side to
+// move has to beat, re-searched as PV nodes only when they beat it. Returns the best (white-relative) score,
+// which is a bound when it falls outside the window, and leaves the best move's line in
+// `line`.
+static float search_root(SearchThread* thread, ThreadData* data, Position* pos, int depth, int first,
+                         float alpha, float beta, SearchLine* line) {
+    RootMoveList* root = &data->root_moves;
+    int is_white = data->is_white;
+    float best_score = is_white ? -INFINITE_SCORE : INFINITE_SCORE;
+
+    for (int i = first; i < root->count; i++) {
+        float score;
+        if (i == first) {
+            score = root_moves_search(root, thread, pos, i, depth - 1, alpha, beta, 1);
         } else {
-            if (score < best_score) {
-                best_score = score;
-                strcpy(thread_best, data->moves[i]);
+            float zw_alpha = is_white ? alpha : beta - NULL_WINDOW;
+            float zw_beta = is_white ? alpha + NULL_WINDOW : beta;
+            score = root_moves_search(root, thread, pos, i, depth - 1, zw_alpha, zw_beta, 0);
+
+            int beats_bound = is_white ? score > alpha : score < beta;
+            int inside_window = is_white ? score < beta : score > alpha;
+            if (beats_bound && inside_window && !minimax_search_aborted()) {
+                thread->stats.root_researches++;
+                score = root_moves_search(root, thread, pos, i, depth - 1, alpha, beta, 1);
             }
-            if (score < beta) {
-                beta = score;
+        }
+        if (minimax_search_aborted()) {
+            break;
+        }
+
+        if (is_white ? score > best_score : score < best_score) {
+            // The root move's children are searched at ply 0, so pv_table[0] is its line
+            int child_length = thread->pv_length[0] < MAX_PLY - 1 ? thread->pv_length[0] : MAX_PLY - 1;
+            best_score = score;
+            strcpy(line->pv[0], root->moves[i].move);
+            memcpy(line->pv[1], thread->pv_table[0][0], sizeof(line->pv[0]) * child_length);
+            line->pv_length = child_length + 1;
+        }
+        if (is_white && score > alpha) alpha = score;
+        if (!is_white && score < beta) beta = score;
+        if (alpha >= beta) {
+            break; // Beyond the aspiration window: the caller widens it
+        }
+    }
+    line->score = best_score;
+    return best_score;
+}
+
+// Find the best line among the root moves from `first` on, within an aspiration window
+// around `previous` (its score last iteration) when `use_window` is set. Leaves the
+// line's move at index `first`; returns 0 if the search was aborted.
+static int search_line(SearchThread* thread, ThreadData* data, Position* pos, int depth, int first,
+                       float previous, int use_window, SearchLine* line) {
+    RootMoveList* root = &data->root_moves;
+    float window = ASPIRATION_WINDOW;
+    float alpha = use_window ? previous - window : -INFINITE_SCORE;
+    float beta = use_window ? previous + window : INFINITE_SCORE;
+
+    for (;;) {
+        strcpy(line->pv[0], root->moves[first].move);
+        line->pv_length = 1;
+        float best_score = search_root(thread, data, pos, depth, first, alpha, beta, line);
+        if (minimax_search_aborted()) {
+            return 0;
+        }
+        // Best move first, then the closest alternatives; the TT orders everything below
+        root_moves_sort(root, first, root->count);
+        root_moves_bring_forward(root, first, line->pv[0]);
+
+        // White-relative: below the window is a fail low for white, a fail high for black
+        int failed_low = best_score <= alpha && alpha > -INFINITE_SCORE;
+        int failed_high = best_score >= beta && beta < INFINITE_SCORE;
+        if (!failed_low && !failed_high) {
+            return 1;
+        }
+        thread->stats.aspiration_researches++;
+        window *= 2.0f;
+        if (window > ASPIRATION_MAX_WINDOW) {
+            alpha = -INFINITE_SCORE;
+            beta = INFINITE_SCORE;
+        } else if (failed_low) {
+            alpha = best_score - window > -INFINITE_SCORE ? best_score - window : -INFINITE_SCORE;
+        } else {
+            beta = best_score + window < INFINITE_SCORE ? best_score + window : INFINITE_SCORE;
+        }
+    }
+}
+
+// Main thread, iteration `depth` just completed: note the nodes of all threads and the time
+// so far. The helpers' counters are read while they run, as for the node limit.
+static void record_iteration(int depth) {
+    if (depth >= MAX_DEPTH) {
+        return;
+    }
+    uint64_t nodes = 0;
+    for (int t = 0; t < g_search_stats.threads; t++) {
+        nodes += thread_pool_thread(t)->nodes;
+    }
+    g_iteration_end_nodes[depth] = nodes;
+    g_iteration_end_ms[depth] = now_ms() - g_search_start_ms;
+    g_search_stats.iterations = depth;
+}
+
+// After the search: add up the threads' own counters (no shared counter to contend on during
+// the search) and split the iteration totals into what each iteration cost
+static void collect_stats(int actual_threads) {
+    SearchStats* stats = &g_search_stats;
+    memset(&stats->counters, 0, sizeof(stats->counters));
+    stats->nodes = 0;
+
+    uint64_t* total = (uint64_t*)&stats->counters;
+    int num_counters = sizeof(SearchCounters) / sizeof(uint64_t);
+    for (int t = 0; t < actual_threads; t++) {
+        SearchThread* thread = thread_pool_thread(t);
+        const uint64_t* counters = (const uint64_t*)&thread->stats;
+        for (int c = 0; c < num_counters; c++) {
+            total[c] += counters[c];
+        }
+        g_thread_data[t].nodes = thread->nodes;
+        stats->nodes += thread->nodes;
+    }
+    stats->first_move_cutoff_rate = stats->counters.beta_cutoffs > 0
+        ? (double)stats->counters.first_move_cutoffs / (double)stats->counters.beta_cutoffs : 0.0;
+
+    for (int d = 1; d <= stats->iterations; d++) {
+        stats->iteration_nodes[d] = g_iteration_end_nodes[d] - g_iteration_end_nodes[d - 1];
+        stats->iteration_time_ms[d] = g_iteration_end_ms[d] - g_iteration_end_ms[d - 1];
+        stats->branching_factor[d] = d > 1 && stats->iteration_nodes[d - 1] > 0
+            ? (double)stats->iteration_nodes[d] / (double)stats->iteration_nodes[d - 1] : 0.0;
+    }
+}
+
+// Worker task: full iterative-deepening search from the root, the driver behind every
+// search entry point. Worker 0 is the main thread; in Lazy SMP the others are helpers
+// that only feed the TT. With MultiPV the main thread searches one line per reported
+// move each iteration, every line excluding the moves of the lines before it; the TT
+// they share makes the later lines cheap.
+static void iterative_search(SearchThread* thread)
+{
+    ThreadData* data = (ThreadData*)thread->task_data;
+    int is_main = (thread->id == 0);
+    Position pos = data->position;
+    RootMoveList* root = &data->root_moves;
+
+    int num_moves = root_moves_init(root, thread, &pos);
+    data->completed_depth = 0;
+    data->num_lines = 0;
+    strcpy(data->best_move, "");
+
+    if (num_moves > 0) {
+        // Each helper starts its tree from a different root move
+        if (!is_main) {
+            root_moves_rotate(root, 0, thread->id);
+        }
+        strcpy(data->best_move, root->moves[0].move);
+    }
+
+    int num_lines = is_main ? g_multi_pv : 1;
+    if (num_lines > num_moves) num_lines = num_moves;
+
+    for (int current_depth = 1; current_depth <= data->max_depth && num_moves > 0; current_depth++) {
+        if (minimax_stop_requested()) {
+            break;
+        }
+        if (!is_main && current_depth > 1 && helper_skips_depth(thread->id, current_depth)) {
+            continue;
+        }
+        // Main thread: don't start a depth it cannot finish (85% of time used)
+        if (is_main && minimax_time_used() >= 0.85) {
+            break;
+        }
+
+        SearchLine lines[MAX_MULTI_PV];
+        int use_window = current_depth >= ASPIRATION_MIN_DEPTH && data->completed_depth > 0;
+        int completed = 1;
+        for (int l = 0; l < num_lines && completed; l++) {
+            float previous = l < data->num_lines ? data->lines[l].score : 0.0f;
+            completed = search_line(thread, data, &pos, current_depth, l, previous,
+                                    use_window && l < data->num_lines, &lines[l]);
+        }
+
+        // Only completed iterations count
+        if (!completed) {
+            break;
+        }
+
+        // A later line can come out ahead of an earlier one (its search saw more of the TT):
+        // order the lines' moves again and report the lines in that order
+        root_moves_sort(root, 0, num_lines);
+        for (int l = 0; l < num_lines; l++) {
+            for (int k = 0; k < num_lines; k++) {
+                if (strcmp(lines[k].pv[0], root->moves[l].move) == 0) {
+                    data->lines[l] = lines[k];
+                    break;
+                }
             }
-            // Early exit on alpha cutoff
-            if (beta <= alpha) {
-                break;
+            if (is_main) {
+                SearchLine* line = &data->lines[l];
+                line->pv_length = extend_pv_from_tt(&pos, line->pv, line->pv_length, current_depth);
             }
         }
+        data->num_lines = num_lines;
+        strcpy(data->best_move, data->lines[0].pv[0]);
+        data->best_score = data->lines[0].score;
+        data->completed_depth = current_depth;
+        if (is_main) {
+            record_iteration(current_depth);
+        }
+
+        // Helpers keep their own rotation behind the best move
+        if (!is_main) {
+            root_moves_rotate(root, 1, thread->id);
+        }
+    }
+
+    // The main thread owns the result; once it is done the helpers are stopped
+    if (is_main) {
+        minimax_request_stop();
     }
-    
-    // Store results
-    data->best_score = best_score;
-    strcpy(data->best_move, thread_best);
-    
-    #ifdef _WIN32
-        return 0;
-    #else
-        return NULL;
-    #endif
+}
+
+// Worker task for YBW: the main thread drives the search, helpers wait for split points
+static void ybw_search(SearchThread* thread)
+{
+    if (thread->id == 0) {
+        iterative_search(thread);
+    } else {
+        split_helper_loop(thread);
+    }
+}
+
+// Zobrist keys and the transposition table are set up on first use
+static void init_search_tables(void) {
+    if (!g_initialized) {
+        init_zobrist();
+        tt_init();
+        g_initialized = 1;
+    }
+}
+
+// Run one search on the first `actual_threads` pool workers and leave the main thread's
+// result in g_thread_data[0]
+static void run_parallel_search(Position* pos, int max_depth, int actual_threads) {
+
+    for (int t = 0; t < actual_threads; t++) {
+        ThreadData* data = &g_thread_data[t];
+        data->position = *pos;
+        data->max_depth = max_depth;
+        data->is_white = pos->white_to_move;
+        data->best_score = 0.0f;
+        data->thread_id = t;
+        strcpy(data->best_move, "");
+
+        SearchThread* thread = thread_pool_thread(t);
+        thread->root = *pos;
+        thread->task_data = data;
+    }
+
+    memset(&g_search_stats, 0, sizeof(g_search_stats));
+    g_search_stats.threads = actual_threads;
+
+    tt_new_search();
+    minimax_new_search(pos);
+    if (g_parallel_mode == PARALLEL_YBW && actual_threads > 1) {
+        split_enable(1);
+        thread_pool_run(actual_threads, ybw_search);
+        thread_pool_wait();
+        split_enable(0);
+    } else {
+        // Threads defer children another thread is already searching (ABDADA)
+        tt_searching_enable(actual_threads > 1);
+        thread_pool_run(actual_threads, iterative_search);
+        thread_pool_wait();
+        tt_searching_enable(0);
+    }
+    minimax_clear_stop();
+    collect_stats(actual_threads);
+
+    // Ordering tables are thread-local during the search; share what was learned
+    merge_history_tables(actual_threads);
 }
 
 // Get CPU core count
@@ -145,12 +442,12 @@ int get_cpu_core_count(void) {
 }
 
 // Initialize parallel search
-void parallel_search_init(int num_threads) {
-    if (!g_initialized) {
-        init_zobrist();
-        tt_init();
-        g_initialized = 1;
-    }
+int parallel_search_init(int num_threads) {
+    init_search_tables();
+
+    // The pool cannot be resized under a running search
+    search_stop();
+    search_wait();
     
     // Limit threads to reasonable range
     if (num_threads < 1) num_threads = 1;
@@ -162,299 +459,209 @@ void parallel_search_init(int num_threads) {
     }
     
     g_num_threads = num_threads;
+    thread_pool_resize(num_threads);
+    return num_threads;
+}
+
+void search_set_multi_pv(int lines) {
+    if (lines < 1) lines = 1;
+    if (lines > MAX_MULTI_PV) lines = MAX_MULTI_PV;
+    g_multi_pv = lines;
+}
+
+// Select the parallel algorithm used by the find_best_move_parallel* entry points
+void parallel_search_set_mode(int mode) {
+    g_parallel_mode = (mode == PARALLEL_YBW) ? PARALLEL_YBW : PARALLEL_LAZY_SMP;
+}
+
+int parallel_search_get_mode(void) {
+    return g_parallel_mode;
+}
+
+// Run a search whose stop flag the caller has already cleared: a stop requested from here
+// on (by another thread, see search_stop) ends it
+static const ThreadData* run_search(Position* pos, int max_depth, float max_time_ms, uint64_t max_nodes,
+                                    int num_threads) {
+    init_search_tables();
+    if (num_threads < 1) num_threads = 1;
+    if (num_threads > MAX_THREADS) num_threads = MAX_THREADS;
+
+    double start_ms = now_ms();
+    g_search_start_ms = start_ms;
+    // Cleared either way: a late ponderhit may have left a limit behind
+    if (max_time_ms > 0.0f) {
+        minimax_set_time_limit(start_ms, max_time_ms);
+    } else {
+        minimax_clear_time_limit();
+    }
+    minimax_set_node_limit(max_nodes, num_threads);
+
+    run_parallel_search(pos, max_depth, num_threads);
+
+    minimax_clear_time_limit();
+    minimax_set_node_limit(0, 1);
+    g_search_stats.time_ms = now_ms() - start_ms;
+    return &g_thread_data[0];
+}
+
+const ThreadData* search_position(Position* pos, int max_depth, float max_time_ms, uint64_t max_nodes,
+                                  int num_threads) {
+    // A new search replaces a background one still running
+    search_stop();
+    search_wait();
+
+    minimax_clear_stop();
+    return run_search(pos, max_depth, max_time_ms, max_nodes, num_threads);
+}
+
+float search_node(Position* pos, int depth, float alpha, float beta, int pv_node, int cut_node) {
+    search_stop();
+    search_wait();
+    minimax_clear_stop();
+    init_search_tables();
+
+    memset(&g_search_stats, 0, sizeof(g_search_stats));
+    g_search_stats.threads = 1;
+    g_search_start_ms = now_ms();
+    tt_new_search();
+    minimax_new_search(pos);
+    float score = minimax_search(thread_pool_thread(0), pos, depth, alpha, beta, pos->white_to_move,
+                                 pv_node, cut_node, NULL);
+    collect_stats(1);
+    g_search_stats.time_ms = now_ms() - g_search_start_ms;
+    return score;
+}
+
+// Background search (search_start): one controller thread per search runs the same driver
+// while the caller keeps going; the pool workers do the searching as usual
+typedef struct {
+    Position position;
+    int max_depth;
+    float max_time_ms;
+    uint64_t max_nodes;
+    int num_threads;
+} BackgroundSearch;
+
+static BackgroundSearch g_background;
+static atomic_int g_background_running = 0;
+static int g_background_joinable = 0;
+
+#ifdef _WIN32
+static HANDLE g_background_handle;
+
+static unsigned __stdcall background_main(void* arg)
+#else
+static pthread_t g_background_handle;
+
+static void* background_main(void* arg)
+#endif
+{
+    BackgroundSearch* job = (BackgroundSearch*)arg;
+    run_search(&job->position, job->max_depth, job->max_time_ms, job->max_nodes, job->num_threads);
+    atomic_store(&g_background_running, 0);
+    return 0;
+}
+
+void search_start(Position* pos, int max_depth, float max_time_ms, uint64_t max_nodes, int num_threads) {
+    search_stop();
+    search_wait();
+
+    g_background.position = *pos;
+    g_background.max_depth = max_depth;
+    g_background.max_time_ms = max_time_ms;
+    g_background.max_nodes = max_nodes;
+    g_background.num_threads = num_threads;
+
+    // Cleared here rather than in the new thread, so a stop sent right after the start counts
+    minimax_clear_stop();
+    atomic_store(&g_background_running, 1);
+    g_background_joinable = 1;
+#ifdef _WIN32
+    g_background_handle = (HANDLE)_beginthreadex(NULL, 0, background_main, &g_background, 0, NULL);
+#else
+    pthread_create(&g_background_handle, NULL, background_main, &g_background);
+#endif
+}
+
+void search_stop(void) {
+    if (atomic_load(&g_background_running)) {
+        minimax_request_stop();
+    }
+}
+
+void search_ponderhit(float max_time_ms) {
+    if (atomic_load(&g_background_running) && max_time_ms > 0.0f) {
+        minimax_set_time_limit(now_ms(), max_time_ms);
+    }
+}
+
+int search_running(void) {
+    return atomic_load(&g_background_running);
+}
+
+const ThreadData* search_wait(void) {
+    if (g_background_joinable) {
+#ifdef _WIN32
+        WaitForSingleObject(g_background_handle, INFINITE);
+        CloseHandle(g_background_handle);
+#else
+        pthread_join(g_background_handle, NULL);
+#endif
+        g_background_joinable = 0;
+    }
+    return &g_thread_data[0];
 }
 
-// Find best move using parallel search with Lazy SMP
+const ThreadData* search_last_result(void) {
+    return &g_thread_data[0];
+}
+
+uint64_t search_last_nodes(void) {
+    return g_search_stats.nodes;
+}
+
+double search_last_time_ms(void) {
+    return g_search_stats.time_ms;
+}
+
+const SearchStats* search_last_stats(void) {
+    return &g_search_stats;
+}
+
+// Find best move using parallel search (Lazy SMP or YBW)
 const char* find_best_move_parallel(const char* fen, int depth, int num_threads) {
     static char best_move[6];
-    static char pv[6];
     
-    // Initialize if needed
-    if (!g_initialized) {
-        parallel_search_init(num_threads);
-    } else {
-        g_num_threads = num_threads;
-    }
-    g_start_time_ms = 0.0;
-    g_max_time_ms = 0.0;
+    // Initialize if needed (the pool is only resized when the thread count changes)
+    parallel_search_init(num_threads);
     
     Position pos = {0};
     parse_fen(fen, &pos);
-    int is_white = pos.white_to_move;
-    
-    char moves[256][6];
-    int num_moves = generate_legal_moves(&pos, is_white, moves);
-    
-    if (num_moves == 0) {
-        strcpy(best_move, "");
-        return best_move;
-    }
-    
-    // IMPORTANT: Sort moves ONCE before iterative deepening for better cutoffs
-    sort_moves(&pos, moves, num_moves, depth);
     
-    strcpy(best_move, moves[0]);
-    
-    // ITERATIVE DEEPENING (both single and multi-threaded use this)
-    for (int current_depth = 1; current_depth <= depth; current_depth++) {
-        // For shallow depths or single thread, use simple search
-        if (current_depth <= 2 || g_num_threads == 1) {
-            float best_score = is_white ? -10000.0f : 10000.0f;
-            
-            for (int i = 0; i < num_moves; i++) {
-                Position copy = pos;
-                make_move(&copy, moves[i]);
-                float score = minimax(&copy, current_depth - 1, -10000.0f, 10000.0f, !is_white);
-                
-                if ((is_white && score > best_score) || (!is_white && score < best_score)) {
-                    best_score = score;
-                    strcpy(best_move, moves[i]);
-                }
-            }
-            strcpy(pv, best_move);
-            continue;
-        }
-        
-        // LAZY SMP: Create threads to search different moves in parallel
-        ThreadData thread_data[MAX_THREADS];
-        
-        #ifdef _WIN32
-            HANDLE threads[MAX_THREADS];
-        #else
-            pthread_t threads[MAX_THREADS];
-        #endif
-        
-        // Limit threads for diminishing returns (Lazy SMP doesn't scale well beyond 8)
-        int actual_threads = g_num_threads;
-        if (actual_threads > 8) {
-            actual_threads = 8;
-        }
-        if (actual_threads > num_moves) {
-            actual_threads = num_moves;
-        }
-        
-        // Distribute moves among threads
-        int moves_per_thread = num_moves / actual_threads;
-        int extra_moves = num_moves % actual_threads;
-        
-        int start_idx = 0;
-        for (int t = 0; t < actual_threads; t++) {
-            thread_data[t].position = pos;
-            thread_data[t].moves = moves;
-            thread_data[t].num_moves = num_moves;
-            thread_data[t].start_index = start_idx;
-            thread_data[t].end_index = start_idx + moves_per_thread + (t < extra_moves ? 1 : 0);
-            thread_data[t].depth = current_depth;
-            thread_data[t].alpha = -10000.0f;
-            thread_data[t].beta = 10000.0f;
-            thread_data[t].is_white = is_white;
-            thread_data[t].best_score = is_white ? -10000.0f : 10000.0f;
-            thread_data[t].thread_id = t;
-            strcpy(thread_data[t].best_move, "");
-            
-            start_idx = thread_data[t].end_index;
-            
-            // Create thread
-            #ifdef _WIN32
-                threads[t] = (HANDLE)_beginthreadex(NULL, 0, search_thread, &thread_data[t], 0, NULL);
-            #else
-                pthread_create(&threads[t], NULL, search_thread, &thread_data[t]);
-            #endif
-        }
-        
-        // Wait for all threads to complete
-        for (int t = 0; t < actual_threads; t++) {
-            #ifdef _WIN32
-                WaitForSingleObject(threads[t], INFINITE);
-                CloseHandle(threads[t]);
-            #else
-                pthread_join(threads[t], NULL);
-            #endif
-        }
-        
-        // Find best result from all threads
-        float best_score = is_white ? -10000.0f : 10000.0f;
-        char current_best[6];
-        strcpy(current_best, best_move);
-        
-        for (int t = 0; t < actual_threads; t++) {
-            if (strlen(thread_data[t].best_move) > 0) {
-                if ((is_white && thread_data[t].best_score > best_score) ||
-                    (!is_white && thread_data[t].best_score < best_score)) {
-                    best_score = thread_data[t].best_score;
-                    strcpy(current_best, thread_data[t].best_move);
-                }
-            }
-        }
-        
-        strcpy(best_move, current_best);
-        strcpy(pv, current_best);
-    }
+    const ThreadData* result = search_position(&pos, depth, 0.0f, 0, g_num_threads);
     
+    strcpy(best_move, result->best_move);
     return best_move;
 }
 
 // Find best move with time limit using parallel search
 const char* find_best_move_parallel_timed(const char* fen, float max_time_ms, int num_threads) {
     static char result[128];
-    static char best_move[6];
-    static char pv[6];
     
-    // Initialize if needed
-    if (!g_initialized) {
-        parallel_search_init(num_threads);
-    } else {
-        g_num_threads = num_threads;
-    }
-    
-    g_start_time_ms = now_ms();
-    g_max_time_ms = max_time_ms;
-    minimax_set_time_limit(g_start_time_ms, max_time_ms);
+    // Initialize if needed (the pool is only resized when the thread count changes)
+    parallel_search_init(num_threads);
     
     Position pos = {0};
     parse_fen(fen, &pos);
-    int is_white = pos.white_to_move;
-    
-    char moves[256][6];
-    int num_moves = generate_legal_moves(&pos, is_white, moves);
-    
-    if (num_moves == 0) {
-        snprintf(result, sizeof(result), "%s 0 0.0", moves[0]);
-        return result;
-    }
-    
-    // Sort moves ONCE for better cutoffs throughout iterative deepening
-    sort_moves(&pos, moves, num_moves, 1);
-    
-    strcpy(best_move, moves[0]);
-    int completed_depth = 0;
-    
-    int last_total_nodes = 0;
-
-    // Iterative deepening with time control and parallel search
-    for (int current_depth = 1; current_depth <= 20; current_depth++) {
-        // Check time before starting new depth
-        double elapsed_ms = now_ms() - g_start_time_ms;
-        if (elapsed_ms >= max_time_ms * 0.85) {
-            // 85% of time used, don't start new depth
-            break;
-        }
-        
-        // For shallow depths or single thread, use simple search
-        if (current_depth <= 2 || g_num_threads == 1) {
-            float best_score = is_white ? -10000.0f : 10000.0f;
-            char current_best[6];
-            strcpy(current_best, best_move);
-            
-            for (int i = 0; i < num_moves; i++) {
-                elapsed_ms = now_ms() - g_start_time_ms;
-                if (elapsed_ms >= max_time_ms) break;
-                
-                Position copy = pos;
-                make_move(&copy, moves[i]);
-                float score = minimax(&copy, current_depth - 1, -10000.0f, 10000.0f, !is_white);
-                
-                if ((is_white && score > best_score) || (!is_white && score < best_score)) {
-                    best_score = score;
-                    strcpy(current_best, moves[i]);
-                }
-            }
-            
-            strcpy(best_move, current_best);
-            strcpy(pv, current_best);
-            completed_depth = current_depth;
-            continue;
-        }
-        
-        // Parallel search for deeper depths
-        ThreadData thread_data[MAX_THREADS];
-        
-        #ifdef _WIN32
-            HANDLE threads[MAX_THREADS];
-        #else
-            pthread_t threads[MAX_THREADS];
-        #endif
-        
-        // Limit threads for diminishing returns
-        int actual_threads = g_num_threads;
-        if (actual_threads > 8) {
-            actual_threads = 8;
-        }
-        if (actual_threads > num_moves) {
-            actual_threads = num_moves;
-        }
-        
-        int moves_per_thread = num_moves / actual_threads;
-        int extra_moves = num_moves % actual_threads;
-        
-        int start_idx = 0;
-        for (int t = 0; t < actual_threads; t++) {
-            thread_data[t].position = pos;
-            thread_data[t].moves = moves;
-            thread_data[t].num_moves = num_moves;
-            thread_data[t].start_index = start_idx;
-            thread_data[t].end_index = start_idx + moves_per_thread + (t < extra_moves ? 1 : 0);
-            thread_data[t].depth = current_depth;
-            thread_data[t].alpha = -10000.0f;
-            thread_data[t].beta = 10000.0f;
-            thread_data[t].is_white = is_white;
-            thread_data[t].best_score = is_white ? -10000.0f : 10000.0f;
-            thread_data[t].thread_id = t;
-            strcpy(thread_data[t].best_move, "");
-            
-            start_idx = thread_data[t].end_index;
-            
-            #ifdef _WIN32
-                threads[t] = (HANDLE)_beginthreadex(NULL, 0, search_thread, &thread_data[t], 0, NULL);
-            #else
-                pthread_create(&threads[t], NULL, search_thread, &thread_data[t]);
-            #endif
-        }
-        
-        // Wait for all threads
-        for (int t = 0; t < actual_threads; t++) {
-            #ifdef _WIN32
-                WaitForSingleObject(threads[t], INFINITE);
-                CloseHandle(threads[t]);
-            #else
-                pthread_join(threads[t], NULL);
-            #endif
-        }
-        
-        // Check if we ran out of time
-        elapsed_ms = now_ms() - g_start_time_ms;
-        if (elapsed_ms >= max_time_ms) {
-            break;
-        }
-        
-        // Find best result
-        float best_score = is_white ? -10000.0f : 10000.0f;
-        char current_best[6];
-        strcpy(current_best, best_move);
-        int total_nodes = 0;
-        
-        for (int t = 0; t < actual_threads; t++) {
-            total_nodes += thread_data[t].nodes;
-            if (strlen(thread_data[t].best_move) > 0) {
-                if ((is_white && thread_data[t].best_score > best_score) ||
-                    (!is_white && thread_data[t].best_score < best_score)) {
-                    best_score = thread_data[t].best_score;
-                    strcpy(current_best, thread_data[t].best_move);
-                }
-            }
-        }
-        
-        strcpy(best_move, current_best);
-        strcpy(pv, current_best);
-        completed_depth = current_depth;
-        last_total_nodes = total_nodes;
-    }
     
-    double end_time_ms = now_ms();
-    double time_spent = end_time_ms - g_start_time_ms;
-    minimax_clear_time_limit();
+    double start_time_ms = now_ms();
+    const ThreadData* main_result = search_position(&pos, SEARCH_MAX_DEPTH, max_time_ms, 0, g_num_threads);
+    double time_spent = now_ms() - start_time_ms;
+
+    const char* best_move = main_result->best_move[0] ? main_result->best_move : "0000";
     
     // Format: move depth time_spent_ms total_nodes
-    snprintf(result, sizeof(result), "%s %d %.1f %d", best_move, completed_depth, time_spent, last_total_nodes);
+    snprintf(result, sizeof(result), "%s %d %.1f %llu", best_move, main_result->completed_depth, time_spent,
+             (unsigned long long)search_last_nodes());
     return result;
 }
@@ -10,29 +10,107 @@
 #define PARALLEL_SEARCH_H
 
 #include "Board.h"
+#include "ThreadPool.h"
+#include "RootMoves.h"
 
-// Maximum number of threads to use
-#define MAX_THREADS 16
+// Parallel algorithms (UCI ParallelMode)
+#define PARALLEL_LAZY_SMP 0  // independent iterative deepening sharing the TT
+#define PARALLEL_YBW      1  // Young Brothers Wait split points with work stealing
 
-// Thread data structure for parallel search
+// Deepest iteration of a search with only a time limit
+#define SEARCH_MAX_DEPTH 20
+
+// Most principal variations a MultiPV search reports
+#define MAX_MULTI_PV 16
+
+// One principal variation: the best line starting with its own root move
 typedef struct {
-    Position position;
-    char (*moves)[6];  // shared move list
-    int num_moves;
-    int start_index;
-    int end_index;
-    int depth;
-    float alpha;
-    float beta;
+    float score;         // white-relative
+    char pv[MAX_PLY][6];
+    int pv_length;
+} SearchLine;
+
+// Statistics of one search, all threads together (for tuning: what each pruning rule did,
+// how well moves were ordered and what each iteration cost). Exposed to Python as a ctypes
+// Structure, so Interface.py mirrors this layout.
+typedef struct {
+    SearchCounters counters;        // summed over the threads (see ThreadPool.h)
+    uint64_t nodes;                 // all nodes, quiescence included
+    double first_move_cutoff_rate;  // first_move_cutoffs / beta_cutoffs
+    double time_ms;
+    int threads;
+    int iterations;                 // completed iterations, 1..iterations below
+    uint64_t iteration_nodes[MAX_DEPTH];   // [d]: nodes spent on iteration d (all threads)
+    double iteration_time_ms[MAX_DEPTH];   // [d]: time spent on iteration d
+    double branching_factor[MAX_DEPTH];    // [d]: effective branching factor, nodes[d] / nodes[d-1]
+} SearchStats;
+
+// Per-thread search job and result
+typedef struct {
+    Position position;   // root position
+    int max_depth;
     int is_white;
+    int completed_depth; // last fully searched iteration
     float best_score;
     char best_move[6];
     int thread_id;
-    int nodes;
+    uint64_t nodes;      // nodes this thread visited in the search
+    SearchLine lines[MAX_MULTI_PV]; // principal variations of the last completed iteration,
+    int num_lines;                  // best first (one unless MultiPV is set)
+    RootMoveList root_moves;
 } ThreadData;
 
-// Initialize parallel search system
-void parallel_search_init(int num_threads);
+// Initialize parallel search system; returns the thread count actually used
+// (clamped to MAX_THREADS and the available cores)
+int parallel_search_init(int num_threads);
+
+// Number of principal variations (best root moves) each search reports, 1..MAX_MULTI_PV
+void search_set_multi_pv(int lines);
+
+// Select / query the parallel algorithm
+void parallel_search_set_mode(int mode);
+int parallel_search_get_mode(void);
+
+// Search `pos` with iterative deepening on `num_threads` pool workers, up to `max_depth`
+// plies, until `max_time_ms` has passed or until `max_nodes` nodes have been searched
+// (0 = no such limit). Every search entry point goes through here; the result is the
+// main thread's last completed iteration.
+const ThreadData* search_position(Position* pos, int max_depth, float max_time_ms, uint64_t max_nodes,
+                                  int num_threads);
+
+// Search the single node `pos` to `depth` with the (white-relative) window (alpha, beta), as
+// a PV node, a cut node or an all node (neither), on the main thread and without iterative
+// deepening. For tests of what the node type decides; the statistics are kept as for any search.
+float search_node(Position* pos, int depth, float alpha, float beta, int pv_node, int cut_node);
+
+// Start the same search on a background thread and return at once. Any search still
+// running is stopped first. Without a time or node limit (0) it runs to max_depth or a stop.
+void search_start(Position* pos, int max_depth, float max_time_ms, uint64_t max_nodes, int num_threads);
+
+// Ask a background search to finish: every search thread sees the shared abort flag
+// within a few nodes, and the result is the last completed iteration. Safe from any thread.
+void search_stop(void);
+
+// Give a running background search (started without a time limit, e.g. pondering)
+// max_time_ms from now; it keeps its TT, root move order and current iteration
+void search_ponderhit(float max_time_ms);
+
+// Whether a background search is still running (safe from any thread)
+int search_running(void);
+
+// Block until the background search has finished and return its result; returns at once
+// if none was started. Call it from one thread at a time, not concurrently with search_start.
+const ThreadData* search_wait(void);
+
+// Main thread's result of the most recent search
+const ThreadData* search_last_result(void);
+
+// Nodes searched by all threads of the most recent search, and its duration
+uint64_t search_last_nodes(void);
+double search_last_time_ms(void);
+
+// Full statistics of the most recent search
+const SearchStats* search_last_stats(void);
 
 // Find best move using parallel search
 const char* find_best_move_parallel(const char* fen, int depth, int num_threads);
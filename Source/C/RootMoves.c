@@ -0,0 +1,93 @@
+/*
+###################################
+#                                 #
+#   Created on October 19, 2026   #
+#                                 #
+###################################
+*/
+
+// Root move list shared by every iterative-deepening loop (fixed depth, timed, parallel).
+//
+// Each iteration leaves a score and a subtree node count on every root move; the list
+// is then re-sorted so the next iteration starts with the best move and tries the
+// alternatives that needed the most work (the likeliest to be close) right after it.
+
+#include <string.h>
+#include "RootMoves.h"
+#include "MoveGen.h"
+#include "Move.h"
+#include "Minimax.h"
+#include "Ordering.h"
+
+int root_moves_init(RootMoveList* list, SearchThread* thread, Position* pos) {
+    char moves[256][6];
+    int num_moves = generate_legal_moves(pos, pos->white_to_move, moves);
+
+    // Captures and history-backed quiet moves first; no killers at the root
+    sort_moves(thread, pos, moves, num_moves, -1);
+
+    list->count = num_moves;
+    list->is_white = pos->white_to_move;
+    for (int i = 0; i < num_moves; i++) {
+        strcpy(list->moves[i].move, moves[i]);
+        list->moves[i].score = 0.0f;
+        list->moves[i].nodes = 0;
+    }
+    return num_moves;
+}
+
+float root_moves_search(RootMoveList* list, SearchThread* thread, Position* pos, int index,
+                        int depth, float alpha, float beta, int pv_node) {
+    RootMove* root_move = &list->moves[index];
+    Position copy = *pos;
+    make_move(&copy, root_move->move);
+
+    uint64_t nodes_before = thread->nodes;
+    float score = minimax_search(thread, &copy, depth, alpha, beta, !list->is_white, pv_node, !pv_node, root_move->move);
+
+    root_move->score = score;
+    root_move->nodes = thread->nodes - nodes_before;
+    return score;
+}
+
+// Whether `a` belongs before `b` in the next iteration
+static int root_move_before(const RootMove* a, const RootMove* b, int is_white) {
+    if (a->score != b->score) {
+        return is_white ? a->score > b->score : a->score < b->score;
+    }
+    return a->nodes > b->nodes;
+}
+
+void root_moves_sort(RootMoveList* list, int first, int last) {
+    for (int i = first + 1; i < last; i++) {
+        RootMove root_move = list->moves[i];
+        int j = i - 1;
+        while (j >= first && root_move_before(&root_move, &list->moves[j], list->is_white)) {
+            list->moves[j + 1] = list->moves[j];
+            j--;
+        }
+        list->moves[j + 1] = root_move;
+    }
+}
+
+void root_moves_bring_forward(RootMoveList* list, int first, const char* move) {
+    for (int i = first; i < list->count; i++) {
+        if (strcmp(list->moves[i].move, move) == 0) {
+            RootMove root_move = list->moves[i];
+            memmove(&list->moves[first + 1], &list->moves[first], sizeof(RootMove) * (i - first));
+            list->moves[first] = root_move;
+            return;
+        }
+    }
+}
+
+void root_moves_rotate(RootMoveList* list, int first, int shift) {
+    int span = list->count - first;
+    if (span < 2) return;
+
+    RootMove rotated[256];
+    for (int i = 0; i < span; i++) {
+        rotated[i] = list->moves[first + (i + shift) % span];
+    }
+    memcpy(&list->moves[first], rotated, sizeof(RootMove) * span);
+}
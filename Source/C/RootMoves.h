@@ -0,0 +1,49 @@
+/*
+###################################
+#                                 #
+#   Created on October 19, 2026   #
+#                                 #
+###################################
+*/
+
+#ifndef ROOT_MOVES_H
+#define ROOT_MOVES_H
+
+#include <stdint.h>
+#include "Board.h"
+#include "ThreadPool.h"
+
+// One legal move at the root and what the last iteration learned about it
+typedef struct {
+    char move[6];
+    float score;      // white-relative score from the last iteration that searched it
+    uint64_t nodes;   // nodes in its subtree during that iteration
+} RootMove;
+
+// The root moves of one search, kept in search order across iterations
+typedef struct {
+    RootMove moves[256];
+    int count;
+    int is_white;     // side to move at the root
+} RootMoveList;
+
+// Generate the legal moves of `pos`, ordered for the first iteration
+int root_moves_init(RootMoveList* list, SearchThread* thread, Position* pos);
+
+// Search root move `index` with `depth` plies left below it and the given window, as a PV
+// node or (null window) a cut node, recording its score and subtree size; returns the score
+float root_moves_search(RootMoveList* list, SearchThread* thread, Position* pos, int index,
+                        int depth, float alpha, float beta, int pv_node);
+
+// Order moves [first, last) for the next search: best score for the side to move first,
+// equal scores by subtree size (bigger first); the sort is stable, so full ties keep their order
+void root_moves_sort(RootMoveList* list, int first, int last);
+
+// Move `move` to index `first`, shifting the moves in between back by one (a fail-low
+// bound can tie the best score, so sorting alone does not guarantee the best move leads)
+void root_moves_bring_forward(RootMoveList* list, int first, const char* move);
+
+// Rotate the moves from `first` on, so a helper thread starts its tree elsewhere
+void root_moves_rotate(RootMoveList* list, int first, int shift);
+
+#endif
@@ -28,6 +28,40 @@ int is_game_over(Position* pos) {
     return is_checkmate(pos) || is_stalemate(pos);
 }
 
+// Neither side can ever mate: K v K, K+minor v K, or only bishops all on one square colour
+int is_insufficient_material(Position* pos) {
+    int knights = 0, bishops = 0;
+    int bishop_colors[2] = {0, 0};
+
+    for (int rank = 0; rank < 8; rank++) {
+        for (int file = 0; file < 8; file++) {
+            switch (pos->board[rank][file].type) {
+                case 'p': case 'r': case 'q':
+                    return 0;
+                case 'n':
+                    knights++;
+                    break;
+                case 'b':
+                    bishops++;
+                    bishop_colors[(rank + file) % 2] = 1;
+                    break;
+            }
+        }
+    }
+
+    if (knights + bishops <= 1) return 1;
+    return knights == 0 && !(bishop_colors[0] && bishop_colors[1]);
+}
+
+// 100 plies without a capture or pawn move, unless the side to move is already mated
+int is_fifty_move_draw(Position* pos) {
+    if (pos->halfmove_clock < 100) return 0;
+    if (!is_in_check(pos, pos->white_to_move)) return 1;
+
+    char moves[256][6];
+    return generate_legal_moves(pos, pos->white_to_move, moves) > 0;
+}
+
 int is_in_check(Position* pos, int is_white) {
     Piece (*board)[8] = pos->board;
     int king_rank = -1, king_file = -1;
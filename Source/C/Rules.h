@@ -15,6 +15,10 @@ int is_checkmate(Position* pos);
 int is_stalemate(Position* pos);
 int is_game_over(Position* pos);
 
+// Draws by rule (repetition needs the game history and is detected in the search)
+int is_insufficient_material(Position* pos);
+int is_fifty_move_draw(Position* pos);
+
 int is_in_check(Position* pos, int is_white);
 
 int find_king_rank(Position* pos, int is_white);
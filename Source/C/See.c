@@ -0,0 +1,138 @@
+/*
+###################################
+#                                 #
+#   Created on October 19, 2026   #
+#                                 #
+###################################
+*/
+
+// Static exchange evaluation (swap algorithm)
+//
+// Works on a scratch copy of the board: each capture removes the attacker from
+// its square, so sliders standing behind it (x-rays) are found by the next scan.
+
+#include <string.h>
+#include "See.h"
+
+#define SEE_MAX_SWAPS 32
+
+// Material values in pawns, as in Evaluate.c; the king only has to outweigh everything else
+static float see_value(char type) {
+    switch (type) {
+        case 'p': return 1.0f;
+        case 'n': return 3.0f;
+        case 'b': return 3.0f;
+        case 'r': return 5.0f;
+        case 'q': return 9.0f;
+        case 'k': return 100.0f;
+        default: return 0.0f;
+    }
+}
+
+static int on_board(int rank, int file) {
+    return rank >= 0 && rank < 8 && file >= 0 && file < 8;
+}
+
+// Least valuable piece of `white` attacking (rank, file); returns 0 if there is none
+static int least_valuable_attacker(Piece board[8][8], int rank, int file, int white, int* from_rank, int* from_file) {
+    static const int knight_steps[8][2] = {{-2,-1},{-2,1},{-1,-2},{-1,2},{1,-2},{1,2},{2,-1},{2,1}};
+    static const int diagonal_steps[4][2] = {{-1,-1},{-1,1},{1,-1},{1,1}};
+    static const int straight_steps[4][2] = {{-1,0},{1,0},{0,-1},{0,1}};
+    static const char order[6] = {'p', 'n', 'b', 'r', 'q', 'k'};
+
+    for (int o = 0; o < 6; o++) {
+        char type = order[o];
+
+        if (type == 'p') {
+            // White pawns attack towards rank 8 (lower row index), so they sit one row below
+            int r = white ? rank + 1 : rank - 1;
+            for (int df = -1; df <= 1; df += 2) {
+                int f = file + df;
+                if (on_board(r, f) && board[r][f].type == 'p' && board[r][f].is_white == white) {
+                    *from_rank = r; *from_file = f;
+                    return 1;
+                }
+            }
+        } else if (type == 'n' || type == 'k') {
+            for (int s = 0; s < 8; s++) {
+                int r, f;
+                if (type == 'n') {
+                    r = rank + knight_steps[s][0];
+                    f = file + knight_steps[s][1];
+                } else {
+                    r = rank + (s < 4 ? diagonal_steps[s][0] : straight_steps[s - 4][0]);
+                    f = file + (s < 4 ? diagonal_steps[s][1] : straight_steps[s - 4][1]);
+                }
+                if (on_board(r, f) && board[r][f].type == type && board[r][f].is_white == white) {
+                    *from_rank = r; *from_file = f;
+                    return 1;
+                }
+            }
+        } else {
+            // Sliders: the first piece along each ray is the only one that can capture
+            for (int s = 0; s < 8; s++) {
+                int diagonal = s < 4;
+                if ((type == 'b' && !diagonal) || (type == 'r' && diagonal)) continue;
+                int dr = diagonal ? diagonal_steps[s][0] : straight_steps[s - 4][0];
+                int df = diagonal ? diagonal_steps[s][1] : straight_steps[s - 4][1];
+                int r = rank + dr, f = file + df;
+                while (on_board(r, f) && board[r][f].type == 0) {
+                    r += dr;
+                    f += df;
+                }
+                if (on_board(r, f) && board[r][f].type == type && board[r][f].is_white == white) {
+                    *from_rank = r; *from_file = f;
+                    return 1;
+                }
+            }
+        }
+    }
+    return 0;
+}
+
+float see(Position* pos, const char* move) {
+    Piece board[8][8];
+    memcpy(board, pos->board, sizeof(board));
+
+    int from_file = move[0] - 'a';
+    int from_rank = '8' - move[1];
+    int to_file   = move[2] - 'a';
+    int to_rank   = '8' - move[3];
+
+    Piece attacker = board[from_rank][from_file];
+    float gain[SEE_MAX_SWAPS];
+
+    gain[0] = see_value(board[to_rank][to_file].type);
+    if (attacker.type == 'p' && from_file != to_file && board[to_rank][to_file].type == 0) {
+        // En passant: the captured pawn is not on the destination square
+        gain[0] = see_value('p');
+        board[from_rank][to_file].type = 0;
+    }
+    if (move[4] != '\0') {
+        // Promotion: the pawn turns into the chosen piece on arrival
+        attacker.type = move[4];
+        gain[0] += see_value(move[4]) - see_value('p');
+    }
+
+    board[from_rank][from_file].type = 0;
+    board[to_rank][to_file] = attacker;
+    int side = !attacker.is_white;
+
+    int d = 0;
+    int r, f;
+    while (d + 1 < SEE_MAX_SWAPS && least_valuable_attacker(board, to_rank, to_file, side, &r, &f)) {
+        d++;
+        // Score for this side if it takes the piece now on the square and the exchange ends there
+        gain[d] = see_value(board[to_rank][to_file].type) - gain[d - 1];
+        board[to_rank][to_file] = board[r][f];
+        board[r][f].type = 0;
+        side = !side;
+    }
+
+    // Each side may stop capturing whenever continuing would lose material
+    while (d > 0) {
+        d--;
+        gain[d] = -(-gain[d] > gain[d + 1] ? -gain[d] : gain[d + 1]);
+    }
+    return gain[0];
+}
@@ -0,0 +1,19 @@
+/*
+###################################
+#                                 #
+#   Created on October 19, 2026   #
+#                                 #
+###################################
+*/
+
+#ifndef SEE_H
+#define SEE_H
+
+#include "Board.h"
+
+// Static exchange evaluation: material (in pawns) the side playing `move` wins
+// once every capture on the destination square has been played out, each side
+// always recapturing with its least valuable piece and stopping when that loses.
+float see(Position* pos, const char* move);
+
+#endif
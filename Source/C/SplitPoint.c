@@ -0,0 +1,224 @@
+/*
+###################################
+#                                 #
+#   Created on October 19, 2026   #
+#                                 #
+###################################
+*/
+
+// Young Brothers Wait split points with work stealing
+//
+// Paper Reference:
+// - Feldmann, R., Monien, B., Mysliwietz, P., & Vornberger, O. (1989).
+//   "Distributed Game-Tree Search" (Young Brothers Wait Concept)
+// - Hyatt, R. M. (1994). "The DTS high-performance parallel tree search algorithm"
+//
+// A node may only be split after its eldest move has been searched serially,
+// so the window is known before any sibling runs in parallel. The owner then
+// pushes the node onto its own deque and keeps searching siblings itself; idle
+// threads steal from the bottom (oldest, largest subtrees) of other threads'
+// deques. When a sibling fails high the split point is marked cut off and every
+// thread searching below it unwinds at its next node.
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <pthread.h>
+#include <sched.h>
+#endif
+
+#include <stddef.h>
+#include <string.h>
+#include "SplitPoint.h"
+#include "Minimax.h"
+
+static int g_split_enabled = 0;
+static atomic_int g_idle_helpers = 0;
+
+// Each thread's open split points, oldest at index 0
+static SplitPoint* g_deques[MAX_THREADS][SPLIT_DEQUE_SIZE];
+static int g_deque_count[MAX_THREADS];
+
+// Split point storage, one slot per deque entry: a split point holds a copy of the
+// search path, far too large for the stack frame of every recursive call
+static SplitPoint g_split_points[MAX_THREADS][SPLIT_DEQUE_SIZE];
+
+#ifdef _WIN32
+static SRWLOCK g_split_lock = SRWLOCK_INIT;
+#define SPLIT_LOCK()    AcquireSRWLockExclusive(&g_split_lock)
+#define SPLIT_UNLOCK()  ReleaseSRWLockExclusive(&g_split_lock)
+#define SPLIT_YIELD()   SwitchToThread()
+#else
+static pthread_mutex_t g_split_lock = PTHREAD_MUTEX_INITIALIZER;
+#define SPLIT_LOCK()    pthread_mutex_lock(&g_split_lock)
+#define SPLIT_UNLOCK()  pthread_mutex_unlock(&g_split_lock)
+#define SPLIT_YIELD()   sched_yield()
+#endif
+
+void split_enable(int enabled) {
+    g_split_enabled = enabled;
+}
+
+int split_can_split(SearchThread* thread, int depth) {
+    return g_split_enabled
+        && depth >= SPLIT_MIN_DEPTH
+        && atomic_load_explicit(&g_idle_helpers, memory_order_relaxed) > 0
+        && g_deque_count[thread->id] < SPLIT_DEQUE_SIZE;
+}
+
+SplitPoint* split_point_alloc(SearchThread* thread) {
+    // Only the owner pushes onto its deque, and split_can_split kept a slot free
+    return &g_split_points[thread->id][g_deque_count[thread->id]];
+}
+
+int split_cut(SearchThread* thread) {
+    for (SplitPoint* sp = thread->split; sp != NULL; sp = sp->parent) {
+        if (atomic_load_explicit(&sp->cutoff, memory_order_relaxed)) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
+int split_next_move(SplitPoint* sp, int* index, float* alpha, float* beta) {
+    int found = 0;
+    SPLIT_LOCK();
+    if (!atomic_load(&sp->cutoff) && sp->next_move < sp->num_moves) {
+        *index = sp->next_move++;
+        *alpha = sp->alpha;
+        *beta = sp->beta;
+        found = 1;
+    }
+    SPLIT_UNLOCK();
+    return found;
+}
+
+int split_report(SplitPoint* sp, int index, float eval) {
+    int caused_cutoff = 0;
+    SPLIT_LOCK();
+    if (!atomic_load(&sp->cutoff)) {
+        if (sp->maximizing) {
+            if (eval > sp->best_eval) {
+                sp->best_eval = eval;
+                sp->best_index = index;
+            }
+            if (eval > sp->alpha) sp->alpha = eval;
+        } else {
+            if (eval < sp->best_eval) {
+                sp->best_eval = eval;
+                sp->best_index = index;
+            }
+            if (eval < sp->beta) sp->beta = eval;
+        }
+        if (sp->beta <= sp->alpha) {
+            atomic_store(&sp->cutoff, 1);
+            caused_cutoff = 1;
+        }
+    }
+    SPLIT_UNLOCK();
+    return caused_cutoff;
+}
+
+// Is `sp` the split point `ancestor` or one opened below it?
+static int split_descends_from(SplitPoint* sp, SplitPoint* ancestor) {
+    for (; sp != NULL; sp = sp->parent) {
+        if (sp == ancestor) return 1;
+    }
+    return 0;
+}
+
+// Join an open split point of another thread, oldest first. With `within` set
+// (an owner waiting for its helpers) only split points below it qualify, so
+// the owner never wanders into unrelated work it would have to finish first.
+static SplitPoint* split_steal(SearchThread* thief, SplitPoint* within) {
+    SplitPoint* found = NULL;
+    SPLIT_LOCK();
+    int pool_size = thread_pool_size();
+    for (int t = 0; t < pool_size && found == NULL; t++) {
+        if (t == thief->id) continue;
+        for (int i = 0; i < g_deque_count[t]; i++) {
+            SplitPoint* sp = g_deques[t][i];
+            if (sp->closed || atomic_load(&sp->cutoff) || sp->next_move >= sp->num_moves) continue;
+            if (within != NULL && !split_descends_from(sp, within)) continue;
+            sp->workers++;
+            found = sp;
+            break;
+        }
+    }
+    SPLIT_UNLOCK();
+    return found;
+}
+
+// Search siblings of a stolen split point, then leave it
+static void split_help(SearchThread* thread, SplitPoint* sp) {
+    SplitPoint* previous = thread->split;
+    int previous_ply = thread->ply;
+
+    // Take over the owner's path so repetitions above the split point are seen
+    memcpy(thread->stack, sp->stack, sizeof(SearchStack) * (sp->ply + 1));
+    thread->ply = sp->ply;
+    thread->split = sp;
+    minimax_split_point_work(thread, sp);
+    thread->split = previous;
+    thread->ply = previous_ply;
+
+    SPLIT_LOCK();
+    sp->workers--;
+    SPLIT_UNLOCK();
+}
+
+void split_run(SearchThread* thread, SplitPoint* sp) {
+    sp->owner = thread;
+    sp->parent = thread->split;
+    sp->workers = 0;
+    sp->closed = 0;
+    atomic_init(&sp->cutoff, 0);
+
+    SPLIT_LOCK();
+    g_deques[thread->id][g_deque_count[thread->id]++] = sp;
+    SPLIT_UNLOCK();
+
+    thread->split = sp;
+    minimax_split_point_work(thread, sp);
+
+    SPLIT_LOCK();
+    sp->closed = 1;
+    SPLIT_UNLOCK();
+
+    // Helpful master: while siblings are still being searched, work below them
+    for (;;) {
+        SPLIT_LOCK();
+        int workers = sp->workers;
+        SPLIT_UNLOCK();
+        if (workers == 0) break;
+
+        SplitPoint* child = split_steal(thread, sp);
+        if (child != NULL) {
+            split_help(thread, child);
+        } else {
+            SPLIT_YIELD();
+        }
+    }
+
+    thread->split = sp->parent;
+
+    SPLIT_LOCK();
+    g_deque_count[thread->id]--;
+    SPLIT_UNLOCK();
+}
+
+void split_helper_loop(SearchThread* thread) {
+    thread->split = NULL;
+    atomic_fetch_add(&g_idle_helpers, 1);
+    while (!minimax_stop_requested()) {
+        SplitPoint* sp = split_steal(thread, NULL);
+        if (sp != NULL) {
+            atomic_fetch_sub(&g_idle_helpers, 1);
+            split_help(thread, sp);
+            atomic_fetch_add(&g_idle_helpers, 1);
+        } else {
+            SPLIT_YIELD();
+        }
+    }
+    atomic_fetch_sub(&g_idle_helpers, 1);
+}
@@ -0,0 +1,82 @@
+/*
+###################################
+#                                 #
+#   Created on October 19, 2026   #
+#                                 #
+###################################
+*/
+
+#ifndef SPLIT_POINT_H
+#define SPLIT_POINT_H
+
+#include <stdatomic.h>
+#include "Board.h"
+#include "ThreadPool.h"
+
+// Nodes shallower than this are searched serially (splitting costs more than it saves)
+#define SPLIT_MIN_DEPTH 3
+
+// Split points a single thread may have open at once (its work-stealing deque)
+#define SPLIT_DEQUE_SIZE 8
+
+// A node whose eldest move has been searched and whose younger brothers are
+// shared with idle threads (Young Brothers Wait).
+typedef struct SplitPoint SplitPoint;
+struct SplitPoint {
+    SplitPoint* parent;        // split point the owner was working for, NULL at the top
+    SearchThread* owner;
+
+    // Node being searched; moves and last_move live in the owner's stack frame
+    Position pos;
+    char (*moves)[6];
+    int num_moves;
+    int depth;
+    int maximizing;
+    int pv_node;
+    int cut_node;
+    int do_futility_pruning;
+    int lmp_limit;
+    int improving;
+    const char* last_move;
+    int ply;                   // owner's path to this node (stack[0..ply]), copied by every helper
+    SearchStack stack[MAX_PLY];
+
+    // Shared search state, guarded by the split lock
+    float alpha;
+    float beta;
+    float best_eval;
+    int best_index;
+    int next_move;             // next sibling to hand out
+    int workers;               // helpers currently searching a sibling
+    int closed;                // owner finished: no new helpers may join
+
+    atomic_int cutoff;         // a sibling failed high; abort everything below
+};
+
+// Turn splitting on for the duration of a YBW search
+void split_enable(int enabled);
+
+// Whether `thread` should split a node of remaining depth `depth` now
+int split_can_split(SearchThread* thread, int depth);
+
+// The split point `thread` opens next: a slot of its preallocated pool, valid
+// until the thread's next split once split_run has returned
+SplitPoint* split_point_alloc(SearchThread* thread);
+
+// Share the remaining moves of a node; the owner searches too and returns
+// once every sibling is done (or the node was cut off)
+void split_run(SearchThread* thread, SplitPoint* sp);
+
+// Fetch the next sibling and the current window; 0 once exhausted or cut off
+int split_next_move(SplitPoint* sp, int* index, float* alpha, float* beta);
+
+// Merge a sibling's score; returns 1 if it caused the cutoff
+int split_report(SplitPoint* sp, int index, float eval);
+
+// Whether any split point above this thread's current work has been cut off
+int split_cut(SearchThread* thread);
+
+// Idle loop for helper threads: steal siblings until a stop is requested
+void split_helper_loop(SearchThread* thread);
+
+#endif
@@ -8,16 +8,86 @@
 
 #include "TT.h"
 #include <stdlib.h>
+#include <math.h>
 #include <string.h>
+#include <stdatomic.h>
 
 // Default to 64MB unless overridden
 #define TT_DEFAULT_MB 64
-// Hard cap to avoid runaway allocations (~1GB with 64 million entries at ~16B)
+// Hard cap to avoid runaway allocations (1GB: 64 million entries at 16B)
 #define TT_MAX_ENTRIES (1u << 26)
 #define TT_MIN_ENTRIES 1024
 
 static TTEntry* table = NULL;
 static size_t tt_size_entries = 0;
+static unsigned tt_generation = 1;
+
+// Packed data layout (64 bits):
+//   0-15  static eval (centipawns, int16; TT_STATIC_NONE = none)
+//  16-31  move (from 6 bits | to 6 bits | promotion 3 bits), 0 = none
+//  32-63  eval (float bits)
+// Check word (64 bits, stored XOR'ed with data):
+//   0-7   depth (signed 8 bits)
+//   8-9   bound
+//  10-15  generation (search age, used for replacement; 0 = empty entry)
+//  16-63  top 48 bits of the key
+// The static eval sits in the low data bits, which a torn write between two stores of
+// the same position mixes into depth/bound/generation; both stores evaluated the same
+// position, so those bits almost always agree.
+#define TT_KEY_MASK (~(uint64_t)0xFFFF)
+#define TT_STATIC_NONE INT16_MIN
+#define TT_STATIC_MAX 327.67f
+
+static uint64_t pack_move(const char* move) {
+    if (move == NULL || move[0] == '\0') return 0;
+    int from_sq = ('8' - move[1]) * 8 + (move[0] - 'a');
+    int to_sq   = ('8' - move[3]) * 8 + (move[2] - 'a');
+    int promo = 0;
+    switch (move[4]) {
+        case 'n': promo = 1; break;
+        case 'b': promo = 2; break;
+        case 'r': promo = 3; break;
+        case 'q': promo = 4; break;
+    }
+    return (uint64_t)(from_sq | (to_sq << 6) | (promo << 12));
+}
+
+static void unpack_move(uint64_t packed, char* move) {
+    if (packed == 0) {
+        move[0] = '\0';
+        return;
+    }
+    int from_sq = packed & 63;
+    int to_sq = (packed >> 6) & 63;
+    int promo = (packed >> 12) & 7;
+    move[0] = 'a' + from_sq % 8;
+    move[1] = '8' - from_sq / 8;
+    move[2] = 'a' + to_sq % 8;
+    move[3] = '8' - to_sq / 8;
+    move[4] = promo ? " nbrq"[promo] : '\0';
+    move[5] = '\0';
+}
+
+// Out-of-range values (the search passes EVAL_NONE) are stored as "none"
+static int16_t pack_static_eval(float static_eval) {
+    if (static_eval < -TT_STATIC_MAX || static_eval > TT_STATIC_MAX) return TT_STATIC_NONE;
+    return (int16_t)lrintf(static_eval * 100.0f);
+}
+
+static uint64_t pack_data(float eval, uint64_t move, float static_eval) {
+    uint32_t eval_bits;
+    memcpy(&eval_bits, &eval, sizeof(eval_bits));
+    return (uint64_t)(uint16_t)pack_static_eval(static_eval)
+         | (move << 16)
+         | ((uint64_t)eval_bits << 32);
+}
+
+static uint64_t pack_check(uint64_t key, int depth, int bound) {
+    return (key & TT_KEY_MASK)
+         | (uint64_t)(uint8_t)(int8_t)depth
+         | ((uint64_t)(bound & 3) << 8)
+         | ((uint64_t)(tt_generation & 63) << 10);
+}
 
 static size_t clamp_entries_from_mb(int megabytes) {
     if (megabytes < 1) {
@@ -58,26 +128,111 @@ void tt_init() {
     }
 }
 
-void tt_store(uint64_t key, float eval, int depth) {
+// Age the table so entries from earlier searches can be replaced.
+// Generation 0 is never used, so a stored entry never packs to all-zero data.
+void tt_new_search(void) {
+    tt_generation = tt_generation % 63 + 1;
+}
+
+// Shared by all search threads without locks (see TTEntry)
+void tt_store(uint64_t key, float eval, float static_eval, int depth, int bound, const char* move) {
     if (table == NULL || tt_size_entries == 0) {
         tt_init();
     }
     uint64_t index = key % tt_size_entries;
-    if (depth >= table[index].depth) {
-        table[index].key = key;
-        table[index].eval = eval;
-        table[index].depth = depth;
+    uint64_t old_data = table[index].data;
+    uint64_t old_check = table[index].key ^ old_data;
+    int same_key = ((old_check ^ key) & TT_KEY_MASK) == 0;
+    int old_depth = (int8_t)(old_check & 0xFF);
+    unsigned old_generation = (old_check >> 10) & 63;
+
+    uint64_t packed_move = pack_move(move);
+    if (same_key && packed_move == 0) {
+        packed_move = (old_data >> 16) & 0xFFFF;  // keep the previous best move
+    }
+
+    if (old_generation == 0 || old_generation != tt_generation ||
+        depth >= old_depth || (same_key && bound == TT_EXACT)) {
+        uint64_t data = pack_data(eval, packed_move, static_eval);
+        table[index].key = pack_check(key, depth, bound) ^ data;
+        table[index].data = data;
     }
 }
 
-int tt_lookup(uint64_t key, float* eval, int depth) {
+int tt_probe(uint64_t key, TTHit* hit) {
     if (table == NULL || tt_size_entries == 0) {
         return 0;
     }
     uint64_t index = key % tt_size_entries;
-    if (table[index].key == key && table[index].depth >= depth) {
-        *eval = table[index].eval;
-        return 1;
+    uint64_t data = table[index].data;
+    uint64_t check = table[index].key ^ data;
+    if (((check ^ key) & TT_KEY_MASK) != 0 || ((check >> 10) & 63) == 0) {
+        return 0;
+    }
+
+    uint32_t eval_bits = (uint32_t)(data >> 32);
+    memcpy(&hit->eval, &eval_bits, sizeof(hit->eval));
+    int16_t static_eval = (int16_t)(data & 0xFFFF);
+    hit->has_static_eval = static_eval != TT_STATIC_NONE;
+    hit->static_eval = static_eval / 100.0f;
+    hit->depth = (int8_t)(check & 0xFF);
+    hit->bound = (check >> 8) & 3;
+    unpack_move((data >> 16) & 0xFFFF, hit->move);
+    return 1;
+}
+
+// ABDADA (Weill, 1996) in the simplified form of Kerrigan: a small set-associative
+// table of child keys currently being searched. Only used while several Lazy SMP
+// threads share the TT; losing an entry to a full set only costs duplicate work.
+#define CS_SETS 32768
+#define CS_WAYS 4
+
+static _Atomic uint64_t cs_table[CS_SETS][CS_WAYS];
+static int cs_enabled = 0;
+
+void tt_searching_enable(int enabled) {
+    cs_enabled = enabled;
+}
+
+// Key of the child reached by `move`, at the depth it is searched with
+static uint64_t cs_key(uint64_t key, const char* move, int depth) {
+    uint64_t m = pack_move(move) | ((uint64_t)(depth & 0xFF) << 16);
+    uint64_t k = key ^ ((m + 1) * 0x9E3779B97F4A7C15ULL);
+    return k ? k : 1;  // 0 marks a free way
+}
+
+int tt_defer_move(uint64_t key, const char* move, int depth) {
+    if (!cs_enabled || depth < TT_DEFER_MIN_DEPTH) return 0;
+    uint64_t k = cs_key(key, move, depth);
+    _Atomic uint64_t* set = cs_table[k % CS_SETS];
+    for (int i = 0; i < CS_WAYS; i++) {
+        if (atomic_load_explicit(&set[i], memory_order_relaxed) == k) {
+            return 1;
+        }
     }
     return 0;
 }
+
+void tt_searching_start(uint64_t key, const char* move, int depth) {
+    if (!cs_enabled || depth < TT_DEFER_MIN_DEPTH) return;
+    uint64_t k = cs_key(key, move, depth);
+    _Atomic uint64_t* set = cs_table[k % CS_SETS];
+    for (int i = 0; i < CS_WAYS; i++) {
+        uint64_t expected = 0;
+        if (atomic_compare_exchange_strong(&set[i], &expected, k)) {
+            return;
+        }
+    }
+}
+
+void tt_searching_finish(uint64_t key, const char* move, int depth) {
+    if (!cs_enabled || depth < TT_DEFER_MIN_DEPTH) return;
+    uint64_t k = cs_key(key, move, depth);
+    _Atomic uint64_t* set = cs_table[k % CS_SETS];
+    for (int i = 0; i < CS_WAYS; i++) {
+        uint64_t expected = k;
+        if (atomic_compare_exchange_strong(&set[i], &expected, 0)) {
+            return;
+        }
+    }
+}
@@ -11,15 +11,47 @@
 
 #include <stdint.h>
 
+// Bound type of a stored score (scores are white-relative, like the search)
+#define TT_EXACT 0
+#define TT_LOWER 1  // search failed high: true score >= eval
+#define TT_UPPER 2  // search failed low:  true score <= eval
+
+// Depth stored for quiescence results: below every full-width search, so they never
+// replace one of the same search and only cut off other quiescence nodes
+#define TT_DEPTH_QS -1
+
+// Lockless entry (Hyatt & Mann): the check word is stored XOR'ed with the data word,
+// so a torn write by another thread simply fails verification on probe. The check
+// word holds the top 48 bits of the key and, in its low 16 bits, depth, bound and
+// generation; data holds the score, best move and static eval (16 bytes in all).
 typedef struct {
     uint64_t key;
+    uint64_t data;
+} TTEntry;
+
+// Unpacked view of an entry returned by tt_probe
+typedef struct {
     float eval;
+    float static_eval;  // as passed to tt_store, rounded to centipawns
+    int has_static_eval; // 0 if the store passed none (a value outside +-327.67 pawns)
     int depth;
-} TTEntry;
+    int bound;
+    char move[6];   // best/refutation move, "" if none
+} TTHit;
 
 void tt_init();
 void tt_resize(int megabytes);
-void tt_store(uint64_t key, float eval, int depth);
-int tt_lookup(uint64_t key, float* eval, int depth);
+void tt_new_search(void);
+void tt_store(uint64_t key, float eval, float static_eval, int depth, int bound, const char* move);
+int tt_probe(uint64_t key, TTHit* hit);
+
+// ABDADA "currently searching" table: (position, move, depth) triples some
+// thread is searching right now. Other threads defer those moves to the end
+// of their move loop instead of duplicating the subtree.
+#define TT_DEFER_MIN_DEPTH 3
+void tt_searching_enable(int enabled);
+int tt_defer_move(uint64_t key, const char* move, int depth);
+void tt_searching_start(uint64_t key, const char* move, int depth);
+void tt_searching_finish(uint64_t key, const char* move, int depth);
 
 #endif
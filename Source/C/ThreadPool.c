@@ -0,0 +1,184 @@
+/*
+###################################
+#                                 #
+#   Created on October 19, 2026   #
+#                                 #
+###################################
+*/
+
+// Persistent search thread pool
+//
+// Workers are created once (sized by the UCI Threads option) and parked on a
+// condition variable between searches. Dispatching work only flips a flag and
+// wakes them, so no thread is created or joined per iteration.
+
+#ifdef _WIN32
+#include <windows.h>
+#include <process.h>
+#else
+#include <pthread.h>
+#endif
+
+#include <string.h>
+#include "ThreadPool.h"
+
+// Explicit worker stack size: the platform defaults (1MB on Windows, 512KB for
+// secondary threads on macOS) are too small for a full-depth search path
+#define WORKER_STACK_SIZE (8 * 1024 * 1024)
+
+static SearchThread g_threads[MAX_THREADS];
+static int g_pool_size = 0;
+static int g_pending = 0;
+static int g_sync_initialized = 0;
+
+#ifdef _WIN32
+static HANDLE g_handles[MAX_THREADS];
+static CRITICAL_SECTION g_lock;
+static CONDITION_VARIABLE g_work_cond;
+static CONDITION_VARIABLE g_done_cond;
+#define POOL_LOCK()        EnterCriticalSection(&g_lock)
+#define POOL_UNLOCK()      LeaveCriticalSection(&g_lock)
+#define POOL_WAIT(cond)    SleepConditionVariableCS(&(cond), &g_lock, INFINITE)
+#define POOL_BROADCAST(c)  WakeAllConditionVariable(&(c))
+#else
+static pthread_t g_handles[MAX_THREADS];
+static pthread_mutex_t g_lock = PTHREAD_MUTEX_INITIALIZER;
+static pthread_cond_t g_work_cond = PTHREAD_COND_INITIALIZER;
+static pthread_cond_t g_done_cond = PTHREAD_COND_INITIALIZER;
+#define POOL_LOCK()        pthread_mutex_lock(&g_lock)
+#define POOL_UNLOCK()      pthread_mutex_unlock(&g_lock)
+#define POOL_WAIT(cond)    pthread_cond_wait(&(cond), &g_lock)
+#define POOL_BROADCAST(c)  pthread_cond_broadcast(&(c))
+#endif
+
+static void pool_sync_init(void) {
+    if (g_sync_initialized) return;
+#ifdef _WIN32
+    InitializeCriticalSection(&g_lock);
+    InitializeConditionVariable(&g_work_cond);
+    InitializeConditionVariable(&g_done_cond);
+#endif
+    g_sync_initialized = 1;
+}
+
+// Worker loop: sleep until a task is assigned, run it, report completion
+#ifdef _WIN32
+static unsigned __stdcall worker_main(void* arg)
+#else
+static void* worker_main(void* arg)
+#endif
+{
+    SearchThread* thread = (SearchThread*)arg;
+
+    for (;;) {
+        POOL_LOCK();
+        while (!thread->searching && !thread->exit) {
+            POOL_WAIT(g_work_cond);
+        }
+        if (thread->exit) {
+            POOL_UNLOCK();
+            break;
+        }
+        SearchTask task = thread->task;
+        POOL_UNLOCK();
+
+        task(thread);
+
+        POOL_LOCK();
+        thread->searching = 0;
+        g_pending--;
+        if (g_pending == 0) {
+            POOL_BROADCAST(g_done_cond);
+        }
+        POOL_UNLOCK();
+    }
+
+    #ifdef _WIN32
+        return 0;
+    #else
+        return NULL;
+    #endif
+}
+
+void thread_pool_shutdown(void) {
+    if (g_pool_size == 0) return;
+
+    POOL_LOCK();
+    for (int i = 0; i < g_pool_size; i++) {
+        g_threads[i].exit = 1;
+    }
+    POOL_BROADCAST(g_work_cond);
+    POOL_UNLOCK();
+
+    for (int i = 0; i < g_pool_size; i++) {
+        #ifdef _WIN32
+            WaitForSingleObject(g_handles[i], INFINITE);
+            CloseHandle(g_handles[i]);
+        #else
+            pthread_join(g_handles[i], NULL);
+        #endif
+    }
+    g_pool_size = 0;
+}
+
+void thread_pool_resize(int num_threads) {
+    if (num_threads < 1) num_threads = 1;
+    if (num_threads > MAX_THREADS) num_threads = MAX_THREADS;
+    if (num_threads == g_pool_size) return;
+
+    pool_sync_init();
+    thread_pool_shutdown();
+
+    for (int i = 0; i < num_threads; i++) {
+        SearchThread* thread = &g_threads[i];
+        thread->id = i;
+        thread->searching = 0;
+        thread->exit = 0;
+        #ifdef _WIN32
+            g_handles[i] = (HANDLE)_beginthreadex(NULL, WORKER_STACK_SIZE, worker_main, thread,
+                                                  STACK_SIZE_PARAM_IS_A_RESERVATION, NULL);
+        #else
+            pthread_attr_t attr;
+            pthread_attr_init(&attr);
+            pthread_attr_setstacksize(&attr, WORKER_STACK_SIZE);
+            pthread_create(&g_handles[i], &attr, worker_main, thread);
+            pthread_attr_destroy(&attr);
+        #endif
+    }
+    g_pool_size = num_threads;
+}
+
+int thread_pool_size(void) {
+    return g_pool_size;
+}
+
+SearchThread* thread_pool_thread(int id) {
+    if (id < 0 || id >= MAX_THREADS) return NULL;
+    g_threads[id].id = id;
+    return &g_threads[id];
+}
+
+void thread_pool_run(int count, SearchTask task) {
+    if (count > g_pool_size) {
+        thread_pool_resize(count);
+    }
+
+    POOL_LOCK();
+    for (int i = 0; i < count; i++) {
+        g_threads[i].task = task;
+        g_threads[i].searching = 1;
+    }
+    g_pending += count;
+    POOL_BROADCAST(g_work_cond);
+    POOL_UNLOCK();
+}
+
+void thread_pool_wait(void) {
+    if (!g_sync_initialized) return;
+
+    POOL_LOCK();
+    while (g_pending > 0) {
+        POOL_WAIT(g_done_cond);
+    }
+    POOL_UNLOCK();
+}
@@ -0,0 +1,116 @@
+/*
+###################################
+#                                 #
+#   Created on October 19, 2026   #
+#                                 #
+###################################
+*/
+
+#ifndef THREAD_POOL_H
+#define THREAD_POOL_H
+
+#include <stdint.h>
+#include "Board.h"
+
+// Maximum number of threads to use
+#define MAX_THREADS 16
+
+// Workers own their state on separate cache lines to avoid false sharing
+#define CACHE_LINE_SIZE 64
+
+// Deepest nominal search depth (sizes the LMR table)
+#define MAX_DEPTH 64
+
+// Longest search path (plies from the root), the size of the search stack
+#define MAX_PLY 128
+
+// History tables are indexed by piece (type and colour, see piece_slot in Ordering.h)
+#define PIECE_SLOTS 12
+
+typedef struct SearchThread SearchThread;
+typedef void (*SearchTask)(SearchThread* thread);
+
+// Per-ply search state: stack[ply] describes the node at that distance from the root
+typedef struct {
+    uint64_t key;           // Zobrist key of the node (repetition detection)
+    float static_eval;      // evaluate_board of the node, EVAL_NONE when in check
+    int in_check;
+    char move[6];           // move currently searched from this node, "" for a null move
+    int piece;              // piece slot and destination square of `move` (continuation
+    int to;                 // history), piece = -1 for a null move
+    char killers[2][6];     // quiet moves that caused a cutoff at this ply
+} SearchStack;
+
+// What one thread's search did, counted by that thread alone (reset by minimax_new_search).
+// All fields are uint64_t so the driver can add them up as an array.
+typedef struct {
+    uint64_t qnodes;             // quiescence nodes (also counted in SearchThread.nodes)
+    uint64_t tt_probes;          // TT lookups, in the main and the quiescence search
+    uint64_t tt_hits;            // lookups that found the position
+    uint64_t tt_cutoffs;         // hits whose score ended the node
+    uint64_t qs_tt_cutoffs;      // ... of them in the quiescence search
+    uint64_t null_move_tries;
+    uint64_t null_move_cutoffs;
+    uint64_t probcut_tries;      // captures searched by ProbCut (those SEE let through)
+    uint64_t probcut_cutoffs;
+    uint64_t lmr_reductions;     // moves searched reduced first
+    uint64_t lmr_researches;     // reduced searches that beat the bound and were repeated
+    uint64_t iir_reductions;     // nodes searched a ply shallower for lack of a hash move
+    uint64_t futility_prunes;    // quiet moves skipped by futility pruning
+    uint64_t lmp_prunes;         // quiet moves skipped by late move pruning
+    uint64_t beta_cutoffs;       // main-search nodes cut off by a move
+    uint64_t first_move_cutoffs; // ... by the first move searched (a measure of ordering)
+    uint64_t deferred_moves;     // children put off because another thread was searching them
+    uint64_t root_researches;    // later root moves that beat the zero window (a new best move)
+    uint64_t aspiration_researches; // root searches repeated with a wider aspiration window
+} SearchCounters;
+
+// Per-thread search state, owned by one pool worker for the lifetime of the pool
+struct SearchThread {
+    _Alignas(CACHE_LINE_SIZE) int id;
+    uint64_t nodes;         // nodes visited by this thread in the current search
+    SearchCounters stats;   // and what it did at them
+    Position root;          // root position of the current task
+
+    // Nodes on the current search path, stack[ply] being the one searched now
+    SearchStack stack[MAX_PLY];
+    int ply;
+
+    // Triangular PV table: pv_table[ply] is the best line found so far from the node at
+    // `ply` (pv_length[ply] moves), extended by each move that raises its bound
+    char pv_table[MAX_PLY + 1][MAX_PLY][6];
+    int pv_length[MAX_PLY + 1];
+
+    // Move-ordering heuristics (see Ordering.c); killers live in the search stack
+    int history_table[64][64];                                       // quiet moves: from, to
+    int16_t capture_history[PIECE_SLOTS][64][6];                     // piece, to, captured type
+    int16_t continuation_history[PIECE_SLOTS][64][PIECE_SLOTS][64];  // previous piece/to -> piece/to
+    char countermove_table[PIECE_SLOTS][64][6];                      // previous piece/to -> reply
+
+    // Split point this thread is currently searching siblings of (YBW), NULL otherwise
+    struct SplitPoint* split;
+
+    // Work assignment (written by the dispatcher while the worker is parked)
+    SearchTask task;
+    void* task_data;
+    int searching;
+    int exit;
+};
+
+// Create or resize the pool; workers stay parked until work is dispatched
+void thread_pool_resize(int num_threads);
+int thread_pool_size(void);
+
+// Per-thread state for worker `id` (slot 0 is also used by single-threaded searches)
+SearchThread* thread_pool_thread(int id);
+
+// Wake workers [0, count) to run `task` (returns immediately)
+void thread_pool_run(int count, SearchTask task);
+
+// Block until every dispatched worker has finished its task
+void thread_pool_wait(void);
+
+// Stop and join all workers
+void thread_pool_shutdown(void);
+
+#endif
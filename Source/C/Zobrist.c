@@ -12,8 +12,14 @@
 
 uint64_t zobrist_table[8][8][12]; // 64 squares, 12 piece types
 uint64_t zobrist_white_to_move;
+uint64_t zobrist_castling[4];     // K, Q, k, q
+uint64_t zobrist_ep_file[8];
 
 void init_zobrist() {
+    static int initialized = 0;
+    if (initialized) return;  // keys are deterministic; never regenerate during a search
+    initialized = 1;
+
     srand(0xCAFEBABE); // for deterministic results
 
     for (int rank = 0; rank < 8; rank++) {
@@ -26,6 +32,15 @@ void init_zobrist() {
     }
 
     zobrist_white_to_move = ((uint64_t)rand() << 32) | rand();
+
+    // Castling rights and en passant file must be part of the key,
+    // otherwise repetition detection would equate different positions
+    for (int i = 0; i < 4; i++) {
+        zobrist_castling[i] = ((uint64_t)rand() << 32) | rand();
+    }
+    for (int file = 0; file < 8; file++) {
+        zobrist_ep_file[file] = ((uint64_t)rand() << 32) | rand();
+    }
 }
 
 int piece_index(Piece p) {
@@ -43,6 +58,21 @@ int piece_index(Piece p) {
     return type_index + (p.is_white ? 0 : 6);
 }
 
+// The en passant square only distinguishes positions when a pawn could capture onto it
+// (make_move sets it after every double push, FENs usually only when it matters)
+static int ep_capture_possible(Position* pos) {
+    if (pos->ep_file < 0 || pos->ep_file > 7 || pos->ep_rank < 0 || pos->ep_rank > 7) return 0;
+    int pawn_rank = pos->white_to_move ? pos->ep_rank + 1 : pos->ep_rank - 1;
+    if (pawn_rank < 0 || pawn_rank > 7) return 0;
+    for (int df = -1; df <= 1; df += 2) {
+        int file = pos->ep_file + df;
+        if (file < 0 || file > 7) continue;
+        Piece p = pos->board[pawn_rank][file];
+        if (p.type == 'p' && p.is_white == pos->white_to_move) return 1;
+    }
+    return 0;
+}
+
 uint64_t compute_zobrist_hash(Position* pos) {
     uint64_t hash = 0;
     for (int rank = 0; rank < 8; rank++) {
@@ -55,5 +85,11 @@ uint64_t compute_zobrist_hash(Position* pos) {
     }
     if (pos->white_to_move)
         hash ^= zobrist_white_to_move;
+    if (pos->white_king_side_castle)  hash ^= zobrist_castling[0];
+    if (pos->white_queen_side_castle) hash ^= zobrist_castling[1];
+    if (pos->black_king_side_castle)  hash ^= zobrist_castling[2];
+    if (pos->black_queen_side_castle) hash ^= zobrist_castling[3];
+    if (ep_capture_possible(pos))
+        hash ^= zobrist_ep_file[pos->ep_file];
     return hash;
 }
@@ -20,7 +20,9 @@ from Source.OpeningBook import OpeningBook
 from Source.TimeManagement import TimeManager, TimeControl, detect_time_control
 from Interface import (get_best_move_from_c, get_eval_from_c, get_search_info_from_c, 
                        find_best_move_timed_from_c, get_cpu_cores, 
-                       find_best_move_parallel_from_c, find_best_move_parallel_timed_from_c)
+                       find_best_move_parallel_from_c, find_best_move_parallel_timed_from_c,
+                       start_search_from_c, stop_search_from_c, ponderhit_from_c,
+                       wait_search_from_c, get_last_search_info_from_c)
 
 console = Console()
 
@@ -149,7 +151,19 @@ def main():
     if use_time_management and time_manager:
         print(f"[yellow]Mergen has {time_manager.format_time(time_manager.total_time)} remaining[/yellow]")
 
+    # Pondering: while the human thinks, Mergen searches the position after the reply
+    # its principal variation expects
+    expected_reply: Optional[chess.Move] = None
+    ponder_move: Optional[chess.Move] = None  # reply being pondered on, None when idle
+
     while not board.is_game_over():
+        if ponder_move is None and expected_reply is not None and expected_reply in board.legal_moves:
+            ponder_move = expected_reply
+            ponder_board = board.copy()
+            ponder_board.push(ponder_move)
+            start_search_from_c(ponder_board.fen(), 0, 0, num_threads)
+        expected_reply = None
+        
         # Check if player is in check at the start of their turn
         if board.is_check():
             print("[bold red]⚠️  You are in CHECK! You must move your king to safety or block the attack![/bold red]")
@@ -198,6 +212,17 @@ def main():
             console.print("Illegal move, please try again.", style="bold red")
             continue
         
+        # On the expected move the ponder search goes on as Mergen's timed search;
+        # otherwise it is stopped (what it stored in the TT still helps)
+        ponder_hit = False
+        if ponder_move is not None:
+            in_book = use_opening_book and opening_book.is_in_book(board)
+            ponder_hit = human_move == ponder_move and use_time_management and not in_book
+            if not ponder_hit:
+                stop_search_from_c()
+                wait_search_from_c()
+            ponder_move = None
+        
         if check_game_over(board):
             break
         
@@ -236,7 +261,14 @@ def main():
             # Calculate time allocation
             target_time, max_time = time_manager.get_time_for_move(board)
             
-            if use_multithreading:
+            if ponder_hit:
+                print(f"[yellow]Mergen expected {human_move}, continuing its ponder search... (max: {time_manager.format_time(max_time)})[/yellow]")
+                # Timed from now on, keeping everything searched on the human's time
+                ponderhit_from_c(max_time * 1000)
+                move_uci = wait_search_from_c()
+                depth_reached = get_last_search_info_from_c()[0]
+                time_spent_ms = (time.time() - start_time) * 1000
+            elif use_multithreading:
                 print(f"[yellow]Mergen is thinking ({num_threads} threads)... (target: {time_manager.format_time(target_time)}, max: {time_manager.format_time(max_time)})[/yellow]")
                 # Use parallel time-limited search
                 move_uci, depth_reached, time_spent_ms = find_best_move_parallel_timed_from_c(board.fen(), max_time * 1000, num_threads)
@@ -269,23 +301,30 @@ def main():
                 
                 # Get search information for display
                 search_info = get_search_info_from_c(board.fen(), depth=fixed_depth)
-                depth_str, eval_str, pv_move = search_info.split()
+                depth_str, eval_str, *pv = search_info.split()
+                pv_line = " ".join(pv)
                 
-                print(f"[dim]Search depth: {depth_str}, Eval: {eval_str}, PV: {pv_move}, Threads: {num_threads}[/dim]")
+                print(f"[dim]Search depth: {depth_str}, Eval: {eval_str}, PV: {pv_line}, Threads: {num_threads}[/dim]")
                 print(f"[bold blue]Mergen played: {mergen_move}[/bold blue] [dim](took {elapsed:.2f}s)[/dim]")
             else:
                 print(f"[yellow]Mergen is thinking...[/yellow]")
                 # Get search information (depth, eval, PV)
                 search_info = get_search_info_from_c(board.fen(), depth=fixed_depth)
-                depth_str, eval_str, pv_move = search_info.split()
+                depth_str, eval_str, *pv = search_info.split()
+                pv_line = " ".join(pv)
                 
                 mergen_move = chess.Move.from_uci(get_best_move_from_c(board.fen(), depth=fixed_depth))
                 elapsed = time.time() - start_time
                 black_time += elapsed
                 
-                print(f"[dim]Search depth: {depth_str}, Eval: {eval_str}, PV: {pv_move}[/dim]")
+                print(f"[dim]Search depth: {depth_str}, Eval: {eval_str}, PV: {pv_line}[/dim]")
                 print(f"[bold blue]Mergen played: {mergen_move}[/bold blue] [dim](took {elapsed:.2f}s)[/dim]")
         
+        # The principal variation's reply to our move is what we ponder on next
+        _, _, pv = get_last_search_info_from_c()
+        if len(pv) >= 2 and pv[0] == mergen_move.uci():
+            expected_reply = chess.Move.from_uci(pv[1])
+        
         board.push(mergen_move)
         print_board_rich(board)
 
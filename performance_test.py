@@ -6,7 +6,7 @@ Tests search speed at various depths and positions
 import sys
 import time
 sys.path.append('Source')
-from Interface import get_best_move_from_c
+from Interface import get_best_move_from_c, get_last_search_nodes_from_c
 
 # Test positions with varying complexity
 test_positions = [
@@ -53,12 +53,10 @@ for pos in test_positions:
             move = get_best_move_from_c(pos['fen'], depth)
             elapsed = time.time() - start
             
-            # Calculate nodes per second (rough estimate)
-            # Assuming exponential growth: ~35 moves avg, ~35^depth nodes
-            estimated_nodes = 35 ** depth
-            nps = estimated_nodes / elapsed if elapsed > 0 else 0
+            # Nodes as counted by the engine's search threads
+            nodes, _, nps = get_last_search_nodes_from_c()
             
-            print(f"✓ Move: {move:6s} | Time: {elapsed:6.3f}s | ~{nps/1000:.0f}k NPS")
+            print(f"✓ Move: {move:6s} | Time: {elapsed:6.3f}s | Nodes: {nodes:8d} | {nps/1000:.1f}k NPS")
             
             # Stop if search takes more than 20 seconds
             if elapsed > 20:
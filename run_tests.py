@@ -15,11 +15,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from tests.test_move_generation import TestMoveGeneration, TestPerftPositions
 from tests.test_evaluation import TestEvaluation, TestPieceValues
 from tests.test_tactics import (TestMateInOne, TestMateInTwo, TestTacticalMotifs,
-                                 TestEndgameKnowledge, TestAvoidBlunders)
+                                 TestEndgameKnowledge, TestAvoidBlunders, TestDrawDetection, TestMultiPV,
+                                 TestStaticExchange)
 from tests.test_opening_book import TestOpeningBook, TestOpeningBookManipulation
 from tests.test_pgn import TestPGNSaveLoad, TestFENSaveLoad, TestPGNGameResults
-from tests.test_parallel_search import TestParallelSearch
+from tests.test_parallel_search import TestParallelSearch, TestBackgroundSearch, TestNodeLimit, TestSearchStats
+from tests.test_search import TestParallelWorkSharing, TestLateMoveReductions, TestInternalIterativeReduction, TestQuiescenceTransposition, TestMoveOrdering, TestHistoryGravity, TestRootMoveOrdering, TestAspirationWindows, TestPVNodePruning
 from tests.test_time_management import TestTimeManagement
+from tests.test_uci import TestUCIGo
 
 
 def run_test_suite(verbosity=2):
@@ -42,6 +45,18 @@ def run_test_suite(verbosity=2):
         TestMoveGeneration,
         TestPerftPositions,
         TestParallelSearch,
+        TestBackgroundSearch,
+        TestNodeLimit,
+        TestSearchStats,
+        TestParallelWorkSharing,
+        TestLateMoveReductions,
+        TestInternalIterativeReduction,
+        TestQuiescenceTransposition,
+        TestMoveOrdering,
+        TestHistoryGravity,
+        TestRootMoveOrdering,
+        TestAspirationWindows,
+        TestPVNodePruning,
         TestTimeManagement,
         
         # Evaluation tests
@@ -54,6 +69,9 @@ def run_test_suite(verbosity=2):
         TestTacticalMotifs,
         TestEndgameKnowledge,
         TestAvoidBlunders,
+        TestDrawDetection,
+        TestMultiPV,
+        TestStaticExchange,
         
         # Opening book tests
         TestOpeningBook,
@@ -63,6 +81,9 @@ def run_test_suite(verbosity=2):
         TestPGNSaveLoad,
         TestFENSaveLoad,
         TestPGNGameResults,
+        
+        # UCI protocol tests
+        TestUCIGo,
     ]
     
     for test_class in test_classes:
@@ -81,7 +102,7 @@ def run_specific_category(category, verbosity=2):
     Run tests from a specific category.
     
     Args:
-        category: One of 'moves', 'eval', 'tactics', 'book', 'pgn'
+        category: One of 'moves', 'parallel', 'search', 'time', 'eval', 'tactics', 'book', 'pgn', 'uci'
         verbosity: Level of output detail
     """
     loader = unittest.TestLoader()
@@ -89,13 +110,16 @@ def run_specific_category(category, verbosity=2):
     
     category_map = {
         'moves': [TestMoveGeneration, TestPerftPositions],
-        'parallel': [TestParallelSearch],
+        'parallel': [TestParallelSearch, TestBackgroundSearch, TestNodeLimit, TestSearchStats],
+        'search': [TestParallelWorkSharing, TestLateMoveReductions, TestInternalIterativeReduction, TestQuiescenceTransposition, TestMoveOrdering, TestHistoryGravity, TestRootMoveOrdering, TestAspirationWindows, TestPVNodePruning],
         'time': [TestTimeManagement],
         'eval': [TestEvaluation, TestPieceValues],
         'tactics': [TestMateInOne, TestMateInTwo, TestTacticalMotifs,
-                   TestEndgameKnowledge, TestAvoidBlunders],
+                   TestEndgameKnowledge, TestAvoidBlunders, TestDrawDetection, TestMultiPV,
+                   TestStaticExchange],
         'book': [TestOpeningBook, TestOpeningBookManipulation],
         'pgn': [TestPGNSaveLoad, TestFENSaveLoad, TestPGNGameResults],
+        'uci': [TestUCIGo],
     }
     
     if category not in category_map:
@@ -119,7 +143,7 @@ def main():
     
     parser = argparse.ArgumentParser(description='Run Mergen chess engine tests')
     parser.add_argument('category', nargs='?', default='all',
-                       help='Test category to run (all, moves, parallel, time, eval, tactics, book, pgn)')
+                       help='Test category to run (all, moves, parallel, search, time, eval, tactics, book, pgn, uci)')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Verbose output')
     parser.add_argument('-q', '--quiet', action='store_true',
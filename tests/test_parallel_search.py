@@ -3,12 +3,27 @@ Sanity tests for parallel (multi-threaded) search paths.
 These catch regressions where the parallel code returns illegal moves or crashes.
 """
 
+import time
 import unittest
 import chess
 
 from Interface import (
     find_best_move_parallel_from_c,
     find_best_move_parallel_timed_from_c,
+    set_thread_count,
+    set_parallel_mode,
+    start_search_from_c,
+    stop_search_from_c,
+    ponderhit_from_c,
+    is_searching_from_c,
+    wait_search_from_c,
+    get_last_search_info_from_c,
+    get_last_search_nodes_from_c,
+    find_best_move_nodes_from_c,
+    get_best_move_from_c,
+    get_search_stats_from_c,
+    get_cpu_cores,
+    set_hash_size,
 )
 
 
@@ -31,6 +46,159 @@ class TestParallelSearch(unittest.TestCase):
         self.assertIn(move, board.legal_moves, "Parallel timed move should be legal")
         self.assertGreaterEqual(depth_reached, 1, "Timed search should report a reached depth")
 
+    def test_thread_pool_reused_across_searches(self):
+        board = chess.Board("r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R b KQkq - 3 3")
+        set_thread_count(2)
+        for threads in (2, 2, 1, 2):
+            move_uci = find_best_move_parallel_from_c(board.fen(), depth=3, num_threads=threads)
+            move = chess.Move.from_uci(move_uci)
+            self.assertIn(move, board.legal_moves, "Pooled workers should keep returning legal moves")
+
+    def test_ybw_mode_is_legal(self):
+        board = chess.Board("rnbqkb1r/pppppppp/5n2/8/3P4/8/PPP1PPPP/RNBQKBNR w KQkq - 1 2")
+        set_parallel_mode("YBW")
+        try:
+            move_uci = find_best_move_parallel_from_c(board.fen(), depth=4, num_threads=2)
+        finally:
+            set_parallel_mode("LazySMP")
+        move = chess.Move.from_uci(move_uci)
+        self.assertIn(move, board.legal_moves, "YBW split-point search should return a legal move")
+
+    def test_unknown_parallel_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            set_parallel_mode("Bogus")
+
+
+
+class TestBackgroundSearch(unittest.TestCase):
+    """Check the asynchronous search used by the UCI loop (go / stop)."""
+
+    FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 b - - 0 8"
+
+    def test_stop_ends_infinite_search_quickly(self):
+        board = chess.Board(self.FEN)
+        start_search_from_c(self.FEN, depth=0, max_time_ms=0, num_threads=2)
+        time.sleep(0.3)
+        self.assertTrue(is_searching_from_c(), "An unlimited search should still be running")
+
+        stopped_at = time.time()
+        stop_search_from_c()
+        move_uci = wait_search_from_c()
+        self.assertLess(time.time() - stopped_at, 0.2, "stop should end the search within milliseconds")
+        self.assertFalse(is_searching_from_c())
+        self.assertIn(chess.Move.from_uci(move_uci), board.legal_moves)
+
+    def test_depth_limited_search_finishes_on_its_own(self):
+        board = chess.Board(self.FEN)
+        start_search_from_c(self.FEN, depth=2)
+        move_uci = wait_search_from_c()
+        self.assertFalse(is_searching_from_c())
+        self.assertIn(chess.Move.from_uci(move_uci), board.legal_moves)
+
+        depth, _, pv = get_last_search_info_from_c()
+        self.assertEqual(depth, 2)
+        self.assertEqual(pv[0], move_uci, "The reported line should start with the best move")
+
+    def test_ponderhit_turns_ponder_search_into_timed_search(self):
+        board = chess.Board(self.FEN)
+        start_search_from_c(self.FEN, depth=0, max_time_ms=0)
+        time.sleep(0.3)
+        self.assertTrue(is_searching_from_c(), "A ponder search has no clock until ponderhit")
+
+        hit_at = time.time()
+        ponderhit_from_c(300)
+        move_uci = wait_search_from_c()
+        self.assertLess(time.time() - hit_at, 1.0, "After ponderhit the search should keep to its time")
+        self.assertIn(chess.Move.from_uci(move_uci), board.legal_moves)
+
+        # The limit belonged to that search only: the next unlimited search runs until stopped
+        start_search_from_c(self.FEN, depth=0, max_time_ms=0)
+        time.sleep(0.5)
+        self.assertTrue(is_searching_from_c())
+        stop_search_from_c()
+        wait_search_from_c()
+
+
+
+class TestNodeLimit(unittest.TestCase):
+    """Check node accounting and node-limited searches (go nodes)."""
+
+    FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 b - - 0 8"
+
+    def test_fixed_depth_search_counts_nodes(self):
+        # Start from an empty TT: earlier searches of this position would cut the tree short
+        set_hash_size(64)
+        get_best_move_from_c(self.FEN, depth=2)
+        nodes, time_ms, nps = get_last_search_nodes_from_c()
+        # A depth-2 search visits more than the 40-odd root moves (the old counter)
+        self.assertGreater(nodes, 100)
+        self.assertGreater(time_ms, 0.0)
+        self.assertGreater(nps, 0)
+
+    def test_single_thread_node_limit_is_exact(self):
+        board = chess.Board(self.FEN)
+        move_uci, depth, nodes = find_best_move_nodes_from_c(self.FEN, 5000)
+        self.assertIn(chess.Move.from_uci(move_uci), board.legal_moves)
+        self.assertGreaterEqual(depth, 1)
+        # Stops at the limit; only the nodes already entered while unwinding come on top
+        self.assertGreaterEqual(nodes, 5000)
+        self.assertLess(nodes, 5100)
+        self.assertEqual(get_last_search_nodes_from_c()[0], nodes)
+
+    def test_parallel_node_limit_counts_all_threads(self):
+        board = chess.Board(self.FEN)
+        move_uci, _, nodes = find_best_move_nodes_from_c(self.FEN, 8000, num_threads=2)
+        self.assertIn(chess.Move.from_uci(move_uci), board.legal_moves)
+        self.assertGreaterEqual(nodes, 8000)
+        self.assertLess(nodes, 8000 + 2 * 1024 + 200, "The limit is checked every 1024 main-thread nodes")
+
+    def test_background_search_node_limit(self):
+        start_search_from_c(self.FEN, max_nodes=3000)
+        wait_search_from_c()
+        nodes, _, _ = get_last_search_nodes_from_c()
+        self.assertGreaterEqual(nodes, 3000)
+        self.assertLess(nodes, 3100)
+
+
+
+class TestSearchStats(unittest.TestCase):
+    """Check the per-search statistics exposed through ctypes."""
+
+    FEN = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 b - - 0 8"
+
+    def test_counters_are_consistent(self):
+        # Start from an empty TT: after a deeper search every child would be a TT cutoff
+        set_hash_size(64)
+        get_best_move_from_c(self.FEN, depth=4)
+        stats = get_search_stats_from_c()
+        self.assertEqual(stats.threads, 1)
+        self.assertEqual(stats.nodes, get_last_search_nodes_from_c()[0])
+        self.assertLessEqual(stats.qnodes, stats.nodes)
+        self.assertLessEqual(stats.tt_hits, stats.tt_probes)
+        self.assertLessEqual(stats.tt_cutoffs, stats.tt_hits)
+        self.assertLessEqual(stats.null_move_cutoffs, stats.null_move_tries)
+        self.assertLessEqual(stats.lmr_researches, stats.lmr_reductions)
+        self.assertLessEqual(stats.first_move_cutoffs, stats.beta_cutoffs)
+        self.assertGreater(stats.beta_cutoffs, 0)
+        self.assertTrue(0.0 < stats.first_move_cutoff_rate <= 1.0)
+
+    def test_iterations_add_up(self):
+        get_best_move_from_c(self.FEN, depth=4)
+        stats = get_search_stats_from_c()
+        self.assertEqual(stats.iterations, 4)
+        per_iteration = [stats.iteration_nodes[d] for d in range(1, 5)]
+        self.assertTrue(all(nodes > 0 for nodes in per_iteration))
+        self.assertLessEqual(sum(per_iteration), stats.nodes)
+        self.assertLessEqual(sum(stats.iteration_time_ms[d] for d in range(1, 5)), stats.time_ms)
+        self.assertAlmostEqual(stats.branching_factor[4], per_iteration[3] / per_iteration[2])
+
+    def test_parallel_search_sums_threads(self):
+        find_best_move_nodes_from_c(self.FEN, 6000, num_threads=2)
+        stats = get_search_stats_from_c()
+        self.assertEqual(stats.threads, min(2, get_cpu_cores()), "Threads are capped at the core count")
+        self.assertEqual(stats.nodes, get_last_search_nodes_from_c()[0])
+        self.assertLessEqual(stats.qnodes, stats.nodes)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,269 @@
+"""
+Behavioural tests for the search features (pruning, reductions, ordering,
+aspiration windows, parallel work sharing).
+Each feature is checked through the per-search counters of get_search_stats_from_c(),
+so a change that silently switches one off shows up here.
+"""
+
+import unittest
+
+import chess
+
+from Interface import (
+    get_best_move_from_c,
+    find_best_move_parallel_timed_from_c,
+    get_search_stats_from_c,
+    get_last_search_info_from_c,
+    search_window_from_c,
+    set_hash_size,
+    get_cpu_cores,
+    get_history_from_c,
+    get_move_order_from_c,
+    HISTORY_MAX,
+    MATE_BOUND,
+)
+
+
+# Quiet middlegame (Italian Game, both sides castled): no forced lines, many quiet moves
+MIDDLEGAME = "r2q1rk1/ppp2ppp/2np1n2/2b1p1B1/2B1P1b1/2NP1N2/PPP2PPP/R2Q1RK1 b - - 0 8"
+STARTPOS = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+# Symmetrical rook-and-knight middlegame: quiet and cheap enough for depth 6
+ROOK_MIDDLEGAME = "r4rk1/pp3ppp/2n5/3p4/3P4/2N5/PP3PPP/R4RK1 w - - 0 15"
+# One clearly winning capture each, for white and (mirrored) for black
+HANGING_KNIGHT = ("6k1/pp3ppp/8/3n4/8/2N5/PP3PPP/6K1 w - - 0 1", "c3d5")
+HANGING_KNIGHT_BLACK = ("6k1/pp3ppp/2n5/8/3N4/8/PP3PPP/6K1 b - - 0 1", "c6d4")
+# Mate in two (1.Ra6 bxa6 2.b7#); in the mirrored one the mate falls outside the aspiration window
+MATE_IN_TWO = "kbK5/pp6/1P6/8/8/8/8/R7 w - - 0 1"
+MATE_IN_TWO_BLACK = ("r7/8/8/8/8/1p6/PP6/KBk5 b - - 0 1", "a8a3")
+# Far ahead (white a queen up) and far behind (black a queen and rook up, white can only
+# take a pawn): static-eval pruning material at depth 2
+QUEEN_UP = "4k3/8/8/8/8/8/4PPPP/3QK3 w - - 0 1"
+QUEEN_DOWN = "r2qk3/8/8/8/8/8/p7/R3K3 w - - 0 1"
+# Equal material, a black rook hanging: ProbCut's capture
+HANGING_ROOK = "6k1/5ppp/8/8/3r4/8/5PPP/3R2K1 w - - 0 1"
+# A pawn can take a rook, the queen a knight: MVV-LVA puts the bigger victim first
+ROOK_OR_KNIGHT = "7k/8/8/3n4/8/2r5/1P6/3Q3K w - - 0 1"
+# exd6 en passant is the only capture
+EN_PASSANT = "4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1"
+SQUARES = [file + rank for file in "abcdefgh" for rank in "12345678"]
+
+
+def search_stats(fen, depth):
+    """Run a fixed-depth search from an empty TT and return its statistics."""
+    set_hash_size(64)
+    get_best_move_from_c(fen, depth)
+    return get_search_stats_from_c()
+
+
+class TestParallelWorkSharing(unittest.TestCase):
+    """ABDADA: Lazy SMP threads defer children another thread is already searching."""
+
+    def test_single_thread_defers_nothing(self):
+        get_best_move_from_c(MIDDLEGAME, depth=4)
+        self.assertEqual(get_search_stats_from_c().deferred_moves, 0,
+                         "The currently-searching table is only used with several threads")
+
+    def test_helpers_defer_shared_children(self):
+        if get_cpu_cores() < 2:
+            self.skipTest("needs two cores: threads are capped at the core count")
+        set_hash_size(64)
+        find_best_move_parallel_timed_from_c(STARTPOS, 2000, 2)
+        stats = get_search_stats_from_c()
+        self.assertEqual(stats.threads, 2)
+        self.assertGreater(stats.deferred_moves, 0, "Helpers searching the same tree should meet")
+
+
+class TestLateMoveReductions(unittest.TestCase):
+    """LMR: late quiet moves are searched at reduced depth and rarely need a re-search."""
+
+    def test_late_moves_are_reduced(self):
+        stats = search_stats(ROOK_MIDDLEGAME, 6)
+        self.assertGreater(stats.lmr_reductions, 0)
+        # A reduced move that beats alpha is re-searched; that should be the exception
+        self.assertLess(stats.lmr_researches * 4, stats.lmr_reductions)
+
+    def test_reductions_grow_with_depth(self):
+        shallow = search_stats(ROOK_MIDDLEGAME, 4)
+        deep = search_stats(ROOK_MIDDLEGAME, 6)
+        self.assertGreater(deep.lmr_reductions, shallow.lmr_reductions)
+
+
+class TestInternalIterativeReduction(unittest.TestCase):
+    """IIR: nodes without a hash move are searched a ply shallower."""
+
+    def test_cold_table_reduces(self):
+        stats = search_stats(ROOK_MIDDLEGAME, 5)
+        self.assertGreater(stats.iir_reductions, 0, "An empty TT has no hash moves")
+
+    def test_shallow_nodes_are_not_reduced(self):
+        stats = search_stats(ROOK_MIDDLEGAME, 3)
+        self.assertEqual(stats.iir_reductions, 0, "IIR starts at depth 4")
+
+    def test_only_pv_and_cut_nodes_reduce(self):
+        # At depth 4 only the node itself is deep enough; an all node searches every move anyway
+        for pv_node, cut_node, reductions in ((True, False, 1), (False, True, 1), (False, False, 0)):
+            set_hash_size(64)
+            search_window_from_c(ROOK_MIDDLEGAME, 4, -1.0, 1.0, pv_node=pv_node, cut_node=cut_node)
+            self.assertEqual(get_search_stats_from_c().iir_reductions, reductions)
+
+    def test_warm_table_reduces_less(self):
+        cold = search_stats(ROOK_MIDDLEGAME, 5)
+        # Same search again: the TT now holds the moves the first one stored
+        get_best_move_from_c(ROOK_MIDDLEGAME, 5)
+        warm = get_search_stats_from_c()
+        self.assertLessEqual(warm.iir_reductions, cold.iir_reductions)
+        self.assertLess(warm.nodes, cold.nodes)
+
+
+class TestQuiescenceTransposition(unittest.TestCase):
+    """Quiescence search probes the TT and stores its results."""
+
+    def test_capture_sequences_transpose(self):
+        stats = search_stats(ROOK_MIDDLEGAME, 5)
+        self.assertGreater(stats.qs_tt_cutoffs, 0, "Captures in a different order reach the same node")
+        self.assertLessEqual(stats.qs_tt_cutoffs, stats.tt_cutoffs)
+
+    def test_repeat_search_reuses_quiescence_results(self):
+        cold = search_stats(ROOK_MIDDLEGAME, 5)
+        get_best_move_from_c(ROOK_MIDDLEGAME, 5)
+        warm = get_search_stats_from_c()
+        self.assertLess(warm.qnodes, cold.qnodes)
+
+
+class TestMoveOrdering(unittest.TestCase):
+    """Moves are scored once and picked best-first, so cut nodes usually cut on the first move."""
+
+    def test_first_move_cutoff_rate(self):
+        for depth in (4, 5):
+            stats = search_stats(STARTPOS, depth)
+            self.assertGreater(stats.first_move_cutoff_rate, 0.8, f"Poor ordering at depth {depth}")
+
+    def test_quiet_middlegame_prunes_late_moves(self):
+        stats = search_stats(ROOK_MIDDLEGAME, 5)
+        self.assertGreater(stats.futility_prunes, 0)
+        self.assertGreater(stats.lmp_prunes, 0)
+
+    def test_most_valuable_victim_first(self):
+        self.assertEqual(get_move_order_from_c(ROOK_OR_KNIGHT)[:2], ["b2c3", "d1d5"])
+
+    def test_killer_with_saturated_history_after_captures(self):
+        order = get_move_order_from_c(HANGING_ROOK, killer="f2f3")
+        self.assertEqual(order[:2], ["d1d4", "f2f3"])
+
+    def test_en_passant_is_a_capture(self):
+        order = get_move_order_from_c(EN_PASSANT, killer="e1f1")
+        self.assertEqual(order[:2], ["e5d6", "e1f1"])
+
+
+class TestHistoryGravity(unittest.TestCase):
+    """History rewards cutoff moves, penalises the quiets tried before them, and saturates."""
+
+    def history_scores(self):
+        return [get_history_from_c(a + b) for a in SQUARES for b in SQUARES]
+
+    def test_bonus_and_malus(self):
+        search_stats(ROOK_MIDDLEGAME, 5)
+        scores = self.history_scores()
+        self.assertTrue(any(score > 0 for score in scores), "Cutoff moves get a bonus")
+        self.assertTrue(any(score < 0 for score in scores), "Failed quiet moves get a malus")
+
+    def test_scores_stay_within_bound(self):
+        # The tables carry over between searches: repeated bonuses approach the bound
+        for _ in range(4):
+            search_stats(ROOK_MIDDLEGAME, 6)
+            scores = self.history_scores()
+            self.assertLessEqual(max(scores), HISTORY_MAX)
+            self.assertGreaterEqual(min(scores), -HISTORY_MAX)
+
+
+class TestRootMoveOrdering(unittest.TestCase):
+    """Root moves are re-sorted by score each iteration, so the best one stays in front."""
+
+    def test_best_move_leads_every_iteration(self):
+        for fen, capture in (HANGING_KNIGHT, HANGING_KNIGHT_BLACK):
+            set_hash_size(64)
+            self.assertEqual(get_best_move_from_c(fen, 6), capture)
+            # No later root move ever beat the zero window around the first one
+            self.assertEqual(get_search_stats_from_c().root_researches, 0,
+                             f"The winning capture fell behind in {fen}")
+
+
+def mirror_move(move):
+    """The UCI move in the colour-flipped position (see chess.Board.mirror)."""
+    return move[0] + str(9 - int(move[1])) + move[2] + str(9 - int(move[3])) + move[4:]
+
+
+class TestAspirationWindows(unittest.TestCase):
+    """The driver widens a failed aspiration window and searches again, and its
+    white-relative bounds work for both colours."""
+
+    def test_failed_window_is_researched(self):
+        fen, mate = MATE_IN_TWO_BLACK
+        set_hash_size(64)
+        self.assertEqual(get_best_move_from_c(fen, 5), mate)
+        self.assertGreater(get_search_stats_from_c().aspiration_researches, 0)
+        _, score, _ = get_last_search_info_from_c()
+        self.assertLessEqual(score, -MATE_BOUND, "The re-search must keep the mate score")
+
+    def test_stable_score_keeps_window(self):
+        fen, capture = HANGING_KNIGHT
+        set_hash_size(64)
+        self.assertEqual(get_best_move_from_c(fen, 6), capture)
+        self.assertEqual(get_search_stats_from_c().aspiration_researches, 0)
+
+    def test_mirrored_position_negates_score(self):
+        # A sign error in the white-relative windows shows up for one colour only
+        for fen, depth, tolerance in ((HANGING_KNIGHT[0], 4, 0.5), (MATE_IN_TWO, 5, 0.0)):
+            set_hash_size(64)
+            move = get_best_move_from_c(fen, depth)
+            _, score, _ = get_last_search_info_from_c()
+
+            mirrored = chess.Board(fen).mirror().fen()
+            set_hash_size(64)
+            self.assertEqual(get_best_move_from_c(mirrored, depth), mirror_move(move))
+            _, mirrored_score, _ = get_last_search_info_from_c()
+            self.assertAlmostEqual(mirrored_score, -score, delta=tolerance)
+
+
+class TestPVNodePruning(unittest.TestCase):
+    """PV nodes are never pruned on the static eval, however narrow their window."""
+
+    def search_node(self, fen, alpha, beta, pv_node):
+        set_hash_size(64)
+        search_window_from_c(fen, 2, alpha, beta, pv_node)
+        return get_search_stats_from_c()
+
+    def test_reverse_futility_pruning(self):
+        # Half a pawn wide, far below the static eval
+        self.assertEqual(self.search_node(QUEEN_UP, 0.0, 0.5, False).nodes, 1, "Non-PV node is cut at once")
+        self.assertGreater(self.search_node(QUEEN_UP, 0.0, 0.5, True).nodes, 1, "PV node searches its moves")
+
+    def test_razoring(self):
+        stats = self.search_node(QUEEN_DOWN, -0.5, 0.0, False)
+        self.assertGreater(stats.qnodes, 0, "Non-PV node drops into quiescence")
+        self.assertEqual(stats.nodes - stats.qnodes, 1)
+        stats = self.search_node(QUEEN_DOWN, -0.5, 0.0, True)
+        self.assertGreater(stats.nodes - stats.qnodes, 1, "PV node searches its moves")
+
+    def test_late_move_pruning(self):
+        # Depth 1: the children are quiescence nodes, so only this node can prune. The window
+        # lies above the score (every move fails low) but within the futility margin.
+        set_hash_size(64)
+        search_window_from_c(STARTPOS, 1, 0.5, 1.0, False)
+        self.assertGreater(get_search_stats_from_c().lmp_prunes, 0)
+        set_hash_size(64)
+        search_window_from_c(STARTPOS, 1, 0.5, 1.0, True)
+        self.assertEqual(get_search_stats_from_c().lmp_prunes, 0, "PV node searches every move")
+
+    def test_probcut(self):
+        # Depth 6 (5 after IIR): too shallow for ProbCut anywhere but this node
+        set_hash_size(64)
+        search_window_from_c(HANGING_ROOK, 6, 0.0, 0.5, False)
+        self.assertGreater(get_search_stats_from_c().probcut_tries, 0)
+        set_hash_size(64)
+        search_window_from_c(HANGING_ROOK, 6, 0.0, 0.5, True)
+        self.assertEqual(get_search_stats_from_c().probcut_tries, 0, "PV node is searched in full")
+
+
+if __name__ == "__main__":
+    unittest.main()
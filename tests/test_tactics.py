@@ -6,7 +6,9 @@ Tests engine's ability to find forced wins and tactical shots.
 
 import unittest
 import chess
-from Interface import get_best_move_from_c
+from Interface import (get_best_move_from_c, get_search_info_from_c, set_game_history,
+                       set_multi_pv, get_search_lines_from_c, get_see_from_c, get_search_stats_from_c,
+                       MATE_SCORE, MATE_BOUND)
 
 
 class TestMateInOne(unittest.TestCase):
@@ -73,6 +75,45 @@ class TestMateInTwo(unittest.TestCase):
         
         best_move = get_best_move_from_c(board.fen(), depth=4)
         self.assertIsNotNone(best_move, "Should find Arabian mate sequence")
+    
+    def test_mate_score_counts_plies(self):
+        """Mate scores should encode the distance to mate (9000 - plies)."""
+        _, score, best_move, *_ = get_search_info_from_c("kbK5/pp6/1P6/8/8/8/8/R7 w - - 0 1", depth=4).split()
+        self.assertEqual(best_move, "a1a6", "Ra6 forces mate next move")
+        self.assertEqual(float(score), 9000 - 3, "Mate in 2 is three plies from the root")
+        
+        _, score, *_ = get_search_info_from_c("k7/8/K1Q5/8/8/8/8/8 w - - 0 1", depth=4).split()
+        self.assertEqual(float(score), 9000 - 1, "Mate in 1 should be scored one ply from the root")
+    
+    def test_mate_bound_matches_engine(self):
+        """Python reads the mate constants from the engine, so mate detection follows MAX_PLY."""
+        self.assertEqual(MATE_SCORE, 9000.0)
+        self.assertLess(MATE_BOUND, MATE_SCORE, "Mates up to MAX_PLY plies away lie above the bound")
+        _, score, *_ = get_search_info_from_c("kbK5/pp6/1P6/8/8/8/8/R7 w - - 0 1", depth=4).split()
+        self.assertGreaterEqual(float(score), MATE_BOUND, "A found mate scores beyond the bound")
+    
+    def test_principal_variation_reaches_mate(self):
+        """The reported PV should be the whole mating line, not just the first move."""
+        board = chess.Board("kbK5/pp6/1P6/8/8/8/8/R7 w - - 0 1")
+        _, _, *pv = get_search_info_from_c(board.fen(), depth=4).split()
+        self.assertEqual(len(pv), 3, "Mate in 2 is a three-ply line")
+        for move in pv:
+            board.push_uci(move)
+        self.assertTrue(board.is_checkmate(), "The PV should end in mate")
+    
+    def test_principal_variation_spans_depth(self):
+        """PV nodes are not pruned on the static eval, so the PV reaches the full depth."""
+        fens = ["r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4",
+                "6k1/5ppp/8/8/3r4/8/5PPP/3R2K1 w - - 0 1",
+                "4k3/8/3n4/8/8/8/4P3/R3K3 w - - 0 1"]
+        for fen in fens:
+            for depth in (3, 4, 5):
+                board = chess.Board(fen)
+                _, _, *pv = get_search_info_from_c(fen, depth=depth).split()
+                self.assertEqual(len(pv), depth, f"PV cut short at depth {depth} in {fen}")
+                for move in pv:
+                    self.assertIn(chess.Move.from_uci(move), board.legal_moves)
+                    board.push_uci(move)
 
 
 class TestTacticalMotifs(unittest.TestCase):
@@ -177,6 +218,117 @@ class TestAvoidBlunders(unittest.TestCase):
         self.assertFalse(board.is_checkmate(), 
                         "Should defend against back rank mate")
 
+    def test_stop_promotion_at_depth_one(self):
+        """Test that quiescence sees a quiet promotion after the last full-width ply."""
+        # Black's c-pawn queens next move unless the rook covers c1 or gives check
+        board = chess.Board("K7/8/6k1/8/7R/8/2p5/8 w - - 0 1")
+
+        best_move = get_best_move_from_c(board.fen(), depth=1)
+        board.push(chess.Move.from_uci(best_move))
+
+        self.assertTrue(board.is_check() or board.is_attacked_by(chess.WHITE, chess.C1),
+                        f"{best_move} lets the pawn promote")
+
+
+
+class TestDrawDetection(unittest.TestCase):
+    """Test that the search scores drawn positions as draws."""
+    
+    def test_repetition_saves_lost_position(self):
+        """Losing side should steer into a position already seen in the game."""
+        board = chess.Board("6k1/8/8/8/8/8/q7/6K1 w - - 0 1")
+        for move in ["g1f1", "g8h8", "f1g1", "h8g8"]:
+            board.push_uci(move)
+        set_game_history(board.root().fen(), [m.uci() for m in board.move_stack])
+        
+        _, score, best_move, *_ = get_search_info_from_c(board.fen(), depth=3).split()
+        self.assertEqual(best_move, "g1f1", "Kf1 repeats the position and should be chosen")
+        self.assertEqual(float(score), 0.0, "Repetition should score as a draw")
+    
+    def test_fifty_move_rule(self):
+        """A rook up is still a draw once the fifty-move rule applies."""
+        info = get_search_info_from_c("8/8/4k3/8/8/4K3/8/R7 w - - 99 80", depth=3)
+        self.assertEqual(float(info.split()[1]), 0.0, "Every quiet move hits the fifty-move rule")
+    
+    def test_insufficient_material(self):
+        """King and bishop versus king cannot be won."""
+        info = get_search_info_from_c("8/8/4k3/8/8/3BK3/8/8 w - - 0 1", depth=3)
+        self.assertEqual(float(info.split()[1]), 0.0, "K+B vs K should score as a draw")
+
+
+
+class TestMultiPV(unittest.TestCase):
+    """Test reporting several principal variations from one search."""
+    
+    def tearDown(self):
+        set_multi_pv(1)
+    
+    def test_lines_are_distinct_and_ordered(self):
+        """Each line starts with a different move, best line first."""
+        set_multi_pv(3)
+        get_search_info_from_c("r1bqkb1r/pppp1ppp/2n2n2/4p3/2B1P3/5N2/PPPP1PPP/RNBQK2R w KQkq - 4 4", depth=3)
+        lines = get_search_lines_from_c()
+        
+        self.assertEqual(len(lines), 3, "MultiPV 3 should report three lines")
+        first_moves = [pv[0] for _, _, pv in lines]
+        self.assertEqual(len(set(first_moves)), 3, "Lines should start with different moves")
+        scores = [score for _, score, _ in lines]
+        self.assertEqual(scores, sorted(scores, reverse=True), "White's best line should come first")
+    
+    def test_mate_line_comes_first(self):
+        """The forced mate leads; the other lines are ordinary scores."""
+        set_multi_pv(2)
+        _, score, best_move, *_ = get_search_info_from_c("kbK5/pp6/1P6/8/8/8/8/R7 w - - 0 1", depth=4).split()
+        lines = get_search_lines_from_c()
+        
+        self.assertEqual(best_move, "a1a6", "Ra6 forces mate next move")
+        self.assertEqual(float(score), 9000 - 3, "Best line keeps its mate score")
+        self.assertEqual(len(lines), 2, "MultiPV 2 should report two lines")
+        self.assertLess(lines[1][1], 9000 - 3, "Only Ra6 mates in two")
+
+
+
+class TestStaticExchange(unittest.TestCase):
+    """Test static exchange evaluation and the ProbCut gate built on it."""
+    
+    def test_pawn_takes_defended_knight(self):
+        """PxN, recaptured by a pawn, still wins two pawns."""
+        self.assertEqual(get_see_from_c("4k3/8/2p5/3n4/4P3/8/8/4K3 w - - 0 1", "e4d5"), 2.0)
+    
+    def test_queen_takes_defended_pawn(self):
+        """QxP loses the queen for a pawn when a pawn recaptures."""
+        self.assertEqual(get_see_from_c("4k3/8/4p3/3p4/8/8/8/3QK3 w - - 0 1", "d1d5"), -8.0)
+    
+    def test_xray_rook_battery(self):
+        """The rook behind the first attacker joins the exchange."""
+        # Rd2xd5 Rxd5 Rd1xd5: the doubled rooks win the pawn
+        self.assertEqual(get_see_from_c("3r2k1/8/8/3p4/8/8/3R4/3RK3 w - - 0 1", "d2d5"), 1.0)
+        # Against doubled rooks too, the exchange costs a rook for a pawn
+        self.assertEqual(get_see_from_c("3r2k1/3r4/8/3p4/8/8/3R4/3RK3 w - - 0 1", "d2d5"), -4.0)
+    
+    def test_en_passant(self):
+        """En passant takes the pawn beside the destination square."""
+        self.assertEqual(get_see_from_c("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", "e5d6"), 1.0)
+        self.assertEqual(get_see_from_c("4k3/2p5/8/3pP3/8/8/8/4K3 w - d6 0 1", "e5d6"), 0.0)
+    
+    def test_capture_promotion(self):
+        """bxa8=Q wins rook and promotion; the king's recapture takes back the queen."""
+        self.assertEqual(get_see_from_c("rk6/1P6/8/8/8/8/8/4K3 w - - 0 1", "b7a8q"), 4.0)
+    
+    def test_king_recaptures_only_undefended(self):
+        """The king takes back on f7 unless the bishop covers the square."""
+        self.assertEqual(get_see_from_c("4k3/5p2/8/6N1/8/8/8/4K3 w - - 0 1", "g5f7"), -2.0)
+        self.assertEqual(get_see_from_c("4k3/5p2/8/6N1/2B5/8/8/4K3 w - - 0 1", "g5f7"), 1.0)
+    
+    def test_probcut_keeps_winning_capture(self):
+        """ProbCut fires on the hanging rook and the capture is still played."""
+        best_move = get_best_move_from_c("6k1/5ppp/8/8/3r4/8/5PPP/3R2K1 w - - 0 1", depth=7)
+        stats = get_search_stats_from_c()
+        
+        self.assertEqual(best_move, "d1d4", "Rxd4 wins a rook")
+        self.assertGreater(stats.probcut_cutoffs, 0, "Deep non-PV nodes should be cut by ProbCut")
+        self.assertLessEqual(stats.probcut_cutoffs, stats.probcut_tries)
+
 
 if __name__ == '__main__':
     unittest.main()
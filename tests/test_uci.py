@@ -0,0 +1,30 @@
+"""
+Tests for the UCI front end (uci.py), driven command by command with the
+engine's output captured instead of printed.
+"""
+
+import time
+import unittest
+
+from uci import UCIEngine
+
+
+class TestUCIGo(unittest.TestCase):
+    """go infinite sends bestmove only after stop."""
+
+    def setUp(self):
+        self.engine = UCIEngine()
+        self.output = []
+        self.engine.send = self.output.append
+
+    def bestmoves(self):
+        return [line for line in self.output if line.startswith("bestmove")]
+
+    def test_infinite_waits_for_stop(self):
+        # Even from a book position: the book move would end the search without a stop
+        self.engine.position_command(["startpos"])
+        self.engine.go_command(["infinite"])
+        time.sleep(0.5)
+        self.assertEqual(self.bestmoves(), [])
+        self.engine.stop_command()
+        self.assertEqual(len(self.bestmoves()), 1)
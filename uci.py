@@ -14,15 +14,25 @@ UCI Protocol Documentation: http://wbec-ridderkerk.nl/html/UCIProtocol.html
 """
 
 import sys
+import threading
 import chess
 from typing import Optional
 from Interface import (
-    get_best_move_from_c,
-    find_best_move_timed_from_c,
-    find_best_move_parallel_from_c,
-    find_best_move_parallel_timed_from_c,
+    start_search_from_c,
+    stop_search_from_c,
+    ponderhit_from_c,
+    wait_search_from_c,
     get_cpu_cores,
     set_hash_size,
+    set_thread_count,
+    set_parallel_mode,
+    set_game_history,
+    set_multi_pv,
+    get_search_lines_from_c,
+    get_last_search_info_from_c,
+    get_last_search_nodes_from_c,
+    MATE_SCORE,
+    MATE_BOUND,
 )
 from Source.OpeningBook import OpeningBook
 
@@ -36,17 +46,31 @@ class UCIEngine:
         self.opening_book = OpeningBook()
         self.debug_mode = False
         self.threads = 1
+        self.multi_pv = 1
+        self.ponder = False  # GUI lets us ponder (it sends "go ponder" only if so)
         self.hash_size = 64  # MB (placeholder, not implemented)
         self.max_cores = get_cpu_cores()
         
+        # Background search: the C search runs on its own thread and this watcher
+        # reports its result, so the input loop can still read "stop"
+        self.search_thread: Optional[threading.Thread] = None
+        self.report_event = threading.Event()  # set once bestmove may be sent
+        self.search_holds = False  # infinite / ponder: bestmove waits for stop or ponderhit
+        
+        # Ponder search ("go ponder"): time it gets once the opponent plays the expected move
+        self.pondering = False
+        self.ponder_time_ms = 0
+        self.output_lock = threading.Lock()
+        
         # Engine info
         self.name = "Mergen"
         self.author = "Haktan Polat"
         self.version = "2.0"
     
     def send(self, message: str):
-        """Send message to GUI."""
-        print(message, flush=True)
+        """Send message to GUI (from the input loop or the search watcher)."""
+        with self.output_lock:
+            print(message, flush=True)
         if self.debug_mode:
             self.log(f">> {message}")
     
@@ -62,6 +86,9 @@ class UCIEngine:
         # Options
         self.send("option name Threads type spin default 1 min 1 max 16")
         self.send("option name Hash type spin default 64 min 1 max 1024")
+        self.send("option name ParallelMode type combo default LazySMP var LazySMP var YBW")
+        self.send("option name MultiPV type spin default 1 min 1 max 16")
+        self.send("option name Ponder type check default false")
         self.send("option name OwnBook type check default true")
         self.send("option name Debug type check default false")
         
@@ -73,6 +100,7 @@ class UCIEngine:
     
     def setoption_command(self, tokens: list):
         """Handle 'setoption' command - set engine options."""
+        self._wait_search()
         if len(tokens) < 4 or tokens[0] != "name":
             return
         
@@ -82,6 +110,7 @@ class UCIEngine:
             if len(tokens) >= 4 and tokens[2] == "value":
                 try:
                     self.threads = max(1, min(16, int(tokens[3])))
+                    set_thread_count(self.threads)
                     if self.debug_mode:
                         self.log(f"Threads set to {self.threads}")
                 except ValueError:
@@ -97,6 +126,29 @@ class UCIEngine:
                 except ValueError:
                     pass
         
+        elif option_name == "parallelmode":
+            if len(tokens) >= 4 and tokens[2] == "value":
+                try:
+                    set_parallel_mode(tokens[3])
+                    if self.debug_mode:
+                        self.log(f"ParallelMode set to {tokens[3]}")
+                except ValueError:
+                    pass
+        
+        elif option_name == "multipv":
+            if len(tokens) >= 4 and tokens[2] == "value":
+                try:
+                    self.multi_pv = max(1, min(16, int(tokens[3])))
+                    set_multi_pv(self.multi_pv)
+                    if self.debug_mode:
+                        self.log(f"MultiPV set to {self.multi_pv}")
+                except ValueError:
+                    pass
+        
+        elif option_name == "ponder":
+            if len(tokens) >= 4 and tokens[2] == "value":
+                self.ponder = tokens[3].lower() == "true"
+        
         elif option_name == "debug":
             if len(tokens) >= 4 and tokens[2] == "value":
                 self.debug_mode = tokens[3].lower() == "true"
@@ -105,12 +157,14 @@ class UCIEngine:
     
     def ucinewgame_command(self):
         """Handle 'ucinewgame' command - start new game."""
+        self._wait_search()
         self.board = chess.Board()
         if self.debug_mode:
             self.log("New game started")
     
     def position_command(self, tokens: list):
         """Handle 'position' command - set board position."""
+        self._wait_search()
         if not tokens:
             return
         
@@ -161,7 +215,9 @@ class UCIEngine:
         winc = 0
         binc = 0
         movestogo = None
+        nodes = None
         infinite = False
+        ponder = False
         
         i = 0
         while i < len(tokens):
@@ -216,15 +272,27 @@ class UCIEngine:
                 except ValueError:
                     i += 1
             
+            elif token == "nodes" and i + 1 < len(tokens):
+                try:
+                    nodes = int(tokens[i + 1])
+                    i += 2
+                except ValueError:
+                    i += 1
+            
             elif token == "infinite":
                 infinite = True
                 i += 1
             
+            elif token == "ponder":
+                ponder = True
+                i += 1
+            
             else:
                 i += 1
         
         # Try opening book first
-        book_move = self.opening_book.get_book_move(self.board)
+        # (not for infinite or ponder searches: bestmove must wait for stop or ponderhit)
+        book_move = None if ponder or infinite else self.opening_book.get_book_move(self.board)
         if book_move:
             if self.debug_mode:
                 self.log(f"Book move: {book_move}")
@@ -232,11 +300,64 @@ class UCIEngine:
             self.send(f"bestmove {book_move}")
             return
         
-        # Search for best move
-        best_move = self._search(depth, movetime, wtime, btime, winc, binc, movestogo, infinite)
+        # Search in the background; bestmove is sent when it finishes or is stopped
+        self._start_search(depth, movetime, wtime, btime, winc, binc, movestogo, infinite, ponder, nodes)
+    
+    def stop_command(self):
+        """Handle 'stop' command - end the search and send the best move found so far."""
+        self._stop_search()
+    
+    def ponderhit_command(self):
+        """Handle 'ponderhit' command - the expected move was played, search on the clock."""
+        if self.search_thread is None or not self.pondering:
+            return
+        self.pondering = False
+        if self.ponder_time_ms > 0:
+            ponderhit_from_c(self.ponder_time_ms)
+        # From here on the search reports as soon as it ends
+        self.report_event.set()
+    
+    def _stop_search(self):
+        """Stop a running search and wait until its bestmove has been sent."""
+        if self.search_thread is None:
+            return
+        stop_search_from_c()
+        self.report_event.set()
+        self.search_thread.join()
+        self.search_thread = None
+        self.pondering = False
+    
+    def _wait_search(self):
+        """Let a running search finish before the next command changes the engine's state.
+        
+        A search that holds its bestmove (infinite, or pondering before ponderhit)
+        would never finish, so it is stopped instead.
+        """
+        if self.search_thread is None:
+            return
+        if self.search_holds and not self.report_event.is_set():
+            self._stop_search()
+            return
+        self.search_thread.join()
+        self.search_thread = None
+    
+    def _finish_search(self, hold: bool):
+        """Watcher thread: wait for the search, then report it."""
+        best_move = wait_search_from_c()
+        
+        # Infinite and ponder searches may only send bestmove after "stop" or
+        # "ponderhit", even if the search itself ended earlier
+        if hold:
+            self.report_event.wait()
         
-        if best_move:
-            self.send(f"bestmove {best_move}")
+        if best_move != "0000":
+            self._send_search_info()
+            # The reply the principal variation expects is what we want to ponder on
+            _, _, pv = get_last_search_info_from_c()
+            if len(pv) >= 2 and pv[0] == best_move:
+                self.send(f"bestmove {best_move} ponder {pv[1]}")
+            else:
+                self.send(f"bestmove {best_move}")
         else:
             # No legal moves or error
             legal_moves = list(self.board.legal_moves)
@@ -245,29 +366,50 @@ class UCIEngine:
             else:
                 self.send("bestmove 0000")
     
-    def _search(self, depth: Optional[int], movetime: Optional[int],
-                wtime: Optional[int], btime: Optional[int],
-                winc: int, binc: int, movestogo: Optional[int],
-                infinite: bool) -> Optional[str]:
-        """Perform search and return best move."""
+    def _send_search_info(self):
+        """Report the depth, score, size and principal variation of each line of the last search."""
+        lines = get_search_lines_from_c()
+        nodes, time_ms, nps = get_last_search_nodes_from_c()
+        stats = f"nodes {nodes} nps {nps} time {int(time_ms)}"
+        for index, (depth, score, pv) in enumerate(lines, start=1):
+            # The engine scores from white's point of view, UCI from the side to move's
+            if self.board.turn == chess.BLACK:
+                score = -score
+            if abs(score) >= MATE_BOUND:
+                plies = int(round(MATE_SCORE - abs(score)))
+                moves = (plies + 1) // 2
+                score_str = f"mate {moves if score > 0 else -moves}"
+            else:
+                score_str = f"cp {int(round(score * 100))}"
+            
+            multipv = f" multipv {index}" if len(lines) > 1 else ""
+            self.send(f"info depth {depth}{multipv} score {score_str} {stats} pv {' '.join(pv)}")
+    
+    def _start_search(self, depth: Optional[int], movetime: Optional[int],
+                      wtime: Optional[int], btime: Optional[int],
+                      winc: int, binc: int, movestogo: Optional[int],
+                      infinite: bool, ponder: bool = False, nodes: Optional[int] = None):
+        """Start a background search and the watcher thread that reports it."""
+        self._wait_search()
         fen = self.board.fen()
         
-        # Determine search parameters
+        # Repetition detection needs the positions that led here
+        set_game_history(self.board.root().fen(), [move.uci() for move in self.board.move_stack])
+        
+        # Determine search limits (0 = none; infinite runs until "stop")
+        search_depth = 0
+        time_to_use = 0
         if infinite:
-            # Infinite analysis - use high depth
-            search_depth = 20
+            search_depth = depth or 0
         elif depth:
             # Fixed depth search
             search_depth = depth
         elif movetime:
             # Fixed time per move
-            if self.threads > 1:
-                best_move, _, _ = find_best_move_parallel_timed_from_c(
-                    fen, movetime, self.threads
-                )
-            else:
-                best_move, _, _ = find_best_move_timed_from_c(fen, movetime)
-            return best_move
+            time_to_use = movetime
+        elif nodes:
+            # Node limit only: same result on any hardware
+            pass
         else:
             # Time control - calculate time to use
             if self.board.turn == chess.WHITE:
@@ -287,31 +429,25 @@ class UCIEngine:
             
             if self.debug_mode:
                 self.log(f"Time to use: {time_to_use:.0f}ms")
-            
-            if self.threads > 1:
-                best_move, search_depth, _ = find_best_move_parallel_timed_from_c(
-                    fen, int(time_to_use), self.threads
-                )
-            else:
-                best_move, search_depth, _ = find_best_move_timed_from_c(fen, int(time_to_use))
-            
-            if self.debug_mode:
-                self.log(f"Searched to depth {search_depth}")
-            
-            return best_move
         
-        # Fixed depth search
-        if self.threads > 1:
-            best_move = find_best_move_parallel_from_c(fen, search_depth, self.threads)
-        else:
-            best_move = get_best_move_from_c(fen, search_depth)
+        # Pondering searches without a clock; the time is only given on ponderhit
+        self.pondering = ponder
+        self.ponder_time_ms = int(time_to_use) if ponder else 0
+        if ponder:
+            time_to_use = 0
         
-        return best_move
+        self.search_holds = infinite or ponder
+        self.report_event.clear()
+        start_search_from_c(fen, search_depth, int(time_to_use), self.threads, max_nodes=nodes or 0)
+        self.search_thread = threading.Thread(target=self._finish_search, args=(self.search_holds,),
+                                              daemon=True)
+        self.search_thread.start()
     
     def quit_command(self):
         """Handle 'quit' command - exit engine."""
         if self.debug_mode:
             self.log("Quitting")
+        self._stop_search()
         sys.exit(0)
     
     def run(self):
@@ -354,8 +490,10 @@ class UCIEngine:
                     self.quit_command()
                 
                 elif command == "stop":
-                    # Currently not supported (would need search interruption)
-                    pass
+                    self.stop_command()
+                
+                elif command == "ponderhit":
+                    self.ponderhit_command()
                 
                 else:
                     if self.debug_mode:
@@ -369,6 +507,9 @@ class UCIEngine:
                 if self.debug_mode:
                     self.log(f"Error: {e}")
                 continue
+        
+        # Input closed: let a running search report its move (an infinite one is stopped)
+        self._wait_search()
 
 
 def main():